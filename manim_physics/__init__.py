@@ -2,10 +2,17 @@ __version__ = "0.2.3"
 
 from manim import *
 
+from .electromagnetism.conductors import *
 from .electromagnetism.electrostatics import *
 from .electromagnetism.magnetostatics import *
+from .electromagnetism.motion import *
+from .electromagnetism.volume import *
+from .gravity import *
 from .optics.lenses import *
 from .optics.rays import *
+from .rigid_mechanics.particles import *
 from .rigid_mechanics.pendulum import *
 from .rigid_mechanics.rigid_mechanics import *
+from .rigid_mechanics.softbody import *
+from .rigid_mechanics.trajectory import *
 from .wave import *
@@ -0,0 +1,286 @@
+"""Conductors module"""
+
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence
+
+from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
+from manim.mobject.types.vectorized_mobject import VMobject
+import numpy as np
+import shapely
+from shapely import geometry as gm
+
+from ..utils import polyline_points
+
+__all__ = ["Conductor", "PotentialGrid"]
+
+
+class Conductor(VMobject, metaclass=ConvertToOpenGL):
+    """A conductor held at a fixed potential, such as an electrode or a
+    capacitor plate, to shape an :class:`~ElectricField`.
+
+    Parameters
+    ----------
+    shape
+        The original ``VMobject``. The resulting conductor takes its form.
+        Closed shapes are filled, open ones are thin plates.
+    potential
+        The electric potential of the conductor.
+    kwargs
+        Additional parameters passed to ``VMobject``.
+
+
+    .. note::
+
+        See :class:`~ElectricField` for examples.
+
+    """
+
+    def __init__(self, shape: VMobject, potential: float = 0, **kwargs):
+        self.potential = potential
+
+        super().__init__(**kwargs)
+        self.set_points(shape.points)
+
+    def get_outlines(self, samples: int = 8) -> list[np.ndarray]:
+        """Returns every subpath as an array of ``samples`` points per curve
+        in the plane."""
+        t = np.linspace(0, 1, samples, endpoint=False)[:, None]
+        weights = np.hstack(
+            [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3]
+        )
+        outlines = []
+        for subpath in self.get_subpaths():
+            curves = subpath[: len(subpath) // 4 * 4, :2].reshape(-1, 4, 2)
+            if len(curves):
+                points = np.einsum("sk,ckd->csd", weights, curves).reshape(-1, 2)
+                outlines.append(np.vstack([points, curves[-1, -1]]))
+        return outlines
+
+
+def _red_black_sor(
+    potential: np.ndarray,
+    fixed: np.ndarray,
+    source: np.ndarray,
+    omega: float,
+    tolerance: float,
+    max_iterations: int,
+) -> int:
+    """Relaxes ``potential`` in place towards a solution of Poisson's
+    equation, updating the cells of a checkerboard pattern in two vectorized
+    half-sweeps per iteration. ``fixed`` marks the cells that keep their
+    value. Returns the number of iterations.
+    """
+    i, j = np.indices(potential.shape)
+    checkerboard = ((i + j) % 2 == 0)[1:-1, 1:-1]
+    free = ~fixed[1:-1, 1:-1]
+    colors = (checkerboard & free, ~checkerboard & free)
+    interior = potential[1:-1, 1:-1]
+    for iteration in range(1, max_iterations + 1):
+        change = 0
+        for color in colors:
+            neighbours = (
+                potential[:-2, 1:-1]
+                + potential[2:, 1:-1]
+                + potential[1:-1, :-2]
+                + potential[1:-1, 2:]
+            )
+            delta = omega * ((neighbours + source) / 4 - interior)[color]
+            interior[color] += delta
+            if len(delta):
+                change = max(change, np.abs(delta).max())
+        if change < tolerance:
+            break
+    return iteration
+
+
+class PotentialGrid:
+    def __init__(
+        self,
+        conductors: Iterable[Conductor] = (),
+        charges: Iterable = (),
+        x_range: Sequence[float] = (-8, 8),
+        y_range: Sequence[float] = (-5, 5),
+        cell_size: float = 0.1,
+        omega: Optional[float] = None,
+        tolerance: float = 1e-4,
+        max_iterations: int = 10000,
+    ) -> None:
+        """The electric potential in a rectangle of the plane, solved on a
+        grid with fixed potentials on conductors and zero potential on the
+        edges of the rectangle.
+
+        The potential is relaxed with red-black successive over-relaxation.
+        Every call to :meth:`solve` starts from the previous solution, so
+        solving again after conductors or charges moved slightly takes only
+        a few iterations. In the plane, :class:`~Charge` objects act as
+        line charges, whose field falls off with the distance rather than
+        its square.
+
+        Parameters
+        ----------
+        conductors
+            The conductors with fixed potentials.
+        charges
+            Free charges, as :class:`~Charge` objects.
+        x_range
+            The horizontal extent of the grid.
+        y_range
+            The vertical extent of the grid.
+        cell_size
+            The distance between neighbouring grid points.
+        omega
+            The over-relaxation factor, between 1 and 2. Defaults to the
+            optimum for the size of the grid.
+        tolerance
+            The largest change of the potential in an iteration at which
+            the solution counts as converged.
+        max_iterations
+            The maximum number of iterations per solve.
+        """
+        self.conductors = list(conductors)
+        self.charges = list(charges)
+        self.cell_size = cell_size
+        self.x = np.arange(x_range[0], x_range[1] + cell_size / 2, cell_size)
+        self.y = np.arange(y_range[0], y_range[1] + cell_size / 2, cell_size)
+        if omega is None:
+            omega = 2 / (1 + np.sin(np.pi / max(len(self.x), len(self.y))))
+        self.omega = omega
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.potential = np.zeros((len(self.x), len(self.y)))
+        self.iterations = 0
+        self.solve()
+
+    def _rasterize(self) -> tuple[np.ndarray, np.ndarray]:
+        x, y = np.meshgrid(self.x, self.y, indexing="ij")
+        fixed = np.zeros(x.shape, dtype=bool)
+        fixed[[0, -1]] = fixed[:, [0, -1]] = True
+        self.potential[fixed] = 0
+        for conductor in self.conductors:
+            parts = []
+            for outline in conductor.get_outlines():
+                if len(outline) > 3 and np.allclose(outline[0], outline[-1]):
+                    parts.append(gm.Polygon(outline))
+                else:
+                    parts.append(gm.LineString(outline))
+            region = shapely.unary_union(parts).buffer(self.cell_size / 2)
+            inside = shapely.contains_xy(region, x, y)
+            fixed |= inside
+            self.potential[inside] = conductor.potential
+
+        # Charges are spread over the four nearest grid points.
+        source = np.zeros(x.shape)
+        h = self.cell_size
+        for charge in self.charges:
+            u = (charge.get_center()[:2] - (self.x[0], self.y[0])) / h
+            i, j = np.clip(np.floor(u).astype(int), 0, np.array(x.shape) - 2)
+            fx, fy = np.clip(u - (i, j), 0, 1)
+            weights = np.outer([1 - fx, fx], [1 - fy, fy])
+            source[i : i + 2, j : j + 2] += 2 * np.pi * charge.magnitude * weights
+        return fixed, source
+
+    def solve(self) -> int:
+        """Solves for the potential with the current conductors and charges,
+        starting from the previous solution. Returns the number of
+        iterations.
+        """
+        fixed, source = self._rasterize()
+        scale = max(np.abs(self.potential).max(), 1)
+        self.iterations = _red_black_sor(
+            self.potential,
+            fixed,
+            source[1:-1, 1:-1],
+            self.omega,
+            self.tolerance * scale,
+            self.max_iterations,
+        )
+        gradient = np.gradient(self.potential, self.cell_size)
+        self.field = -np.stack(gradient, axis=-1)
+        return self.iterations
+
+    def _interpolate(self, values: np.ndarray, points: np.ndarray) -> np.ndarray:
+        points = np.reshape(points, (-1, 3))
+        u = (points[:, 0] - self.x[0]) / self.cell_size
+        v = (points[:, 1] - self.y[0]) / self.cell_size
+        inside = (u >= 0) & (u <= len(self.x) - 1) & (v >= 0) & (v <= len(self.y) - 1)
+        i = np.clip(np.floor(u).astype(int), 0, len(self.x) - 2)
+        j = np.clip(np.floor(v).astype(int), 0, len(self.y) - 2)
+        fu = (u - i)[:, None]
+        fv = (v - j)[:, None]
+        result = (
+            values[i, j].reshape(len(points), -1) * (1 - fu) * (1 - fv)
+            + values[i + 1, j].reshape(len(points), -1) * fu * (1 - fv)
+            + values[i, j + 1].reshape(len(points), -1) * (1 - fu) * fv
+            + values[i + 1, j + 1].reshape(len(points), -1) * fu * fv
+        )
+        result[~inside] = 0
+        return result
+
+    def get_potential(self, points: np.ndarray) -> np.ndarray:
+        """Returns the potential at an array of ``points`` of shape
+        ``(n, 3)``, zero outside the grid."""
+        return self._interpolate(self.potential, points)[:, 0]
+
+    def get_field(self, points: np.ndarray) -> np.ndarray:
+        """Returns the electric field at an array of ``points`` of shape
+        ``(n, 3)``, zero outside the grid."""
+        field = np.zeros((len(np.reshape(points, (-1, 3))), 3))
+        field[:, :2] = self._interpolate(self.field, points)
+        return field
+
+    def get_equipotentials(self, levels: Iterable[float], **kwargs) -> VMobject:
+        """Returns the lines of equal potential at each of ``levels``, traced
+        through the grid with marching squares, as a single ``VMobject``.
+
+        Parameters
+        ----------
+        levels
+            The potentials of the lines.
+        kwargs
+            Additional parameters passed to ``VMobject``.
+        """
+        segments = [np.zeros((0, 2, 2))]
+        x, y = np.meshgrid(self.x, self.y, indexing="ij")
+        corners = [
+            (slice(None, -1), slice(None, -1)),
+            (slice(1, None), slice(None, -1)),
+        ]
+        corners += [(slice(1, None), slice(1, None)), (slice(None, -1), slice(1, None))]
+        for level in levels:
+            values = self.potential - level
+            # The crossings on the four edges of every cell, in order around
+            # the cell.
+            crossings, points = [], []
+            for a, b in zip(corners, corners[1:] + corners[:1]):
+                va, vb = values[a], values[b]
+                crossing = (va > 0) != (vb > 0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t = np.where(crossing, va / (va - vb), 0)[..., None]
+                pa = np.stack([x[a], y[a]], axis=-1)
+                pb = np.stack([x[b], y[b]], axis=-1)
+                crossings.append(crossing)
+                points.append(pa + t * (pb - pa))
+            crossings = np.stack(crossings, axis=-1)
+            points = np.stack(points, axis=-2)
+            count = crossings.sum(axis=-1)
+
+            pairs = np.sort(np.argsort(~crossings, axis=-1, kind="stable")[..., :2])
+            two = count == 2
+            segments.append(
+                np.take_along_axis(points[two], pairs[two][..., None], axis=1)
+            )
+            # Saddle cells are split according to the sign at their center,
+            # which decides whether their first corner is cut off.
+            saddle = count == 4
+            center = sum(values[corner] for corner in corners)[saddle]
+            joined = ((center > 0) == (values[corners[0]][saddle] > 0))[:, None]
+            saddles = points[saddle]
+            first = np.where(joined, [0, 1], [0, 3])
+            second = np.where(joined, [2, 3], [1, 2])
+            for pair in (first, second):
+                segments.append(np.take_along_axis(saddles, pair[..., None], axis=1))
+        segments = np.concatenate(segments)
+        lines = VMobject(**kwargs)
+        if len(segments):
+            lines.points = polyline_points(segments)
+        return lines
@@ -1,17 +1,22 @@
 """Electrostatics module"""
 
 from __future__ import annotations
-from typing import Iterable
+from typing import Iterable, Optional, Sequence
 
 from manim import normalize
+from manim.camera.camera import Camera
 from manim.constants import ORIGIN, TAU
 from manim.mobject.geometry.arc import Arc, Dot
 from manim.mobject.geometry.polygram import Rectangle
+from manim.mobject.mobject import Mobject
 from manim.mobject.types.vectorized_mobject import VGroup
-from manim.mobject.vector_field import ArrowVectorField
+from manim.mobject.value_tracker import ValueTracker
 from manim.utils.color import BLUE, RED, RED_A, RED_D, color_gradient
 import numpy as np
 
+from .conductors import Conductor, PotentialGrid
+from .fields import _SourceField, _arrow_ranges
+
 
 __all__ = [
     "Charge",
@@ -85,14 +90,53 @@ class Charge(VGroup):
             mob.set_z_index(1)
 
 
-class ElectricField(ArrowVectorField):
-    def __init__(self, *charges: Charge, **kwargs) -> None:
+class ElectricField(_SourceField):
+    def __init__(
+        self,
+        *charges: Charge,
+        magnitudes: Optional[Sequence[float | ValueTracker]] = None,
+        conductors: Iterable[Conductor] = (),
+        cell_size: float = 0.1,
+        placement: str = "grid",
+        arrow_budget: int = 256,
+        camera: Optional[Camera] = None,
+        camera_margin: float = 1,
+        **kwargs,
+    ) -> None:
         """An electric field.
 
         Parameters
         ----------
         charges
             The charges affecting the electric field.
+        magnitudes
+            The magnitudes of the charges, replacing the ones they were
+            created with. Magnitudes given as ``ValueTracker`` objects are
+            followed as they change, while the charges stay in place. The
+            field of every charge is then evaluated only once, and redrawn
+            as a weighted sum.
+        conductors
+            Conductors held at fixed potentials. If given, the field is
+            solved for on a :class:`~PotentialGrid` around the arrows,
+            stored as ``potential_grid``, and solved again from the previous
+            solution whenever the conductors or charges change. Cannot be
+            combined with ``magnitudes``.
+        cell_size
+            The grid spacing used with ``conductors``.
+        placement
+            Where to place arrows. ``"grid"`` places them evenly over
+            ``x_range`` and ``y_range``. ``"adaptive"`` places more, smaller
+            arrows where the field changes quickly, such as near charges,
+            and fewer where it is nearly uniform.
+        arrow_budget
+            The maximum number of arrows with adaptive placement.
+        camera
+            The camera of the scene, such as ``self.camera`` of a
+            ``MovingCameraScene`` or ``ThreeDScene``. If given, only arrows
+            in its view are evaluated and drawn, and more are added as it
+            moves.
+        camera_margin
+            How far outside the view of ``camera`` arrows are drawn.
         kwargs
             Additional parameters to be passed to ``ArrowVectorField``.
 
@@ -111,14 +155,121 @@ class ElectricField(ArrowVectorField):
                     field = ElectricField(charge1, charge2, charge3)
                     self.add(charge1, charge2, charge3)
                     self.add(field)
+
+        .. manim:: VaryingChargeExample
+            :quality: low
+
+            from manim_physics import *
+
+            class VaryingChargeExample(Scene):
+                def construct(self):
+                    magnitude = ValueTracker(1)
+                    charge1 = Charge(1, LEFT)
+                    charge2 = Charge(-1, RIGHT)
+                    field = ElectricField(
+                        charge1, charge2, magnitudes=[magnitude, -1]
+                    )
+                    self.add(charge1, charge2, field)
+                    self.play(magnitude.animate.set_value(-1), run_time=3)
+
+        .. manim:: CapacitorExample
+            :save_last_frame:
+
+            from manim_physics import *
+
+            class CapacitorExample(Scene):
+                def construct(self):
+                    plate1 = Conductor(Line(LEFT * 2 + UP, RIGHT * 2 + UP), 1)
+                    plate2 = Conductor(Line(LEFT * 2 + DOWN, RIGHT * 2 + DOWN), -1)
+                    field = ElectricField(conductors=[plate1, plate2])
+                    equipotentials = field.potential_grid.get_equipotentials(
+                        np.linspace(-0.8, 0.8, 9), stroke_width=1
+                    )
+                    self.add(equipotentials, field, plate1, plate2)
+
+        .. manim:: CulledFieldExample
+            :quality: low
+
+            from manim_physics import *
+
+            class CulledFieldExample(MovingCameraScene):
+                def construct(self):
+                    charges = [
+                        Charge((-1) ** i, RIGHT * x)
+                        for i, x in enumerate(range(-20, 21, 4))
+                    ]
+                    field = ElectricField(
+                        *charges,
+                        camera=self.camera,
+                        x_range=[-24, 24],
+                        y_range=[-4, 4],
+                    )
+                    self.add(field, *charges)
+                    self.play(self.camera.frame.animate.shift(RIGHT * 16), run_time=4)
         """
         self.charges = charges
         positions = []
-        magnitudes = []
+        charge_magnitudes = []
         for charge in charges:
             positions.append(charge.get_center())
-            magnitudes.append(charge.magnitude)
-        super().__init__(lambda p: self._field_func(p, positions, magnitudes), **kwargs)
+            charge_magnitudes.append(charge.magnitude)
+        self._positions = np.reshape(positions, (-1, 3))
+        func = lambda p: self._field_func(p, positions, charge_magnitudes)
+        self.conductors = list(conductors)
+        if self.conductors:
+            if magnitudes is not None:
+                raise ValueError("magnitudes cannot be combined with conductors")
+            # Leave room around the arrows for the grounded edges of the grid.
+            x_range, y_range, _ = _arrow_ranges(kwargs)
+            self.potential_grid = PotentialGrid(
+                self.conductors,
+                charges,
+                (x_range[0] - 1, x_range[1] + 1),
+                (y_range[0] - 1, y_range[1] + 1),
+                cell_size,
+            )
+            self._layout = self._get_layout()
+            func = lambda p: self.potential_grid.get_field(p)[0]
+        super().__init__(
+            func,
+            magnitudes,
+            placement,
+            arrow_budget,
+            camera,
+            camera_margin,
+            **kwargs,
+        )
+        if self.conductors:
+            self.add_updater(self._follow_conductors)
+
+    def _unit_fields(self, points: np.ndarray) -> np.ndarray:
+        return _unit_electric_fields(points, self._positions)
+
+    def _default_strengths(self) -> np.ndarray:
+        return np.array([charge.magnitude for charge in self.charges], dtype=float)
+
+    def evaluate(self, points: np.ndarray) -> np.ndarray:
+        if self.conductors:
+            return self.potential_grid.get_field(points)
+        return super().evaluate(points)
+
+    def _get_layout(self) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.ravel(mob.get_center() if isinstance(mob, Charge) else mob.points)
+                for mob in [*self.conductors, *self.charges]
+            ]
+            + [[mob.potential] for mob in self.conductors]
+            + [[charge.magnitude] for charge in self.charges]
+        )
+
+    def _follow_conductors(self, mob: Mobject) -> None:
+        layout = self._get_layout()
+        if len(layout) == len(self._layout) and np.array_equal(layout, self._layout):
+            return
+        self._layout = layout
+        self.potential_grid.solve()
+        self.redraw_arrows()
 
     def _field_func(
         self,
@@ -134,3 +285,25 @@ class ElectricField(ArrowVectorField):
                 return np.zeros(3)
             field_vect += mag / dist**2 * normalize(r)
         return field_vect
+
+
+def _unit_electric_fields(points: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Evaluates the field of a charge of unit magnitude at each of
+    ``positions`` at an array of ``points`` of shape ``(n, 3)``, as in
+    :class:`~ElectricField`. Returns an array of shape ``(charges, n, 3)``.
+    """
+    r = points[None] - positions[:, None]
+    dist = np.linalg.norm(r, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fields = r / dist[..., None] ** 3
+    fields[:, (dist < 0.1).any(axis=0)] = 0
+    return fields
+
+
+def _electric_field(
+    points: np.ndarray, positions: np.ndarray, magnitudes: np.ndarray
+) -> np.ndarray:
+    """Evaluates the field of :class:`~ElectricField` at an array of
+    ``points`` of shape ``(n, 3)`` at once.
+    """
+    return np.tensordot(magnitudes, _unit_electric_fields(points, positions), axes=1)
@@ -0,0 +1,421 @@
+"""Shared machinery of the electric and magnetic fields"""
+
+from __future__ import annotations
+import itertools as it
+from math import ceil, floor
+from typing import Callable, Optional, Sequence
+
+from manim import config
+from manim.constants import OUT, RIGHT, UP
+from manim.camera.camera import Camera
+from manim.mobject.mobject import Mobject
+from manim.mobject.value_tracker import ValueTracker
+from manim.mobject.vector_field import ArrowVectorField
+import numpy as np
+
+
+# The variation of the field across a cell, in radians of direction plus
+# natural logarithm of magnitude, below which it is not refined.
+_REFINEMENT_THRESHOLD = 0.1
+
+# The width, in arrows, of the cells in which arrows are built and cached
+# when culled to the view of a camera.
+_CULLING_CELL_ARROWS = 4
+
+
+def _arrow_ranges(kwargs: dict) -> list[list[float]]:
+    """Returns the ``[start, stop, step]`` ranges of the arrows of an
+    ``ArrowVectorField`` constructed with ``kwargs``, as it computes them.
+    """
+    x_range = list(
+        kwargs.get("x_range")
+        or [floor(-config["frame_width"] / 2), ceil(config["frame_width"] / 2)]
+    )
+    y_range = list(
+        kwargs.get("y_range")
+        or [floor(-config["frame_height"] / 2), ceil(config["frame_height"] / 2)]
+    )
+    if kwargs.get("three_dimensions") or kwargs.get("z_range"):
+        z_range = list(kwargs.get("z_range") or y_range)
+    else:
+        z_range = [0, 0]
+    ranges = [x_range, y_range, z_range]
+    for r in ranges:
+        if len(r) == 2:
+            r.append(0.5)
+        r[1] += r[2]
+    return ranges
+
+
+def _field_variation(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    centers: np.ndarray,
+    halves: np.ndarray,
+    z: float,
+) -> np.ndarray:
+    """Returns how much the field changes between the center and the
+    corners of every cell, in direction and in order of magnitude.
+    """
+    dimensions = centers.shape[1]
+    offsets = np.array(list(it.product((-1, 1), repeat=dimensions)))
+    samples = np.concatenate(
+        [centers[:, None], centers[:, None] + offsets * halves[:, None]], axis=1
+    ).reshape(-1, dimensions)
+    points = np.full((len(samples), 3), z, dtype=float)
+    points[:, :dimensions] = samples
+    fields = evaluate(points).reshape(len(centers), len(offsets) + 1, 3)
+    norms = np.linalg.norm(fields, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cosines = np.sum(fields[:, :1] * fields[:, 1:], axis=-1)
+        cosines /= norms[:, :1] * norms[:, 1:]
+    angles = np.arccos(np.clip(np.nan_to_num(cosines, nan=-1), -1, 1))
+    tiny = 1e-12 + 1e-6 * norms.max(initial=0)
+    ratios = np.abs(np.log(norms[:, 1:] + tiny) - np.log(norms[:, :1] + tiny))
+    return (angles + ratios).max(axis=1)
+
+
+def _adaptive_cells(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    z: float,
+    budget: int,
+    min_size: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Subdivides the box between ``lower`` and ``upper`` into a quadtree, or
+    an octree in three dimensions, splitting the cells across which the field
+    varies the most until there would be more than ``budget`` cells. Returns
+    the centers and half sizes of the cells.
+    """
+    dimensions = len(lower)
+    children = 2**dimensions
+    extent = np.maximum(upper - lower, 1e-9)
+    side = (np.prod(extent) * children / max(budget, 1)) ** (1 / dimensions)
+    counts = np.maximum(np.ceil(extent / side - 1e-9).astype(int), 1)
+    halves = extent / counts / 2
+    axes = [
+        lower[k] + halves[k] * (2 * np.arange(counts[k]) + 1) for k in range(dimensions)
+    ]
+    centers = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(
+        -1, dimensions
+    )
+    halves = np.tile(halves, (len(centers), 1))
+    scores = _field_variation(evaluate, centers, halves, z)
+    offsets = np.array(list(it.product((-1, 1), repeat=dimensions)))
+    while True:
+        scores[halves.min(axis=1) < min_size] = 0
+        candidates = np.flatnonzero(scores > _REFINEMENT_THRESHOLD)
+        room = (budget - len(centers)) // (children - 1)
+        if room < 1 or not len(candidates):
+            break
+        # Split the half of the candidates that vary most at a time, so that
+        # the budget goes to the cells that still vary most after splitting.
+        count = min(room, (len(candidates) + 1) // 2)
+        split = candidates[np.argsort(scores[candidates])[::-1][:count]]
+        new_halves = np.repeat(halves[split] / 2, children, axis=0)
+        new_centers = (
+            centers[split, None] + offsets * halves[split, None] / 2
+        ).reshape(-1, dimensions)
+        keep = np.ones(len(centers), dtype=bool)
+        keep[split] = False
+        centers = np.concatenate([centers[keep], new_centers])
+        halves = np.concatenate([halves[keep], new_halves])
+        scores = np.concatenate(
+            [scores[keep], _field_variation(evaluate, new_centers, new_halves, z)]
+        )
+    return centers, halves
+
+
+class _SourceField(ArrowVectorField):
+    """An arrow field that is the sum of the fields of several sources.
+
+    Subclasses must implement two hooks. Both may be called from
+    ``__init__``, so they may only rely on attributes the subclass sets
+    before calling it:
+
+    ``_unit_fields(points)``
+        Returns the field of every source at unit strength at an array of
+        points of shape ``(n, 3)``, as an array of shape ``(sources, n, 3)``.
+    ``_default_strengths()``
+        Returns the strength of every source, as an array of shape
+        ``(sources,)``, used when no ``strengths`` are given.
+
+    If ``strengths`` is given, the field of every source is evaluated once at
+    all arrows, and the drawn field is a weighted sum of these fields. Any
+    strength that is a ``ValueTracker`` is followed by an updater, which only
+    turns and stretches the existing arrows to the new field when a strength
+    changes.
+
+    With ``placement="adaptive"``, arrows are placed at the centers of the
+    cells of a quadtree, or an octree for three dimensional fields, refined
+    where the field varies most, with at most ``arrow_budget`` arrows. Arrows
+    in small cells are scaled down with their cell.
+
+    If a ``camera`` is given, arrows are grouped into cells, and only the
+    cells in view of the camera, widened by ``camera_margin``, are evaluated
+    and drawn. An updater shows further cells as the camera moves, building
+    each only the first time it comes into view.
+
+    Unless the arrows are placed on the grid of ``ArrowVectorField`` with
+    fixed strengths and no camera, the field is evaluated at all arrows of a
+    cell in one batch.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        strengths: Optional[Sequence[float | ValueTracker]] = None,
+        placement: str = "grid",
+        arrow_budget: int = 256,
+        camera: Optional[Camera] = None,
+        camera_margin: float = 1,
+        **kwargs,
+    ) -> None:
+        if placement not in ("grid", "adaptive"):
+            raise ValueError(f"Unknown arrow placement {placement!r}")
+        self.strengths = strengths
+        self.placement = placement
+        self.arrow_budget = arrow_budget
+        self.camera = camera
+        self.camera_margin = camera_margin
+        self._custom = (
+            strengths is not None or placement != "grid" or camera is not None
+        )
+        self._arrow_values = {}
+        self._arrow_scales = {}
+        if self._custom:
+            ranges = _arrow_ranges(kwargs)
+            # Keep ArrowVectorField from adding any arrows.
+            kwargs = {**kwargs, "x_range": [0, -1, 1]}
+            func = self._field_at
+        super().__init__(func, **kwargs)
+        if not self._custom:
+            return
+        self.x_range, self.y_range, self.z_range = ranges
+        self._points, sizes = self._place_arrows()
+        step = min(self.x_range[2], self.y_range[2])
+        scales = np.minimum(sizes / step, 1)
+        self._arrow_scales = dict(zip(map(tuple, self._points), scales))
+        self._group_cells()
+        self._cell_bases = {}
+        self._cell_arrows = {}
+        self._cell_strengths = {}
+        self._shown_cells = None
+        if strengths is not None:
+            self._strength_values = self.get_strengths()
+            self.add_updater(self._follow_strengths)
+        if camera is not None:
+            self.add_updater(self._follow_camera)
+        self.redraw_arrows()
+
+    def _unit_fields(self, points: np.ndarray) -> np.ndarray:
+        """Returns the field of every source at unit strength at an array of
+        ``points`` of shape ``(n, 3)``, as an array of shape
+        ``(sources, n, 3)``.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement _unit_fields")
+
+    def _default_strengths(self) -> np.ndarray:
+        """Returns the strength of every source when no ``strengths`` are
+        given."""
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement _default_strengths"
+        )
+
+    def _place_arrows(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the roots of the arrows and the size of the cell of each."""
+        axes = [np.arange(*r) for r in (self.x_range, self.y_range, self.z_range)]
+        step = min(self.x_range[2], self.y_range[2])
+        if self.placement == "grid":
+            points = np.array(list(it.product(*axes)), dtype=float).reshape(-1, 3)
+            return points, np.full(len(points), step)
+        dimensions = 3 if len(axes[2]) > 1 else 2
+        lower = np.array([axis[0] for axis in axes[:dimensions]], dtype=float)
+        upper = np.array([axis[-1] for axis in axes[:dimensions]], dtype=float)
+        centers, halves = _adaptive_cells(
+            self.evaluate, lower, upper, axes[2][0], self.arrow_budget, step / 8
+        )
+        points = np.full((len(centers), 3), axes[2][0], dtype=float)
+        points[:, :dimensions] = centers
+        return points, 2 * halves.min(axis=1)
+
+    def _group_cells(self) -> None:
+        """Sorts the arrows into the cells that are culled together, all in
+        one cell without a camera."""
+        if self.camera is None or not len(self._points):
+            self._cells = [np.arange(len(self._points))]
+            self._cell_centers = np.zeros((1, 3))
+            self._cell_radius = 0
+            return
+        steps = np.array([self.x_range[2], self.y_range[2], self.z_range[2]])
+        side = steps * _CULLING_CELL_ARROWS
+        keys = np.floor((self._points - self._points.min(axis=0)) / side)
+        keys, cells = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(cells.ravel(), kind="stable")
+        bounds = np.searchsorted(cells.ravel()[order], np.arange(len(keys) + 1))
+        self._cells = [order[a:b] for a, b in zip(bounds, bounds[1:])]
+        self._cell_centers = self._points.min(axis=0) + (keys + 0.5) * side
+        is_flat = np.ptp(self._points, axis=0) == 0
+        self._cell_radius = np.linalg.norm(np.where(is_flat, 0, side / 2))
+
+    def get_visible_cells(self) -> list[int]:
+        """Returns the indices of the cells of arrows in view of the camera."""
+        camera = self.camera
+        if camera is None:
+            return list(range(len(self._cells)))
+        margin = self.camera_margin + self._cell_radius
+        if hasattr(camera, "project_points"):
+            projected = camera.project_points(self._cell_centers)
+            margin *= camera.get_zoom()
+        else:
+            projected = self._cell_centers - camera.frame_center
+        visible = (np.abs(projected[:, 0]) <= camera.frame_width / 2 + margin) & (
+            np.abs(projected[:, 1]) <= camera.frame_height / 2 + margin
+        )
+        return list(np.flatnonzero(visible))
+
+    def get_arrow_points(self) -> np.ndarray:
+        """Returns the roots of all arrows, drawn or not, in the order they
+        were added."""
+        if self._custom:
+            return self._points
+        return np.array(
+            [
+                x * RIGHT + y * UP + z * OUT
+                for x, y, z in it.product(
+                    np.arange(*self.x_range),
+                    np.arange(*self.y_range),
+                    np.arange(*self.z_range),
+                )
+            ]
+        ).reshape(-1, 3)
+
+    def get_strengths(self) -> np.ndarray:
+        """Returns the current strength of every source."""
+        if self.strengths is None:
+            return self._default_strengths()
+        return np.array(
+            [
+                s.get_value() if isinstance(s, ValueTracker) else s
+                for s in self.strengths
+            ],
+            dtype=float,
+        )
+
+    def evaluate(self, points: np.ndarray) -> np.ndarray:
+        """Returns the field at an array of ``points`` of shape ``(n, 3)``."""
+        points = np.reshape(points, (-1, 3))
+        return np.tensordot(self.get_strengths(), self._unit_fields(points), axes=1)
+
+    def _field_at(self, point: np.ndarray) -> np.ndarray:
+        value = self._arrow_values.get(tuple(point))
+        if value is None:
+            value = self.evaluate(point)[0]
+        return value
+
+    def _follow_strengths(self, mob: Mobject) -> None:
+        values = self.get_strengths()
+        if np.array_equal(values, self._strength_values):
+            return
+        self._strength_values = values
+        self._show_cells(self.get_visible_cells())
+
+    def _follow_camera(self, mob: Mobject) -> None:
+        cells = self.get_visible_cells()
+        if cells != self._shown_cells:
+            self._show_cells(cells)
+
+    def get_vector(self, point: np.ndarray):
+        vector = super().get_vector(point)
+        scale = self._arrow_scales.get(tuple(point), 1)
+        if scale < 1:
+            vector.scale(scale, scale_tips=True, about_point=point)
+        return vector
+
+    def _build_cell(self, cell: int) -> list[Mobject]:
+        points = self._points[self._cells[cell]]
+        if self.strengths is not None:
+            if cell not in self._cell_bases:
+                self._cell_bases[cell] = self._unit_fields(points)
+            values = np.tensordot(self._strength_values, self._cell_bases[cell], axes=1)
+            self._cell_strengths[cell] = self._strength_values
+        else:
+            values = self.evaluate(points)
+        self._arrow_values.update(zip(map(tuple, points), values))
+        arrows = [self.get_vector(point) for point in points]
+        for arrow in arrows:
+            arrow.set_opacity(self.opacity)
+        return arrows
+
+    def _update_cell(self, cell: int) -> bool:
+        """Points the arrows of a cell drawn for other strengths along the
+        current field. Returns whether any arrow had to be replaced."""
+        points = self._points[self._cells[cell]]
+        values = np.tensordot(self._strength_values, self._cell_bases[cell], axes=1)
+        self._cell_strengths[cell] = self._strength_values
+        self._arrow_values.update(zip(map(tuple, points), values))
+        arrows = self._cell_arrows[cell]
+        replaced = False
+        for i, point in enumerate(points):
+            if not self._turn_arrow(arrows[i], point):
+                arrows[i] = self.get_vector(point)
+                arrows[i].set_opacity(self.opacity)
+                replaced = True
+        return replaced
+
+    def _turn_arrow(self, arrow: Mobject, point: np.ndarray) -> bool:
+        """Turns, stretches and recolors ``arrow``, rooted at ``point``, to the
+        field there, scaling its tip along like ``get_vector``. Returns
+        whether this was possible, which it is not for arrows of zero length.
+        """
+        value = self._field_at(point)
+        norm = np.linalg.norm(value)
+        start = arrow.get_start()
+        current = arrow.get_end() - start
+        length = np.linalg.norm(current)
+        if norm == 0 or length == 0:
+            return False
+        target = value * self.length_func(norm) / norm
+        target *= self._arrow_scales.get(tuple(point), 1)
+        axis = np.cross(current, target)
+        angle = np.arctan2(np.linalg.norm(axis), np.dot(current, target))
+        if not axis.any():
+            # Arrows turning around in a flat field stay in its plane.
+            if current[2] == 0:
+                axis = OUT
+            else:
+                axis = np.cross(current, np.eye(3)[np.abs(current).argmin()])
+        arrow.scale(np.linalg.norm(target) / length, scale_tips=True, about_point=start)
+        if angle:
+            axis = axis / np.linalg.norm(axis)
+            arrow.rotate(angle, axis=axis, about_point=start)
+        arrow.shift(point - start)
+        arrow.set_color(self.color if self.single_color else self.pos_to_color(point))
+        arrow.set_opacity(self.opacity)
+        return True
+
+    def _show_cells(self, cells: list[int]) -> None:
+        changed = cells != self._shown_cells
+        for cell in cells:
+            if cell not in self._cell_arrows:
+                self._cell_arrows[cell] = self._build_cell(cell)
+                changed = True
+            elif self.strengths is not None and not np.array_equal(
+                self._cell_strengths[cell], self._strength_values
+            ):
+                changed |= self._update_cell(cell)
+        self._shown_cells = cells
+        if changed:
+            self.remove(*self.submobjects)
+            self.add(*[arrow for cell in cells for arrow in self._cell_arrows[cell]])
+
+    def redraw_arrows(self) -> None:
+        """Replaces the arrows with new ones for the current field."""
+        if not self._custom:
+            self.remove(*self.submobjects)
+            self.add(*[self.get_vector(point) for point in self.get_arrow_points()])
+            self.set_opacity(self.opacity)
+            return
+        self._cell_arrows = {}
+        self._arrow_values = {}
+        self._show_cells(self.get_visible_cells())
@@ -1,16 +1,20 @@
 """Magnetostatics module"""
 
 from __future__ import annotations
-import itertools as it
-from typing import Iterable, Tuple
+from math import comb
+from typing import Iterable, Optional, Sequence, Tuple
 
+from manim.camera.camera import Camera
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
-from manim.mobject.types.vectorized_mobject import VMobject
-from manim.mobject.vector_field import ArrowVectorField
+from manim.mobject.types.vectorized_mobject import VGroup, VMobject
+from manim.mobject.value_tracker import ValueTracker
 import numpy as np
 
+from ..utils import polyline_points
+from .fields import _SourceField
 
-__all__ = ["Wire", "MagneticField"]
+
+__all__ = ["Wire", "MagneticField", "MagneticFieldLines"]
 
 
 class Wire(VMobject, metaclass=ConvertToOpenGL):
@@ -50,13 +54,31 @@ class Wire(VMobject, metaclass=ConvertToOpenGL):
         self.set_points(stroke.points)
 
 
-class MagneticField(ArrowVectorField):
+class MagneticField(_SourceField):
     """A magnetic field.
 
     Parameters
     ----------
     wires
         All wires contributing to the total field.
+    currents
+        The currents of the wires, replacing the ones they were created
+        with. Currents given as ``ValueTracker`` objects are followed as they
+        change, while the wires stay in place. The field of every wire is
+        then evaluated only once, and redrawn as a weighted sum.
+    placement
+        Where to place arrows. ``"grid"`` places them evenly over the
+        ranges. ``"adaptive"`` places more, smaller arrows where the field
+        changes quickly, such as near wires, and fewer where it is nearly
+        uniform.
+    arrow_budget
+        The maximum number of arrows with adaptive placement.
+    camera
+        The camera of the scene, such as ``self.camera`` of a
+        ``MovingCameraScene`` or ``ThreeDScene``. If given, only arrows in
+        its view are evaluated and drawn, and more are added as it moves.
+    camera_margin
+        How far outside the view of ``camera`` arrows are drawn.
     kwargs
         Additional parameters to be passed to ``ArrowVectorField``.
 
@@ -78,22 +100,59 @@ class MagneticField(ArrowVectorField):
                 self.set_camera_orientation(PI / 3, PI / 4)
                 self.add(wire, mag_field)
 
+    .. manim:: AlternatingCurrentExample
+        :quality: low
+
+        from manim_physics import *
+
+        class AlternatingCurrentExample(Scene):
+            def construct(self):
+                current = ValueTracker(1)
+                wire = Wire(Circle(2))
+                mag_field = MagneticField(wire, currents=[current])
+                self.add(wire, mag_field)
+                self.play(current.animate.set_value(-1), run_time=3)
+
     """
 
-    def __init__(self, *wires: Wire, **kwargs):
-        dls = []
-        currents = []
-        for wire in wires:
-            points = [
-                wire.point_from_proportion(i)
-                for i in np.linspace(0, 1, wire.samples + 1)
-            ]
-            dls.append(list(zip(points, points[1:])))
-            currents.append(wire.current)
+    def __init__(
+        self,
+        *wires: Wire,
+        currents: Optional[Sequence[float | ValueTracker]] = None,
+        placement: str = "grid",
+        arrow_budget: int = 256,
+        camera: Optional[Camera] = None,
+        camera_margin: float = 1,
+        **kwargs,
+    ):
+        self.wires = wires
+        self._segments = [_wire_segments([wire]) for wire in wires]
+        dls = [list(zip(starts, ends)) for starts, ends, _ in self._segments]
+        wire_currents = [wire.current for wire in wires]
         super().__init__(
-            lambda p: MagneticField._field_func(p, dls, currents), **kwargs
+            lambda p: MagneticField._field_func(p, dls, wire_currents),
+            currents,
+            placement,
+            arrow_budget,
+            camera,
+            camera_margin,
+            **kwargs,
         )
 
+    def _default_strengths(self) -> np.ndarray:
+        return np.array([wire.current for wire in self.wires], dtype=float)
+
+    def _unit_fields(self, points: np.ndarray) -> np.ndarray:
+        fields = np.zeros((len(self._segments), len(points), 3))
+        near = np.zeros(len(points), dtype=bool)
+        for i, (starts, ends, currents) in enumerate(self._segments):
+            fields[i] = _magnetic_field(points, starts, ends, np.ones_like(currents))
+            dist = np.linalg.norm(points[:, None] - starts[None], axis=-1)
+            near |= (dist < 0.1).any(axis=1)
+        # Like the drawn field, vanish wherever any wire is too close.
+        fields[:, near] = 0
+        return fields
+
     @staticmethod
     def _field_func(
         p: np.ndarray,
@@ -101,8 +160,8 @@ class MagneticField(ArrowVectorField):
         currents: Iterable[float],
     ):
         B_field = np.zeros(3)
-        for dl in dls:
-            for (r0, r1), I in it.product(dl, currents):
+        for dl, I in zip(dls, currents):
+            for r0, r1 in dl:
                 dr = r1 - r0
                 r = p - r0
                 dist = np.linalg.norm(r)
@@ -110,3 +169,261 @@ class MagneticField(ArrowVectorField):
                     return np.zeros(3)
                 B_field += np.cross(dr, r) * I / dist**4
         return B_field
+
+
+class MagneticFieldLines(VGroup):
+    def __init__(
+        self,
+        *wires: Wire,
+        rings_per_wire: int = 4,
+        seed_radii: Sequence[float] = (0.25, 0.5, 1),
+        seeds_per_ring: int = 8,
+        min_separation: float = 0.2,
+        step_size: float = 0.05,
+        max_steps: int = 2000,
+        x_range: Sequence[float] = (-8, 8),
+        y_range: Sequence[float] = (-5, 5),
+        z_range: Sequence[float] = (-5, 5),
+        line_style: dict = {"stroke_width": 2},
+        **kwargs,
+    ) -> None:
+        """The field lines of a :class:`~MagneticField` in space, drawn as a
+        few long lines instead of an arrow per point.
+
+        Lines start on rings around every wire, at ``rings_per_wire``
+        places along it and at each of ``seed_radii`` from it. All lines are
+        traced together in both directions, and end when they return to
+        where they started, leave the ranges or reach a point without field.
+        A seed closer than ``min_separation`` to a line traced before it
+        starts no line of its own.
+
+        Parameters
+        ----------
+        wires
+            All wires contributing to the field.
+        rings_per_wire
+            The number of places along every wire with rings of seeds.
+        seed_radii
+            The distances of the rings from the wire.
+        seeds_per_ring
+            The number of seeds on every ring.
+        min_separation
+            The smallest distance between a seed and the lines traced before
+            it.
+        step_size
+            The length of an integration step.
+        max_steps
+            The maximum number of steps in either direction from a seed.
+        x_range
+            The extent of the lines along the x axis.
+        y_range
+            The extent of the lines along the y axis.
+        z_range
+            The extent of the lines along the z axis.
+        line_style
+            Parameters for the ``VMobject`` of every line.
+        kwargs
+            Additional parameters to be passed to ``VGroup``.
+
+        Examples
+        --------
+        .. manim:: MagneticFieldLinesExample
+            :save_last_frame:
+
+            from manim_physics import *
+
+            class MagneticFieldLinesExample(ThreeDScene):
+                def construct(self):
+                    coil = Wire(
+                        ParametricFunction(
+                            lambda t: [np.cos(t), np.sin(t), t / 8],
+                            t_range=[-4 * PI, 4 * PI],
+                        ),
+                        samples=96,
+                    )
+                    lines = MagneticFieldLines(
+                        coil,
+                        seed_radii=[0.7],
+                        seeds_per_ring=4,
+                        max_steps=600,
+                        z_range=[-4, 4],
+                    )
+                    self.set_camera_orientation(PI / 3, PI / 4)
+                    self.add(coil, lines)
+        """
+        super().__init__(**kwargs)
+        self.wires = wires
+        segments = _wire_segments(wires)
+        seeds = []
+        angles = np.linspace(0, 2 * np.pi, seeds_per_ring, endpoint=False)
+        for wire in wires:
+            starts, ends, _ = _wire_segments([wire])
+            # Rings are placed on segments of nonzero length only.
+            valid = np.linalg.norm(ends - starts, axis=1) > 0
+            starts, ends = starts[valid], ends[valid]
+            indices = np.linspace(0, len(starts), rings_per_wire, endpoint=False)
+            for i in indices.astype(int):
+                tangent = ends[i] - starts[i]
+                tangent /= np.linalg.norm(tangent)
+                # Any direction not along the tangent spans the ring with it.
+                u = np.cross(tangent, np.eye(3)[np.abs(tangent).argmin()])
+                u /= np.linalg.norm(u)
+                v = np.cross(tangent, u)
+                for radius in seed_radii:
+                    seeds.extend(
+                        (starts[i] + ends[i]) / 2
+                        + radius
+                        * (np.outer(np.cos(angles), u) + np.outer(np.sin(angles), v))
+                    )
+        seeds = np.reshape(seeds, (-1, 3))
+        lower = np.array([x_range[0], y_range[0], z_range[0]])
+        upper = np.array([x_range[1], y_range[1], z_range[1]])
+        lines = _trace_field_lines(seeds, segments, step_size, max_steps, lower, upper)
+
+        kept = np.zeros((0, 3))
+        for seed, line in zip(seeds, lines):
+            if len(line) < 2:
+                continue
+            if len(kept) and np.linalg.norm(kept - seed, axis=1).min() < min_separation:
+                continue
+            kept = np.vstack([kept, line])
+            mob = VMobject(**line_style)
+            mob.points = polyline_points(line[None])
+            self.add(mob)
+
+
+def _wire_segments(
+    wires: Iterable[Wire],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the start and end points of the segments of all ``wires``, and
+    the current through each segment.
+    """
+    starts, ends, currents = [np.zeros((0, 3))], [np.zeros((0, 3))], [[]]
+    for wire in wires:
+        points = _points_from_proportions(wire, np.linspace(0, 1, wire.samples + 1))
+        starts.append(points[:-1])
+        ends.append(points[1:])
+        currents.append(np.full(wire.samples, wire.current))
+    return np.concatenate(starts), np.concatenate(ends), np.concatenate(currents)
+
+
+def _bezier_points(curves: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """Evaluates bezier curves given by control points of shape
+    ``(..., degree + 1, 3)`` at ``alphas``, broadcasting their leading shapes.
+    """
+    degree = curves.shape[-2] - 1
+    weights = np.stack(
+        [
+            comb(degree, k) * alphas**k * (1 - alphas) ** (degree - k)
+            for k in range(degree + 1)
+        ],
+        axis=-1,
+    )
+    return np.einsum("...k,...kd->...d", weights, curves)
+
+
+def _points_from_proportions(mobject: VMobject, alphas: np.ndarray) -> np.ndarray:
+    """Returns the points at the proportions ``alphas`` along ``mobject``, as
+    ``point_from_proportion`` does, but measures its curves only once.
+    """
+    per_curve = mobject.n_points_per_curve
+    curves = mobject.points[: len(mobject.points) // per_curve * per_curve]
+    curves = curves.reshape(-1, per_curve, 3)
+    # Every curve is measured as a polyline through ten of its points, like
+    # get_nth_curve_length does.
+    outline = _bezier_points(curves[:, None], np.linspace(0, 1, 10))
+    lengths = np.linalg.norm(np.diff(outline, axis=1), axis=-1).sum(axis=1)
+    totals = np.cumsum(lengths)
+    targets = alphas * totals[-1]
+    indices = np.minimum(np.searchsorted(totals, targets), len(curves) - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        residues = (targets - totals[indices] + lengths[indices]) / lengths[indices]
+    residues = np.where(lengths[indices] != 0, residues, 0)
+    points = _bezier_points(curves[indices], residues)
+    points[alphas == 1] = mobject.points[-1]
+    return points
+
+
+def _magnetic_field(
+    points: np.ndarray, starts: np.ndarray, ends: np.ndarray, currents: np.ndarray
+) -> np.ndarray:
+    """Evaluates the field of wire segments at an array of ``points`` of shape
+    ``(n, 3)`` at once, with the same law as :class:`~MagneticField`.
+    """
+    dist = np.linalg.norm(points[:, None] - starts[None], axis=-1)
+    dls = ends - starts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = currents / dist**4
+        # The sum of weighted cross products dl x (p - r0), split so that no
+        # cross product is taken per pair of point and segment.
+        field = np.cross(weights @ dls, points) - weights @ np.cross(dls, starts)
+    field[(dist < 0.1).any(axis=1)] = 0
+    return field
+
+
+def _trace_field_lines(
+    seeds: np.ndarray,
+    segments: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    step_size: float,
+    max_steps: int,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> list[np.ndarray]:
+    """Traces the field lines of wire segments through all ``seeds`` at
+    once, with fourth order Runge-Kutta steps along the direction of the
+    field in both directions. Returns the points of every line, following
+    the field. A line that returns to its seed ends there, closed.
+    """
+
+    def direction(points: np.ndarray) -> np.ndarray:
+        field = _magnetic_field(points, *segments)
+        norms = np.linalg.norm(field, axis=1, keepdims=True)
+        return np.divide(field, norms, out=np.zeros_like(field), where=norms > 0)
+
+    count = len(seeds)
+    # Every seed is traced forwards as line i and backwards as line count + i.
+    origins = np.concatenate([seeds, seeds])
+    steps = np.repeat([step_size, -step_size], count)[:, None]
+    paths = np.zeros((max_steps + 1, 2 * count, 3))
+    paths[0] = origins
+    lengths = np.ones(2 * count, dtype=int)
+    alive = np.ones(2 * count, dtype=bool)
+    departed = np.zeros(2 * count, dtype=bool)
+    closed = np.zeros(2 * count, dtype=bool)
+    for _ in range(max_steps):
+        active = np.flatnonzero(alive)
+        if not len(active):
+            break
+        points, h = paths[lengths[active] - 1, active], steps[active]
+        k1 = direction(points)
+        k2 = direction(points + h / 2 * k1)
+        k3 = direction(points + h / 2 * k2)
+        k4 = direction(points + h * k3)
+        points = points + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        stalled = ~k1.any(axis=1)
+        distances = np.linalg.norm(points - origins[active], axis=1)
+        returned = departed[active] & (distances < step_size)
+        departed[active] |= distances > 2 * step_size
+        points[returned] = origins[active][returned]
+        moved = active[~stalled]
+        paths[lengths[moved], moved] = points[~stalled]
+        lengths[moved] += 1
+
+        outside = np.any((points < lower) | (points > upper), axis=1)
+        alive[active[stalled | returned | outside]] = False
+        closed[active[returned & ~stalled]] = True
+        # A closed line needs no tracing the other way.
+        alive[(active[returned] + count) % (2 * count)] = False
+
+    lines = []
+    for i in range(count):
+        forwards = paths[: lengths[i], i]
+        backwards = paths[: lengths[count + i], count + i]
+        if closed[i]:
+            lines.append(forwards)
+        elif closed[count + i]:
+            lines.append(backwards[::-1])
+        else:
+            lines.append(np.concatenate([backwards[:0:-1], forwards]))
+    return lines
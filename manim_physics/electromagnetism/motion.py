@@ -0,0 +1,191 @@
+"""Charged particle motion module"""
+
+from __future__ import annotations
+from typing import Iterable, Optional
+
+from manim.constants import ORIGIN
+from manim.mobject.geometry.arc import Dot
+from manim.mobject.mobject import Mobject
+from manim.mobject.types.vectorized_mobject import VGroup, VMobject
+from manim.utils.color import YELLOW
+import numpy as np
+
+from ..utils import RingBuffer, place_copies, polyline_points
+from .electrostatics import Charge, _electric_field
+from .magnetostatics import Wire, _magnetic_field, _wire_segments
+
+
+__all__ = ["ChargedParticles"]
+
+
+class ChargedParticles(VGroup):
+    def __init__(
+        self,
+        positions: Iterable[np.ndarray],
+        velocities: Optional[Iterable[np.ndarray]] = None,
+        charges: Iterable[Charge] = (),
+        wires: Iterable[Wire] = (),
+        charge: float = 1,
+        mass: float = 1,
+        electric_field: np.ndarray = ORIGIN,
+        magnetic_field: np.ndarray = ORIGIN,
+        timestep: float = 0.01,
+        trail_length: int = 0,
+        particle_style: dict = {"radius": 0.03, "color": YELLOW},
+        trail_style: dict = {"stroke_width": 1, "stroke_opacity": 0.5},
+        **kwargs,
+    ) -> None:
+        """A swarm of charged particles moving through the fields of
+        :class:`~Charge` and :class:`~Wire` objects.
+
+        The particles are advanced with the Boris scheme, which rotates
+        their velocities in the magnetic field without changing their speed.
+        The fields at all particles are evaluated together once per step.
+        All particles are drawn as one mobject, and their trails as another
+        that keeps only the last ``trail_length`` positions of every
+        particle.
+
+        Parameters
+        ----------
+        positions
+            The initial positions of the particles.
+        velocities
+            The initial velocities of the particles. Defaults to rest.
+        charges
+            The charges producing the electric field, as in
+            :class:`~ElectricField`.
+        wires
+            The wires producing the magnetic field, as in
+            :class:`~MagneticField`.
+        charge
+            The charge of every particle.
+        mass
+            The mass of every particle.
+        electric_field
+            A uniform electric field added to that of ``charges``.
+        magnetic_field
+            A uniform magnetic field added to that of ``wires``.
+        timestep
+            The fixed duration of an integration step.
+        trail_length
+            The number of past positions drawn behind every particle.
+        particle_style
+            Parameters for the ``Dot`` drawn at every particle.
+        trail_style
+            Parameters for the ``VMobject`` of the trails.
+        kwargs
+            Additional parameters to be passed to ``VGroup``.
+
+        Examples
+        --------
+        .. manim:: ChargedParticlesExample
+            :quality: low
+
+            from manim_physics import *
+
+            class ChargedParticlesExample(Scene):
+                def construct(self):
+                    charge = Charge(-1, RIGHT * 2)
+                    positions = [[-5, y, 0] for y in np.linspace(-3, 3, 40)]
+                    beam = ChargedParticles(
+                        positions,
+                        [[2, 0, 0]] * 40,
+                        charges=[charge],
+                        magnetic_field=OUT * 0.3,
+                        trail_length=30,
+                    )
+                    self.add(charge, beam)
+                    beam.start_simulation()
+                    self.wait(5)
+        """
+        super().__init__(**kwargs)
+        self.positions = np.reshape([tuple(p) for p in positions], (-1, 3))
+        self.positions = self.positions.astype(float)
+        if velocities is None:
+            self.velocities = np.zeros_like(self.positions)
+        else:
+            self.velocities = np.reshape([tuple(v) for v in velocities], (-1, 3))
+            self.velocities = self.velocities.astype(float)
+        self.charges = list(charges)
+        self.wires = list(wires)
+        self.charge = charge
+        self.mass = mass
+        self.electric_field = np.asarray(electric_field, dtype=float)
+        self.magnetic_field = np.asarray(magnetic_field, dtype=float)
+        self.timestep = timestep
+        self.accumulator = 0
+        self.update_sources()
+
+        template = Dot(**particle_style)
+        self.particles = VMobject().match_style(template)
+        self.template_points = template.points - template.get_center()
+        self.trails = VMobject(**trail_style)
+        self._trail = RingBuffer(trail_length, self.positions.shape)
+        self.add(self.trails, self.particles)
+        self.redraw()
+
+    def update_sources(self) -> None:
+        """Reads the positions and magnitudes of the charges and wires again,
+        after they have been moved or changed.
+        """
+        self._charge_positions = np.reshape(
+            [charge.get_center() for charge in self.charges], (-1, 3)
+        )
+        self._charge_magnitudes = np.array(
+            [charge.magnitude for charge in self.charges], dtype=float
+        )
+        self._segments = _wire_segments(self.wires)
+
+    def get_fields(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the electric and magnetic fields at an array of ``points``
+        of shape ``(n, 3)``.
+        """
+        E = self.electric_field + _electric_field(
+            points, self._charge_positions, self._charge_magnitudes
+        )
+        B = self.magnetic_field + _magnetic_field(points, *self._segments)
+        return E, B
+
+    def _boris(self, h: float) -> None:
+        E, B = self.get_fields(self.positions)
+        k = self.charge / self.mass * h / 2
+        v = self.velocities + k * E
+        t = k * B
+        s = 2 * t / (1 + np.sum(t**2, axis=1, keepdims=True))
+        v += np.cross(v + np.cross(v, t), s)
+        self.velocities = v + k * E
+        self.positions += h * self.velocities
+
+    def step(self, dt: float) -> None:
+        """Advances the particles by ``dt`` in whole timesteps, carrying the
+        remainder over to the next call.
+        """
+        self.accumulator += dt
+        while self.accumulator >= self.timestep * (1 - 1e-6):
+            self._boris(self.timestep)
+            self.accumulator -= self.timestep
+
+    def redraw(self) -> None:
+        """Moves the drawn particles to their positions and extends the
+        trails."""
+        self.particles.points = place_copies(
+            self.template_points, self.positions, out=self.particles.points
+        )
+        self._trail.append(self.positions)
+        if len(self._trail) > 1:
+            self.trails.points = polyline_points(
+                self._trail.get().swapaxes(0, 1), out=self.trails.points
+            )
+
+    def _simulate(self, mob: Mobject, dt: float) -> None:
+        if dt > 0:
+            self.step(dt)
+            self.redraw()
+
+    def start_simulation(self) -> None:
+        """Start moving the particles."""
+        self.add_updater(self._simulate)
+
+    def end_simulation(self) -> None:
+        """Stop moving the particles."""
+        self.remove_updater(self._simulate)
@@ -0,0 +1,294 @@
+"""Magnetic field volumes module"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+from typing import Optional, Sequence
+
+from manim.mobject.types.vectorized_mobject import VGroup, VMobject
+from manim.utils.color import BLUE, GREEN, RED, YELLOW, color_gradient
+import numpy as np
+
+from ..utils import polyline_points
+from .magnetostatics import Wire, _magnetic_field, _wire_segments
+
+__all__ = ["MagneticVolume"]
+
+
+# The corners of a cube, and the six tetrahedra around its diagonal from
+# corner 0 to corner 6 that it is split into for tracing isosurfaces.
+_CUBE_CORNERS = np.array(
+    [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ]
+)
+_TETRAHEDRA = [
+    (0, 5, 1, 6),
+    (0, 1, 2, 6),
+    (0, 2, 3, 6),
+    (0, 3, 7, 6),
+    (0, 7, 4, 6),
+    (0, 4, 5, 6),
+]
+
+
+def _evaluate_chunk(
+    name: Optional[str],
+    out: Optional[np.ndarray],
+    start: int,
+    stop: int,
+    axes: Sequence[np.ndarray],
+    segments: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Evaluates the field at the grid points with flat indices from
+    ``start`` to ``stop``, writing it to ``out``, or to the shared memory
+    block called ``name``.
+    """
+    shape = tuple(len(axis) for axis in axes)
+    memory = None
+    if name is not None:
+        memory = shared_memory.SharedMemory(name=name)
+        out = np.ndarray((np.prod(shape), 3), buffer=memory.buf)
+    try:
+        indices = np.unravel_index(np.arange(start, stop), shape)
+        points = np.stack([axis[i] for axis, i in zip(axes, indices)], axis=1)
+        out[start:stop] = _magnetic_field(points, *segments)
+    finally:
+        if memory is not None:
+            del out
+            memory.close()
+
+
+class MagneticVolume:
+    def __init__(
+        self,
+        *wires: Wire,
+        x_range: Sequence[float] = (-4, 4, 0.25),
+        y_range: Sequence[float] = (-4, 4, 0.25),
+        z_range: Sequence[float] = (-4, 4, 0.25),
+        processes: Optional[int] = None,
+        chunk_size: int = 4096,
+    ) -> None:
+        """The magnetic field of wires sampled on a grid filling a box,
+        for slices and isosurfaces of its strength.
+
+        The grid is split into chunks of ``chunk_size`` points, which a pool
+        of ``processes`` processes evaluates and writes straight into one
+        buffer in shared memory. Every wire contributes with its own
+        current.
+
+        Parameters
+        ----------
+        wires
+            All wires contributing to the field.
+        x_range
+            The ``[start, stop, step]`` of the grid along the x axis,
+            including ``stop``.
+        y_range
+            The same along the y axis.
+        z_range
+            The same along the z axis.
+        processes
+            The number of processes evaluating the field. Defaults to the
+            number of processors. With one process, the field is evaluated
+            in this one.
+        chunk_size
+            The number of points evaluated at a time.
+
+        Examples
+        --------
+        .. manim:: MagneticVolumeExample
+            :save_last_frame:
+
+            from manim_physics import *
+
+            class MagneticVolumeExample(ThreeDScene):
+                def construct(self):
+                    coils = [Wire(Circle(2).shift(OUT * z)) for z in (-1, 0, 1)]
+                    volume = MagneticVolume(*coils)
+                    strength = volume.get_isosurface(
+                        2, fill_opacity=0.3, stroke_width=0.5, color=BLUE
+                    )
+                    section = volume.get_slice(axis=1, value=0, fill_opacity=0.6)
+                    self.set_camera_orientation(PI / 3, PI / 4)
+                    self.add(*coils, section, strength)
+        """
+        self.wires = wires
+        self.axes = [
+            np.arange(start, stop + step / 2, step)
+            for start, stop, step in (x_range, y_range, z_range)
+        ]
+        self.steps = np.array([x_range[2], y_range[2], z_range[2]], dtype=float)
+        shape = tuple(len(axis) for axis in self.axes)
+        total = int(np.prod(shape))
+        segments = _wire_segments(wires)
+        chunks = [
+            (start, min(start + chunk_size, total))
+            for start in range(0, total, chunk_size)
+        ]
+        if processes is None:
+            processes = os.cpu_count() or 1
+        processes = min(processes, len(chunks))
+
+        if processes <= 1:
+            field = np.zeros((total, 3))
+            for start, stop in chunks:
+                _evaluate_chunk(None, field, start, stop, self.axes, segments)
+        else:
+            memory = shared_memory.SharedMemory(create=True, size=total * 3 * 8)
+            try:
+                with ProcessPoolExecutor(processes) as pool:
+                    futures = [
+                        pool.submit(
+                            _evaluate_chunk,
+                            memory.name,
+                            None,
+                            start,
+                            stop,
+                            self.axes,
+                            segments,
+                        )
+                        for start, stop in chunks
+                    ]
+                    for future in futures:
+                        future.result()
+                field = np.ndarray((total, 3), buffer=memory.buf).copy()
+            finally:
+                memory.close()
+                memory.unlink()
+        self.field = field.reshape(*shape, 3)
+
+    def get_magnitude(self) -> np.ndarray:
+        """Returns the strength of the field at every grid point."""
+        return np.linalg.norm(self.field, axis=-1)
+
+    def get_slice(
+        self,
+        axis: int = 2,
+        value: float = 0,
+        colors: Sequence = [BLUE, GREEN, YELLOW, RED],
+        **kwargs,
+    ) -> VGroup:
+        """Returns the strength of the field across the grid plane nearest
+        to ``value`` along ``axis``, as a square per grid point colored on a
+        logarithmic scale.
+
+        Parameters
+        ----------
+        axis
+            The axis perpendicular to the plane, 0, 1 or 2 for x, y or z.
+        value
+            The coordinate of the plane along ``axis``.
+        colors
+            The colors from the weakest to the strongest field.
+        kwargs
+            Additional parameters passed to every square.
+        """
+        index = np.abs(self.axes[axis] - value).argmin()
+        magnitude = np.take(self.get_magnitude(), index, axis=axis)
+        # Points closer than the cutoff to a wire have no field at all.
+        strong = magnitude > 0
+        levels = np.log(np.where(strong, magnitude, 1))
+        if strong.any():
+            low, high = levels[strong].min(), levels[strong].max()
+            levels = (levels - low) / max(high - low, 1e-9)
+        levels = np.where(strong, levels, 0)
+        gradient = color_gradient(colors, 256)
+
+        u, v = [k for k in range(3) if k != axis]
+        corners = np.zeros((4, 3))
+        corners[:, u] = np.array([-1, 1, 1, -1]) * self.steps[u] / 2
+        corners[:, v] = np.array([-1, -1, 1, 1]) * self.steps[v] / 2
+        squares = VGroup()
+        for (i, j), level in np.ndenumerate(levels):
+            center = np.zeros(3)
+            center[axis] = self.axes[axis][index]
+            center[u] = self.axes[u][i]
+            center[v] = self.axes[v][j]
+            square = VMobject(**{"stroke_width": 0, "fill_opacity": 1, **kwargs})
+            square.set_points_as_corners([*(center + corners), center + corners[0]])
+            square.set_fill(gradient[int(level * 255)])
+            squares.add(square)
+        return squares
+
+    def get_isosurface(self, level: float, **kwargs) -> VMobject:
+        """Returns the surface on which the strength of the field equals
+        ``level``, traced through the grid with marching tetrahedra, as a
+        single ``VMobject`` made of triangles and quadrilaterals.
+
+        Parameters
+        ----------
+        level
+            The strength of the field on the surface.
+        kwargs
+            Additional parameters passed to ``VMobject``.
+        """
+        magnitude = self.get_magnitude()
+        size = np.array(magnitude.shape) - 1
+        grid = np.stack(np.meshgrid(*self.axes, indexing="ij"), axis=-1)
+        corner_values = np.stack(
+            [
+                magnitude[tuple(slice(c, c + n) for c, n in zip(corner, size))]
+                for corner in _CUBE_CORNERS
+            ],
+            axis=-1,
+        ).reshape(-1, 8)
+        corner_points = np.stack(
+            [
+                grid[tuple(slice(c, c + n) for c, n in zip(corner, size))]
+                for corner in _CUBE_CORNERS
+            ],
+            axis=-2,
+        ).reshape(-1, 8, 3)
+
+        def crossing(values, points, a, b):
+            va = np.take_along_axis(values, a[:, None], axis=1)
+            vb = np.take_along_axis(values, b[:, None], axis=1)
+            pa = np.take_along_axis(points, a[:, None, None], axis=1)[:, 0]
+            pb = np.take_along_axis(points, b[:, None, None], axis=1)[:, 0]
+            return pa + (level - va) / (vb - va) * (pb - pa)
+
+        triangles, quads = [np.zeros((0, 4, 3))], [np.zeros((0, 5, 3))]
+        for tetrahedron in _TETRAHEDRA:
+            values = corner_values[:, tetrahedron]
+            points = corner_points[:, tetrahedron]
+            inside = values > level
+            count = inside.sum(axis=1)
+
+            # One corner on its own side cuts off a triangle.
+            odd = (count == 1) | (count == 3)
+            single = np.where(
+                count[odd] == 1, inside[odd].argmax(1), (~inside[odd]).argmax(1)
+            )
+            others = np.array([[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]])[single]
+            edges = [
+                crossing(values[odd], points[odd], single, others[:, k])
+                for k in range(3)
+            ]
+            triangles.append(np.stack([*edges, edges[0]], axis=1))
+
+            # Two corners on each side cut off a quadrilateral.
+            even = count == 2
+            order = np.argsort(~inside[even], axis=1, kind="stable")
+            a, b, c, d = order.T
+            edges = [
+                crossing(values[even], points[even], *pair)
+                for pair in ((a, c), (a, d), (b, d), (b, c))
+            ]
+            quads.append(np.stack([*edges, edges[0]], axis=1))
+        surface = VMobject(**kwargs)
+        surface.points = np.concatenate(
+            [
+                polyline_points(np.concatenate(triangles)),
+                polyline_points(np.concatenate(quads)),
+            ]
+        )
+        return surface
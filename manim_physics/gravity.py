@@ -0,0 +1,338 @@
+"""Gravitational N-body systems.
+
+:class:`~NBodySystem` integrates the mutual gravity of many point masses,
+for orbits, star clusters and galaxies. Unlike the :py:mod:`~rigid_mechanics`
+feature, whose gravity is a uniform field, every body attracts every other.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Optional
+
+from manim import *
+
+from .utils import RingBuffer, place_copies, polyline_points
+
+__all__ = ["NBodySystem"]
+
+
+# Upper bound on the number of body pairs in the temporary arrays of a direct
+# summation.
+_PAIR_CHUNK_SIZE = 2**20
+
+# Pairs of bodies closer than this many grid cells have their gravity summed
+# directly instead of read from the grid.
+_NEAR_FIELD_CELLS = 2
+
+
+def _direct_accelerations(
+    positions: np.ndarray,
+    masses: np.ndarray,
+    gravitational_constant: float,
+    softening: float,
+) -> np.ndarray:
+    """Sums the softened gravity of all pairs of bodies, a block of rows at a
+    time so that memory does not grow with the square of their number.
+    """
+    accelerations = np.empty_like(positions)
+    rows = max(_PAIR_CHUNK_SIZE // max(len(positions), 1), 1)
+    for start in range(0, len(positions), rows):
+        offsets = positions[None, :] - positions[start : start + rows, None]
+        squares = np.sum(offsets**2, axis=-1) + softening**2
+        # Bodies do not attract themselves.
+        rows_in_block = np.arange(len(squares))
+        squares[rows_in_block, start + rows_in_block] = np.inf
+        weights = squares**-1.5
+        weights *= masses
+        accelerations[start : start + rows] = np.einsum("rn,rnd->rd", weights, offsets)
+    return gravitational_constant * accelerations
+
+
+def _grid_accelerations(
+    positions: np.ndarray,
+    masses: np.ndarray,
+    gravitational_constant: float,
+    softening: float,
+    resolution: int,
+) -> np.ndarray:
+    """Approximates the gravity of all bodies with a particle-mesh method.
+
+    Masses are spread over a ``resolution`` square grid around the bodies,
+    the field is obtained by convolving them with the softened force law
+    using FFTs, and read back at every body. The grid is padded to twice its
+    size so that the field is not periodic. The grid smooths out structure
+    smaller than a cell, so for pairs of bodies closer than a few cells, the
+    part of the field that the grid carries between them is replaced by
+    their direct attraction.
+    """
+    low = positions.min(axis=0)
+    cell = max(np.ptp(positions, axis=0).max(), 1e-9) / (resolution - 2)
+    size = 2 * resolution
+
+    # Cloud-in-cell weights of the four grid points around every body.
+    scaled = (positions - low) / cell
+    cells = np.floor(scaled).astype(int)
+    fractions = scaled - cells
+    corners = []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            weights = np.abs(1 - dx - fractions[:, 0]) * np.abs(
+                1 - dy - fractions[:, 1]
+            )
+            indices = (cells[:, 0] + dx) * size + cells[:, 1] + dy
+            corners.append((indices, weights))
+    density = sum(
+        np.bincount(indices, weights * masses, minlength=size * size)
+        for indices, weights in corners
+    ).reshape(size, size)
+
+    offsets = np.arange(size) * cell
+    offsets[resolution:] -= size * cell
+    x, y = np.meshgrid(offsets, offsets, indexing="ij")
+    law = -gravitational_constant * (x**2 + y**2 + softening**2) ** -1.5
+    spectrum = np.fft.rfft2(density)
+    kernels = [(law * x).ravel(), (law * y).ravel()]
+    accelerations = np.zeros_like(positions)
+    for axis, kernel in enumerate(kernels):
+        field = np.fft.irfft2(
+            spectrum * np.fft.rfft2(kernel.reshape(size, size)), s=(size, size)
+        )
+        field = field.ravel()
+        for indices, weights in corners:
+            accelerations[:, axis] += weights * field[indices]
+
+    targets, sources = _near_pairs(scaled, _NEAR_FIELD_CELLS)
+    separations = positions[sources] - positions[targets]
+    squares = np.sum(separations**2, axis=-1) + softening**2
+    pull = squares[:, None] ** -1.5 * separations * gravitational_constant
+    # The grid carries the mass of every corner of the source to every
+    # corner of the target through the kernel, which is undone exactly.
+    # The corners are one cell apart along each axis, so the kernel is read
+    # at the offset between their cells and its neighbours. This also
+    # removes the pull of every body on itself through the grid.
+    steps = cells[targets] - cells[sources]
+    target_fractions, source_fractions = fractions[targets], fractions[sources]
+    spreads = [
+        target_fractions * (1 - source_fractions),
+        (1 - target_fractions) * (1 - source_fractions)
+        + target_fractions * source_fractions,
+        (1 - target_fractions) * source_fractions,
+    ]
+    rows = [(steps[:, 0] + shift) % size * size for shift in (1, 0, -1)]
+    columns = [(steps[:, 1] + shift) % size for shift in (1, 0, -1)]
+    for row, row_spread in zip(rows, spreads):
+        for column, column_spread in zip(columns, spreads):
+            weights = row_spread[:, 0] * column_spread[:, 1]
+            for axis, kernel in enumerate(kernels):
+                pull[:, axis] -= weights * kernel[row + column]
+    pull *= masses[sources, None]
+    for axis in range(2):
+        accelerations[:, axis] += np.bincount(
+            targets, pull[:, axis], minlength=len(positions)
+        )
+    return accelerations
+
+
+def _near_pairs(scaled: np.ndarray, reach: float) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the indices of all ordered pairs of points closer than
+    ``reach``, every point paired with itself included. The points are
+    sorted into square bins of that size, and every bin is only compared
+    with its eight neighbours.
+    """
+    bins = np.floor(scaled / reach).astype(int)
+    bins -= bins.min(axis=0) - 1
+    width = bins[:, 1].max() + 2
+    keys = bins[:, 0] * width + bins[:, 1]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    targets, sources = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbours = keys + dx * width + dy
+            starts = np.searchsorted(sorted_keys, neighbours, "left")
+            counts = np.searchsorted(sorted_keys, neighbours, "right") - starts
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            slots = np.arange(counts.sum()) - first + np.repeat(starts, counts)
+            targets.append(np.repeat(np.arange(len(keys)), counts))
+            sources.append(order[slots])
+    targets, sources = np.concatenate(targets), np.concatenate(sources)
+    distances = np.linalg.norm(scaled[sources] - scaled[targets], axis=1)
+    close = distances < reach
+    return targets[close], sources[close]
+
+
+class NBodySystem(VGroup):
+    def __init__(
+        self,
+        positions: Iterable[np.ndarray],
+        velocities: Optional[Iterable[np.ndarray]] = None,
+        masses: float | Iterable[float] = 1,
+        gravitational_constant: float = 1,
+        softening: float = 0.05,
+        timestep: float = 0.01,
+        grid_resolution: Optional[int] = None,
+        trail_length: int = 0,
+        body_style: dict = {
+            "radius": 0.03,
+            "color": YELLOW,
+            "fill_opacity": 1,
+            "stroke_width": 0,
+        },
+        trail_style: dict = {"stroke_width": 1, "stroke_opacity": 0.5},
+        **kwargs,
+    ) -> None:
+        """Point masses moving under their mutual gravity in the plane.
+
+        The bodies are advanced together with a kick-drift-kick leapfrog
+        scheme, which keeps orbits stable over long times. All bodies are
+        drawn as one mobject, and their trails as another that keeps only
+        the last ``trail_length`` positions of every body.
+
+        Parameters
+        ----------
+        positions
+            The initial positions of the bodies.
+        velocities
+            The initial velocities of the bodies. Defaults to rest.
+        masses
+            The mass of every body, or one mass for all of them.
+        gravitational_constant
+            The strength of gravity.
+        softening
+            A length added to all distances, which keeps close encounters
+            from producing huge accelerations.
+        timestep
+            The fixed duration of an integration step.
+        grid_resolution
+            If given, gravity is approximated on a grid of this many cells
+            per side instead of summed over all pairs of bodies, which is
+            much faster for thousands of bodies. Bodies closer than two
+            cells still attract each other directly, so crowding many
+            bodies into few cells slows this down again.
+        trail_length
+            The number of past positions drawn behind every body.
+        body_style
+            Parameters for the ``Circle`` drawn at every body.
+        trail_style
+            Parameters for the ``VMobject`` of the trails.
+        kwargs
+            Additional parameters for ``VGroup``.
+
+        Examples
+        --------
+        .. manim:: NBodyExample
+            :quality: low
+
+            from manim_physics import *
+
+            class NBodyExample(Scene):
+                def construct(self):
+                    rng = np.random.default_rng(1)
+                    radii = rng.uniform(0.5, 3, 300)
+                    angles = rng.uniform(0, TAU, 300)
+                    positions = np.stack(
+                        [radii * np.cos(angles), radii * np.sin(angles)], axis=1
+                    )
+                    speeds = np.sqrt(30 / radii)
+                    velocities = np.stack(
+                        [-speeds * np.sin(angles), speeds * np.cos(angles)], axis=1
+                    )
+                    positions = np.vstack([[0, 0], positions])
+                    velocities = np.vstack([[0, 0], velocities])
+                    masses = np.append(30, np.full(300, 0.001))
+                    galaxy = NBodySystem(
+                        positions, velocities, masses, trail_length=20
+                    )
+                    self.add(galaxy)
+                    galaxy.start_simulation()
+                    self.wait(5)
+        """
+        super().__init__(**kwargs)
+        self.positions = np.reshape([tuple(p)[:2] for p in positions], (-1, 2))
+        self.positions = self.positions.astype(float)
+        if velocities is None:
+            self.velocities = np.zeros_like(self.positions)
+        else:
+            self.velocities = np.reshape([tuple(v)[:2] for v in velocities], (-1, 2))
+            self.velocities = self.velocities.astype(float)
+        self.masses = np.broadcast_to(masses, len(self.positions)).astype(float)
+        self.gravitational_constant = gravitational_constant
+        self.softening = softening
+        self.timestep = timestep
+        self.grid_resolution = grid_resolution
+        self.accumulator = 0
+        self.time = 0
+        self._accelerations = self.get_accelerations(self.positions)
+
+        template = Circle(**body_style)
+        self.bodies = VMobject().match_style(template)
+        self.template_points = template.points - template.get_center()
+        self.trails = VMobject(**trail_style)
+        self._trail = RingBuffer(trail_length, self.positions.shape)
+        self.add(self.trails, self.bodies)
+        self.redraw()
+
+    def get_accelerations(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the gravitational acceleration of every body."""
+        if self.grid_resolution is None or len(positions) < 2:
+            return _direct_accelerations(
+                positions, self.masses, self.gravitational_constant, self.softening
+            )
+        return _grid_accelerations(
+            positions,
+            self.masses,
+            self.gravitational_constant,
+            self.softening,
+            self.grid_resolution,
+        )
+
+    def _leapfrog(self, h: float) -> None:
+        self.velocities += h / 2 * self._accelerations
+        self.positions += h * self.velocities
+        self._accelerations = self.get_accelerations(self.positions)
+        self.velocities += h / 2 * self._accelerations
+        self.time += h
+
+    def step(self, dt: float) -> None:
+        """Advances the bodies by ``dt`` in whole timesteps, carrying the
+        remainder over to the next call.
+        """
+        self.accumulator += dt
+        while self.accumulator >= self.timestep * (1 - 1e-6):
+            self._leapfrog(self.timestep)
+            self.accumulator -= self.timestep
+
+    def get_energy(self) -> float:
+        """Returns the total energy of the system, with softened potential
+        energy summed over all pairs.
+        """
+        kinetic = 0.5 * np.sum(self.masses * np.sum(self.velocities**2, axis=1))
+        offsets = self.positions[None] - self.positions[:, None]
+        distances = np.sqrt(np.sum(offsets**2, axis=-1) + self.softening**2)
+        np.fill_diagonal(distances, np.inf)
+        pairs = np.triu(np.outer(self.masses, self.masses) / distances, k=1)
+        return kinetic - self.gravitational_constant * np.sum(pairs)
+
+    def redraw(self) -> None:
+        """Moves the drawn bodies to their positions and extends the
+        trails."""
+        self.bodies.points = place_copies(
+            self.template_points, self.positions, out=self.bodies.points
+        )
+        self._trail.append(self.positions)
+        if len(self._trail) > 1:
+            self.trails.points = polyline_points(
+                self._trail.get().swapaxes(0, 1), out=self.trails.points
+            )
+
+    def _simulate(self, mob: Mobject, dt: float) -> None:
+        if dt > 0:
+            self.step(dt)
+            self.redraw()
+
+    def start_simulation(self) -> None:
+        """Start moving the bodies."""
+        self.add_updater(self._simulate)
+
+    def end_simulation(self) -> None:
+        """Stop moving the bodies."""
+        self.remove_updater(self._simulate)
@@ -0,0 +1,126 @@
+r"""Particle systems.
+
+A :class:`~ParticleSystem` simulates many identical balls with the
+:py:mod:`~rigid_mechanics` feature, drawn as one mobject rather than one
+mobject per ball.
+
+"""
+
+from __future__ import annotations
+from typing import Iterable, Optional
+
+from manim.mobject.geometry.arc import Circle
+from manim.mobject.types.vectorized_mobject import VMobject
+import numpy as np
+import pymunk
+
+from ..utils import place_copies
+
+__all__ = ["ParticleSystem"]
+
+
+try:
+    # For manim < 0.15.0
+    from manim.mobject.opengl_compatibility import ConvertToOpenGL
+except ModuleNotFoundError:
+    # For manim >= 0.15.0
+    from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
+
+
+class ParticleSystem(VMobject, metaclass=ConvertToOpenGL):
+    def __init__(
+        self,
+        positions: Iterable[np.ndarray],
+        radius: float = 0.1,
+        template: Optional[VMobject] = None,
+        mass: float = 1,
+        elasticity: float = 0.8,
+        friction: float = 0.8,
+        **kwargs,
+    ) -> None:
+        """Many circular rigid bodies of the same size, drawn as a single
+        mobject. Every particle is a copy of ``template`` whose points are
+        written straight from the positions of the bodies, so there is no
+        mobject or updater per particle.
+
+        Parameters
+        ----------
+        positions
+            The initial positions of the particles.
+        radius
+            The radius of the collision shape of every particle.
+        template
+            The mobject drawn at every particle. Defaults to a circle of
+            ``radius``. Its rotation is not updated.
+        mass
+            The mass of every particle.
+        elasticity
+            The elasticity of every particle.
+        friction
+            The friction of every particle.
+        kwargs
+            Additional parameters for ``VMobject``.
+
+        Examples
+        --------
+        .. manim:: ParticleSystemExample
+            :quality: low
+
+            from manim_physics import *
+
+            class ParticleSystemExample(SpaceScene):
+                SPATIAL_HASH = True
+
+                def construct(self):
+                    grid = np.mgrid[-3:3:0.25, 0:3:0.25].reshape(2, -1).T
+                    balls = ParticleSystem(
+                        grid, radius=0.1, fill_opacity=1, color=BLUE
+                    )
+                    ground = Line([-4, -3.5, 0], [4, -3.5, 0])
+                    wall1 = Line([-4, -3.5, 0], [-4, 3.5, 0])
+                    wall2 = Line([4, -3.5, 0], [4, 3.5, 0])
+                    walls = VGroup(ground, wall1, wall2)
+                    self.add(walls)
+                    self.add_particles(balls)
+                    self.make_static_body(walls)
+                    self.wait(5)
+        """
+        super().__init__(**kwargs)
+        positions = np.reshape([tuple(p)[:2] for p in positions], (-1, 2)).astype(float)
+        if template is None:
+            template = Circle(radius)
+        template_points = np.concatenate(
+            [mob.points for mob in template.family_members_with_points()]
+        )
+        self.template_points = template_points - template.get_center()
+        self.radius = radius
+
+        moment = pymunk.moment_for_circle(mass, 0, radius)
+        self.bodies = []
+        self.shapes = []
+        self.constraints = []
+        for position in positions:
+            body = pymunk.Body(mass, moment)
+            body.position = tuple(position)
+            shape = pymunk.Circle(body, radius)
+            shape.elasticity = elasticity
+            shape.friction = friction
+            self.bodies.append(body)
+            self.shapes.append(shape)
+        self.move_particles(positions)
+
+    def get_positions(self) -> np.ndarray:
+        """Returns the positions of all bodies as an array of shape
+        ``(particles, 2)``.
+        """
+        return np.array([body.position for body in self.bodies]).reshape(-1, 2)
+
+    def _select_retired(self, escaped: np.ndarray) -> np.ndarray:
+        # Particles are retired one by one.
+        return escaped
+
+    def move_particles(self, positions: np.ndarray) -> None:
+        """Moves the drawn particles to ``positions``, an array of shape
+        ``(particles, 2)``, by rewriting the points in one pass.
+        """
+        self.points = place_copies(self.template_points, positions, out=self.points)
@@ -3,25 +3,30 @@ r"""Pendulums.
 :class:`~MultiPendulum` and :class:`~Pendulum` both stem from the
 :py:mod:`~rigid_mechanics` feature.
 
+:class:`~PendulumSystem` instead integrates the equations of motion of many
+pendulums at once with a :class:`~PendulumEngine`, and works in any scene.
+
 """
 
 from __future__ import annotations
 from typing import Iterable
 
-from manim.constants import DOWN, RIGHT, UP
+from manim.constants import DOWN, RIGHT, UP, LineJointType
 from manim.mobject.geometry.arc import Circle
-from manim.mobject.geometry.line import Line
 from manim.mobject.mobject import Mobject
-from manim.mobject.types.vectorized_mobject import VGroup
+from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.utils.color import ORANGE
 import numpy as np
 import pymunk
 
+from ..utils import place_copies, polyline_points
 from .rigid_mechanics import SpaceScene
 
 __all__ = [
     "Pendulum",
     "MultiPendulum",
+    "PendulumEngine",
+    "PendulumSystem",
     "SpaceScene",
 ]
 
@@ -48,7 +53,10 @@ class MultiPendulum(VGroup):
         pivot_point
             Position of the pivot.
         rod_style
-            Parameters for ``Line``.
+            Parameters for the ``VMobject`` of the rods, which are all drawn
+            as one polyline. ``rods`` is this single ``VMobject``, with one
+            straight curve per rod, rather than a ``VGroup`` of ``Line``
+            objects; use ``rods.points`` instead of indexing into it.
         bob_style
             Parameters for ``Circle``.
         kwargs
@@ -74,18 +82,10 @@ class MultiPendulum(VGroup):
         self.bobs = VGroup(*[Circle(**bob_style).move_to(i) for i in bobs])
         self.pins = [pivot_point]
         self.pins += bobs
-        self.rods = VGroup()
-        self.rods += Line(self.pivot_point, self.bobs[0].get_center(), **rod_style)
-        self.rods.add(
-            *(
-                Line(
-                    self.bobs[i].get_center(),
-                    self.bobs[i + 1].get_center(),
-                    **rod_style,
-                )
-                for i in range(len(bobs) - 1)
-            )
-        )
+        # Rounded joints stay hidden under the bobs.
+        self.rods = VMobject(**{"joint_type": LineJointType.ROUND, **rod_style})
+        self._bob_indices = None
+        self._redraw_rods(self.rods)
 
         super().__init__(**kwargs)
         self.add(self.rods, self.bobs)
@@ -102,16 +102,27 @@ class MultiPendulum(VGroup):
         joint = pymunk.PinJoint(a, b)
         spacescene.space.space.add(joint)
 
-    def _redraw_rods(self, mob: Line, pins, i):
-        try:
-            x, y, _ = pins[i]
-        except:
-            x, y = pins[i].body.position
-        x1, y1 = pins[i + 1].body.position
-        mob.put_start_and_end_on(
-            RIGHT * x + UP * y,
-            RIGHT * x1 + UP * y1,
-        )
+    def _get_bob_positions(self) -> np.ndarray:
+        if self._bob_indices is None:
+            return np.array([bob.get_center()[:2] for bob in self.bobs])
+        space = self.bobs[0].spacescene.space
+        if self._bob_revision != space.revision:
+            self._index_bobs(space)
+            return self._get_bob_positions()
+        # The positions the bobs were last drawn at, in one lookup.
+        return space._synced_positions[self._bob_indices]
+
+    def _index_bobs(self, space) -> None:
+        index = {body: i for i, body in enumerate(space.bodies)}
+        indices = [index.get(bob.body) for bob in self.bobs]
+        self._bob_indices = None if None in indices else np.array(indices)
+        self._bob_revision = space.revision
+
+    def _redraw_rods(self, mob: VMobject) -> None:
+        vertices = np.zeros((1, len(self.bobs) + 1, 3))
+        vertices[0, 0] = self.pivot_point
+        vertices[0, 1:, :2] = self._get_bob_positions()
+        mob.points = polyline_points(vertices, out=mob.points)
 
     def start_swinging(self) -> None:
         """Start swinging."""
@@ -121,12 +132,16 @@ class MultiPendulum(VGroup):
 
         for i in range(len(pins) - 1):
             self._make_joints(pins[i + 1], pins[i], spacescene)
-            self.rods[i].add_updater(lambda mob, i=i: self._redraw_rods(mob, pins, i))
+        self._index_bobs(spacescene.space)
+        self.rods.add_updater(self._redraw_rods)
 
     def end_swinging(self) -> None:
         """Stop swinging."""
         spacescene = self.bobs[0].spacescene
         spacescene.stop_rigidity(self.bobs)
+        self.rods.remove_updater(self._redraw_rods)
+        self._redraw_rods(self.rods)
+        self._bob_indices = None
 
 
 class Pendulum(MultiPendulum):
@@ -152,7 +167,7 @@ class Pendulum(MultiPendulum):
         initial_theta
             The initial angle of deviation.
         rod_style
-            Parameters for ``Line``.
+            Parameters for the ``VMobject`` of the rod.
         bob_style
             Parameters for ``Circle``.
         kwargs
@@ -187,3 +202,218 @@ class Pendulum(MultiPendulum):
             bob_style=bob_style,
             **kwargs,
         )
+
+
+def _broadcast_links(values: np.ndarray, shape: tuple) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    # Single-link pendulums may be given one value each in a flat array.
+    if shape[1] == 1 and values.ndim == 1 and len(values) == shape[0]:
+        values = values[:, None]
+    return np.broadcast_to(values, shape).astype(float)
+
+
+class PendulumEngine:
+    def __init__(
+        self,
+        angles: np.ndarray,
+        lengths: np.ndarray = 1,
+        masses: np.ndarray = 1,
+        velocities: np.ndarray = 0,
+        gravity: float = 9.81,
+        timestep: float = 1 / 240,
+    ) -> None:
+        """Integrates the exact equations of motion of many independent
+        pendulums of point masses on massless rods, with one link or more.
+        All pendulums are advanced together with a fixed-step fourth order
+        Runge-Kutta method, so a step is a few array operations no matter
+        how many pendulums there are.
+
+        Angles are measured from the downward vertical, counterclockwise.
+
+        Parameters
+        ----------
+        angles
+            The initial angles, of shape ``(pendulums, links)``, or
+            ``(links,)`` for a single pendulum.
+        lengths
+            The lengths of the rods, broadcast to the shape of ``angles``.
+            For single-link pendulums, this may also be one length per
+            pendulum, of shape ``(pendulums,)``, as may ``masses`` and
+            ``velocities``.
+        masses
+            The masses of the bobs, broadcast to the shape of ``angles``.
+        velocities
+            The initial angular velocities, broadcast to the shape of
+            ``angles``.
+        gravity
+            The gravitational acceleration.
+        timestep
+            The fixed duration of an integration step.
+        """
+        self.angles = np.atleast_2d(np.array(angles, dtype=float))
+        shape = self.angles.shape
+        self.velocities = _broadcast_links(velocities, shape)
+        self.lengths = _broadcast_links(lengths, shape)
+        self.masses = _broadcast_links(masses, shape)
+        self.gravity = gravity
+        self.timestep = timestep
+        self.accumulator = 0
+        self.time = 0
+
+        # The mass carried by link k is that of bob k and all bobs below it,
+        # and links i and j are coupled through the mass below both.
+        carried = np.cumsum(self.masses[:, ::-1], axis=1)[:, ::-1]
+        links = np.arange(shape[1])
+        below = carried[:, np.maximum.outer(links, links)]
+        self._coupling = below * self.lengths[:, :, None] * self.lengths[:, None, :]
+        self._weights = gravity * carried * self.lengths
+
+    def get_accelerations(
+        self, angles: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        """Returns the angular accelerations in the given state."""
+        difference = angles[:, :, None] - angles[:, None, :]
+        inertia = self._coupling * np.cos(difference)
+        forces = -np.einsum(
+            "bij,bj->bi", self._coupling * np.sin(difference), velocities**2
+        ) - self._weights * np.sin(angles)
+        if angles.shape[1] == 1:
+            return forces / inertia[..., 0]
+        return np.linalg.solve(inertia, forces[..., None])[..., 0]
+
+    def _rk4(self, h: float) -> None:
+        a, v = self.angles, self.velocities
+        k1a, k1v = v, self.get_accelerations(a, v)
+        k2a = v + h / 2 * k1v
+        k2v = self.get_accelerations(a + h / 2 * k1a, k2a)
+        k3a = v + h / 2 * k2v
+        k3v = self.get_accelerations(a + h / 2 * k2a, k3a)
+        k4a = v + h * k3v
+        k4v = self.get_accelerations(a + h * k3a, k4a)
+        self.angles = a + h / 6 * (k1a + 2 * k2a + 2 * k3a + k4a)
+        self.velocities = v + h / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+        self.time += h
+
+    def step(self, dt: float) -> None:
+        """Advances the pendulums by ``dt`` in whole timesteps, carrying the
+        remainder over to the next call.
+        """
+        self.accumulator += dt
+        while self.accumulator >= self.timestep * (1 - 1e-6):
+            self._rk4(self.timestep)
+            self.accumulator -= self.timestep
+
+    def get_positions(self) -> np.ndarray:
+        """Returns the positions of the bobs relative to the pivots, of shape
+        ``(pendulums, links, 2)``.
+        """
+        offsets = self.lengths[..., None] * np.stack(
+            [np.sin(self.angles), -np.cos(self.angles)], axis=-1
+        )
+        return np.cumsum(offsets, axis=1)
+
+    def get_energy(self) -> np.ndarray:
+        """Returns the total energy of every pendulum."""
+        speeds = self.lengths[..., None] * self.velocities[..., None]
+        velocities = np.cumsum(
+            speeds * np.stack([np.cos(self.angles), np.sin(self.angles)], axis=-1),
+            axis=1,
+        )
+        kinetic = 0.5 * np.sum(self.masses * np.sum(velocities**2, axis=-1), axis=1)
+        heights = self.get_positions()[..., 1]
+        return kinetic + self.gravity * np.sum(self.masses * heights, axis=1)
+
+
+class PendulumSystem(VGroup):
+    def __init__(
+        self,
+        engine: PendulumEngine,
+        pivot_points: np.ndarray = UP * 2,
+        rod_style: dict = {},
+        bob_style: dict = {
+            "radius": 0.1,
+            "color": ORANGE,
+            "fill_opacity": 1,
+        },
+        **kwargs,
+    ) -> None:
+        """Many pendulums driven by a :class:`~PendulumEngine`. All rods are
+        drawn as one polyline and all bobs as one mobject, rewritten from the
+        engine in a single pass per frame.
+
+        Parameters
+        ----------
+        engine
+            The simulated pendulums.
+        pivot_points
+            The pivot of every pendulum, of shape ``(pendulums, 3)``, or one
+            pivot shared by all of them.
+        rod_style
+            Parameters for the ``VMobject`` of the rods.
+        bob_style
+            Parameters for the ``Circle`` drawn at every bob.
+        kwargs
+            Additional parameters for ``VGroup``.
+
+        Examples
+        --------
+        .. manim:: PendulumWaveExample
+            :quality: low
+
+            from manim_physics import *
+
+            class PendulumWaveExample(Scene):
+                def construct(self):
+                    n = 24
+                    periods = 60 / (40 + np.arange(n))
+                    engine = PendulumEngine(
+                        np.full((n, 1), 0.4),
+                        lengths=9.81 * (periods / (2 * PI)) ** 2,
+                    )
+                    pivots = np.outer(np.linspace(-5, 5, n), RIGHT) + UP * 3
+                    pendulums = PendulumSystem(engine, pivot_points=pivots)
+                    self.add(pendulums)
+                    pendulums.start_swinging()
+                    self.wait(10)
+        """
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.pivot_points = np.broadcast_to(
+            pivot_points, (len(engine.angles), 3)
+        ).astype(float)
+        self.rods = VMobject(**rod_style)
+        template = Circle(**bob_style)
+        self.bobs = VMobject().match_style(template)
+        self.template_points = template.points - template.get_center()
+        self.add(self.rods, self.bobs)
+        self.redraw()
+
+    def get_bob_positions(self) -> np.ndarray:
+        """Returns the positions of the bobs, of shape
+        ``(pendulums, links, 3)``.
+        """
+        positions = self.engine.get_positions()
+        bobs = np.repeat(self.pivot_points[:, None], positions.shape[1], axis=1)
+        bobs[..., :2] += positions
+        return bobs
+
+    def redraw(self) -> None:
+        """Moves the rods and bobs to the current state of the engine."""
+        bobs = self.get_bob_positions()
+        chains = np.concatenate([self.pivot_points[:, None], bobs], axis=1)
+        self.rods.points = polyline_points(chains, out=self.rods.points)
+        self.bobs.points = place_copies(
+            self.template_points, bobs.reshape(-1, 3), out=self.bobs.points
+        )
+
+    def _swing(self, mob: Mobject, dt: float) -> None:
+        self.engine.step(dt)
+        self.redraw()
+
+    def start_swinging(self) -> None:
+        """Start swinging."""
+        self.add_updater(self._swing)
+
+    def end_swinging(self) -> None:
+        """Stop swinging."""
+        self.remove_updater(self._swing)
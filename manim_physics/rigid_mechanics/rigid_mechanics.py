@@ -15,8 +15,10 @@ the specific functions of the space.
         `Youtube Tutorial <https://youtu.be/pRk---rdrbo>`_
 
     *   A low frame rate might cause some objects to pass static objects as
-        they don't register collisions finely enough. Trying to increase the
-        config frame rate might solve the problem.
+        they don't register collisions finely enough. Setting
+        ``SpaceScene.TIMESTEP`` steps the physics at a fixed rate regardless
+        of the frame rate, so previews and final renders behave the same.
+        ``SpaceScene.SUBSTEPS`` divides every step further.
 
 Examples
 --------
@@ -53,8 +55,14 @@ Examples
 """
 
 from __future__ import annotations
-from typing import Tuple
+from functools import reduce
+import hashlib
+from pathlib import Path
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
+from manim._config import config
 from manim.constants import RIGHT, UP
 from manim.mobject.geometry.arc import Circle
 from manim.mobject.geometry.line import Line
@@ -62,11 +70,18 @@ from manim.mobject.geometry.polygram import Polygon, Polygram, Rectangle
 from manim.mobject.mobject import Group, Mobject
 from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.scene.scene import Scene
-from manim.utils.space_ops import angle_between_vectors
+from manim.utils.simple_functions import choose
 import numpy as np
 import pymunk
+from pymunk.autogeometry import convex_decomposition
+from shapely import geometry as gm
+from shapely.geometry.polygon import orient
+
+from .particles import ParticleSystem
+from .trajectory import _CONSTRAINT_ATTRIBUTES, Trajectory, TrajectoryCache
 
 __all__ = [
+    "SpaceState",
     "Space",
     "_step",
     "_simulate",
@@ -84,43 +99,787 @@ except ModuleNotFoundError:
     from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 
 
+try:
+    import pymunk.batch
+except ImportError:
+    # Older pymunk has no batch API, and bodies are read one by one.
+    _BATCH_FIELDS = None
+else:
+    # The body data read from pymunk in one call when synchronizing.
+    _BATCH_FIELDS = (
+        pymunk.batch.BodyFields.BODY_ID
+        | pymunk.batch.BodyFields.POSITION
+        | pymunk.batch.BodyFields.ANGLE
+    )
+
+
+class SpaceState:
+    def __init__(self, space: Space) -> None:
+        """A checkpoint of the full physics state of a :class:`~Space`, taken
+        by :meth:`Space.capture_state`.
+
+        It records which bodies, shapes and constraints are in the space,
+        the position, velocity and sleep state of every body, and the
+        parameters of every constraint.
+
+        Parameters
+        ----------
+        space
+            The space to capture.
+        """
+        self.time = space.time
+        self.accumulator = space.accumulator
+        self.rigid_mobjects = list(space.rigid_mobjects)
+        self.synced_bodies = list(space.bodies)
+        self.particle_systems = [
+            (system, start, list(system.bodies), list(system.shapes))
+            for system, start in space.particle_systems
+        ]
+        self.bodies = space.space.bodies
+        self.shapes = space.space.shapes
+        self.constraints = space.space.constraints
+        self.body_states = [
+            (
+                body.position,
+                body.angle,
+                body.velocity,
+                body.angular_velocity,
+                body.force,
+                body.torque,
+                body.is_sleeping,
+            )
+            for body in self.bodies
+        ]
+        self.constraint_states = [
+            {
+                attribute: getattr(constraint, attribute)
+                for attribute in _CONSTRAINT_ATTRIBUTES
+                if hasattr(constraint, attribute)
+            }
+            for constraint in self.constraints
+        ]
+
+
+class _PhysicsProducer:
+    def __init__(self, space: Space, dt: float, frames: int, depth: int) -> None:
+        """Steps ``space`` by ``dt`` for ``frames`` frames on a worker thread,
+        keeping up to ``depth`` frames of body positions and angles buffered.
+
+        The full state of the space is captured only once, before the first
+        frame. The time of the last frame taken is kept, so that the space
+        can be brought back to it by :meth:`Space.stop_producer`.
+        """
+        self.space = space
+        self.dt = dt
+        self.start_state = space.capture_state()
+        self.time = space.time
+        self.accumulator = space.accumulator
+        self.error = None
+        self.done = False
+        self._frames = queue.Queue(maxsize=depth)
+        self._thread = threading.Thread(target=self._run, args=(frames,), daemon=True)
+        self._thread.start()
+
+    def _run(self, frames: int) -> None:
+        try:
+            for _ in range(frames):
+                self.space.step(self.dt)
+                self._frames.put(
+                    (*self.space._gather(), self.space.time, self.space.accumulator)
+                )
+        except Exception as error:
+            self.error = error
+        self._frames.put(None)
+
+    def get(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Returns the indices, positions and angles of the bodies in the
+        next frame, or ``None`` once all frames were taken.
+        """
+        if self.done:
+            return None
+        frame = self._frames.get()
+        if frame is None:
+            self.done = True
+            if self.error is not None:
+                raise self.error
+            return None
+        *body_state, self.time, self.accumulator = frame
+        return body_state
+
+    def stop(self) -> bool:
+        """Waits for the worker to finish. Returns whether it went past the
+        last frame taken with :meth:`get`.
+        """
+        overshot = False
+        while not self.done:
+            if self._frames.get() is None:
+                self.done = True
+            else:
+                overshot = True
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return overshot
+
+
 class Space(Mobject, metaclass=ConvertToOpenGL):
-    def __init__(self, gravity: Tuple[float, float] = (0, -9.81), **kwargs):
+    def __init__(
+        self,
+        gravity: Tuple[float, float] = (0, -9.81),
+        timestep: Optional[float] = None,
+        substeps: int = 1,
+        checkpoint_interval: Optional[float] = None,
+        pipeline_depth: Optional[int] = None,
+        threads: int = 1,
+        iterations: Optional[int] = None,
+        collision_slop: Optional[float] = None,
+        spatial_hash: bool = False,
+        spatial_hash_dim: Optional[float] = None,
+        spatial_hash_count: Optional[int] = None,
+        kill_region: Optional[Tuple[float, float, float, float]] = None,
+        **kwargs,
+    ):
         """An Abstract object for gravity.
 
         Parameters
         ----------
         gravity
             The direction and strength of gravity.
+        timestep
+            The fixed duration of a physics step. If ``None``, the space is
+            stepped by the frame duration instead.
+        substeps
+            The number of equal parts every step is divided into.
+        checkpoint_interval
+            The simulated time between the checkpoints kept for :meth:`seek`.
+            If ``None``, no checkpoints are taken.
+        pipeline_depth
+            If given, the space is stepped on a worker thread up to this many
+            frames ahead of rendering. See :meth:`step_pipelined`.
+        threads
+            The number of threads of pymunk's solver, which supports up to 2.
+            More than one thread is ignored on Windows, and may make the
+            simulation nondeterministic.
+        iterations
+            The number of solver iterations per step. Defaults to pymunk's.
+        collision_slop
+            The overlap allowed between shapes. Defaults to pymunk's.
+        spatial_hash
+            Whether to use a spatial hash instead of pymunk's default
+            bounding box tree for the broadphase, which is faster with many
+            bodies of similar size.
+        spatial_hash_dim
+            The cell size of the spatial hash. If ``None``, it is set to the
+            median size of the dynamic shapes whenever shapes are added.
+        spatial_hash_count
+            The number of cells of the spatial hash. If ``None``, it is set
+            to ten times the number of shapes, but at least 1000, whenever
+            shapes are added.
+            Giving either of the hash parameters enables the spatial hash.
+        kill_region
+            The bounds ``(left, bottom, right, top)`` outside of which bodies
+            are retired while simulating live. See :meth:`retire`.
         """
         super().__init__(**kwargs)
-        self.space = pymunk.Space()
+        self.space = pymunk.Space(threaded=threads > 1)
+        self.space.threads = threads
         self.space.gravity = gravity
         self.space.sleep_time_threshold = 5
+        if iterations is not None:
+            self.space.iterations = iterations
+        if collision_slop is not None:
+            self.space.collision_slop = collision_slop
+        self.spatial_hash = (
+            spatial_hash
+            or spatial_hash_dim is not None
+            or spatial_hash_count is not None
+        )
+        self.spatial_hash_dim = spatial_hash_dim
+        self.spatial_hash_count = spatial_hash_count
+        self._hashed_shapes = 0
+        self.timestep = timestep
+        self.substeps = substeps
+        self.accumulator = 0
+        self.bodies = []
+        self.rigid_mobjects = []
+        self._synced_positions = np.empty((0, 2))
+        self._synced_angles = np.empty(0)
+        self._is_particle = np.empty(0, dtype=bool)
+        self._body_ids = np.empty(0, dtype=np.uintp)
+        self._body_ids_key = None
+        self.particle_systems = []
+        self.trajectory = None
+        self.replay_time = 0
+        self.time = 0
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = []
+        self.pipeline_depth = pipeline_depth
+        self.pipeline_frames = 0
+        self.producer = None
+        self.kill_region = kill_region
+        self.on_retire: Optional[Callable[[List[Mobject]], None]] = None
+        # Counts the changes to the indices of ``bodies``.
+        self.revision = 0
+
+    def add_rigid_mobject(self, mob: Mobject) -> None:
+        """Registers a mobject whose ``body`` should drive its position and
+        rotation in :meth:`sync`.
+        """
+        self.stop_producer()
+        self.bodies.append(mob.body)
+        self.rigid_mobjects.append(mob)
+        self._synced_positions = np.vstack(
+            [self._synced_positions, tuple(mob.body.position)]
+        )
+        self._synced_angles = np.append(self._synced_angles, mob.angle)
+        self._is_particle = np.append(self._is_particle, False)
+
+    def add_particle_system(self, system: ParticleSystem) -> None:
+        """Registers a particle system whose points should follow its bodies
+        in :meth:`sync`. Its bodies are synchronized like those of rigid
+        mobjects, but the particles are redrawn in a single pass.
+        """
+        self.stop_producer()
+        n = len(system.bodies)
+        self.particle_systems.append((system, len(self.bodies)))
+        self.bodies.extend(system.bodies)
+        self.rigid_mobjects.extend([system] * n)
+        self._synced_positions = np.vstack(
+            [self._synced_positions, system.get_positions()]
+        )
+        self._synced_angles = np.append(
+            self._synced_angles, [body.angle for body in system.bodies]
+        )
+        self._is_particle = np.append(self._is_particle, np.ones(n, dtype=bool))
+
+    def sync(self) -> None:
+        """Moves all rigid mobjects to their bodies in one batched pass.
+
+        Positions and angles are read from pymunk into arrays in a single
+        call first, so that sleeping bodies and bodies that did not move since
+        the last pass can be skipped before any mobject is touched.
+        """
+        self._apply_state(*self._gather())
+
+    def _gather(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        positions = np.empty((len(self.bodies), 2))
+        angles = np.empty(len(self.bodies))
+        missing = np.ones(len(self.bodies), dtype=bool)
+        if _BATCH_FIELDS is not None and len(self.bodies):
+            key = (self.revision, len(self.bodies))
+            if self._body_ids_key != key:
+                self._body_ids = np.array(
+                    [body.id for body in self.bodies], dtype=np.uintp
+                )
+                self._body_ids_key = key
+            # Reads every body of the space in one call, in pymunk's own order.
+            buffer = pymunk.batch.Buffer()
+            pymunk.batch.get_space_bodies(self.space, _BATCH_FIELDS, buffer)
+            ids = np.frombuffer(buffer.int_buf(), dtype=np.uintp)
+            data = np.frombuffer(buffer.float_buf()).reshape(-1, 3)
+            if len(ids):
+                order = np.argsort(ids)
+                rows = order[
+                    np.searchsorted(ids, self._body_ids, sorter=order).clip(
+                        0, len(ids) - 1
+                    )
+                ]
+                missing = ids[rows] != self._body_ids
+                positions[~missing] = data[rows[~missing], :2]
+                angles[~missing] = data[rows[~missing], 2]
+        # Bodies that were never added to the space are read one by one, as
+        # are all bodies without the batch API.
+        for i in np.flatnonzero(missing):
+            positions[i] = self.bodies[i].position
+            angles[i] = self.bodies[i].angle
+        return np.arange(len(self.bodies)), positions, angles
+
+    def retire_escaped(self) -> None:
+        """Retires the bodies last drawn outside of ``kill_region``."""
+        if self.kill_region is None or not len(self.bodies):
+            return
+        left, bottom, right, top = self.kill_region
+        x, y = self._synced_positions.T
+        escaped = (x < left) | (x > right) | (y < bottom) | (y > top)
+        for system, start in self.particle_systems:
+            end = start + len(system.bodies)
+            escaped[start:end] = system._select_retired(escaped[start:end])
+        if escaped.any():
+            self.retire(np.flatnonzero(escaped))
+
+    def retire(self, indices: np.ndarray) -> None:
+        """Removes the bodies at ``indices`` of ``bodies`` from the space,
+        together with their shapes and constraints, and stops synchronizing
+        them. Particles are removed from their particle system. The rigid
+        mobjects that lost their body, and the particle systems that lost
+        all of theirs, are passed to ``on_retire``.
+        """
+        self.stop_producer()
+        keep = np.ones(len(self.bodies), dtype=bool)
+        keep[indices] = False
+        bodies = [self.bodies[i] for i in indices]
+        constraints = {c for body in bodies for c in body.constraints}
+        self.space.remove(*constraints)
+        self.space.remove(*[shape for body in bodies for shape in body.shapes])
+        self.space.remove(*bodies)
+
+        retired = []
+        particle_systems = []
+        for i, mob in enumerate(self.rigid_mobjects):
+            if not keep[i] and not self._is_particle[i]:
+                retired.append(mob)
+        for system, start in self.particle_systems:
+            kept = keep[start : start + len(system.bodies)]
+            if not kept.all():
+                system.bodies = [b for b, k in zip(system.bodies, kept) if k]
+                system.shapes = [s for s, k in zip(system.shapes, kept) if k]
+                positions = self._synced_positions[start : start + len(kept)][kept]
+                system.move_particles(positions)
+            if system.bodies:
+                start = int(np.count_nonzero(keep[:start]))
+                particle_systems.append((system, start))
+            else:
+                retired.append(system)
+
+        self.bodies = [b for b, k in zip(self.bodies, keep) if k]
+        self.rigid_mobjects = [m for m, k in zip(self.rigid_mobjects, keep) if k]
+        self._synced_positions = self._synced_positions[keep]
+        self._synced_angles = self._synced_angles[keep]
+        self._is_particle = self._is_particle[keep]
+        self.particle_systems = particle_systems
+        self.revision += 1
+        if retired and self.on_retire is not None:
+            self.on_retire(retired)
+
+    def _apply_state(
+        self, indices: np.ndarray, positions: np.ndarray, angles: np.ndarray
+    ) -> None:
+        if not len(indices):
+            return
+        moved = np.any(positions != self._synced_positions[indices], axis=1) | (
+            angles != self._synced_angles[indices]
+        )
+        indices, positions, angles = indices[moved], positions[moved], angles[moved]
+        if self.particle_systems:
+            particles = self._is_particle[indices]
+            self._synced_positions[indices[particles]] = positions[particles]
+            self._synced_angles[indices[particles]] = angles[particles]
+            for system, start in self.particle_systems:
+                end = start + len(system.bodies)
+                if np.any((indices >= start) & (indices < end)):
+                    system.move_particles(self._synced_positions[start:end])
+            indices, positions, angles = (
+                indices[~particles],
+                positions[~particles],
+                angles[~particles],
+            )
+        delta = angles - self._synced_angles[indices]
+        cos, sin = np.cos(delta), np.sin(delta)
+        for i, (x, y), angle, c, s in zip(indices, positions, angles, cos, sin):
+            mob = self.rigid_mobjects[i]
+            # Same as ``move_to`` followed by ``rotate`` about the new center.
+            rotation = np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+            center = mob.get_center()
+            for submob in mob.family_members_with_points():
+                submob.points = (submob.points - center) @ rotation + (x, y, 0)
+            mob.angle = angle
+        self._synced_positions[indices] = positions
+        self._synced_angles[indices] = angles
+
+    def bake(
+        self,
+        duration: float,
+        timestep: Optional[float] = None,
+        cache: Optional[TrajectoryCache] = None,
+    ) -> Trajectory:
+        """Simulates ``duration`` seconds ahead without rendering and records
+        the motion of all rigid bodies, which is then replayed by
+        :meth:`replay` instead of stepping the space.
+
+        Parameters
+        ----------
+        duration
+            The simulated time to record.
+        timestep
+            The time between recorded frames. Defaults to the space's
+            ``timestep``, or else the duration of a frame.
+        cache
+            Where to look up and store the recording.
+        """
+        self.stop_producer()
+        timestep = timestep or self.timestep or 1 / config.frame_rate
+        frames = int(np.ceil(duration / timestep)) + 1
+        shape = (frames, len(self.bodies))
+        if cache is not None:
+            spatial_hash = None
+            if self.spatial_hash:
+                spatial_hash = self.spatial_hash_dim, self.spatial_hash_count
+            key = cache.key(
+                self.space, self.bodies, frames, timestep, self.substeps, spatial_hash
+            )
+            cached = cache.load(key)
+            if cached is not None:
+                self.trajectory, final_state = cached
+                self._set_body_state(final_state)
+                self.replay_time = 0
+                return self.trajectory
+            positions, angles = cache.create(key, *shape)
+        else:
+            positions = np.empty((*shape, 2), dtype=np.float32)
+            angles = np.empty(shape, dtype=np.float32)
+
+        try:
+            for frame in range(frames):
+                if frame:
+                    self._advance(timestep)
+                _, positions[frame], angles[frame] = self._gather()
+            if cache is not None:
+                cache.store(key, positions, angles, timestep, self._get_body_state())
+        finally:
+            if cache is not None:
+                # Leaves nothing behind if the simulation failed.
+                cache.discard(key)
+        if cache is not None:
+            self.trajectory = cache.load(key)[0]
+        else:
+            self.trajectory = Trajectory(positions, angles, timestep)
+        self.replay_time = 0
+        return self.trajectory
+
+    def _get_body_state(self) -> dict:
+        return {
+            "position": np.array([body.position for body in self.bodies]),
+            "angle": np.array([body.angle for body in self.bodies]),
+            "velocity": np.array([body.velocity for body in self.bodies]),
+            "angular_velocity": np.array(
+                [body.angular_velocity for body in self.bodies]
+            ),
+            "sleeping": np.array([body.is_sleeping for body in self.bodies]),
+        }
+
+    def _set_body_state(self, state: dict) -> None:
+        for i, body in enumerate(self.bodies):
+            body.position = tuple(state["position"][i])
+            body.angle = state["angle"][i]
+            body.velocity = tuple(state["velocity"][i])
+            body.angular_velocity = state["angular_velocity"][i]
+            if state["sleeping"][i]:
+                body.sleep()
+            else:
+                body.activate()
+
+    def replay(self, dt: float) -> None:
+        """Advances the replay of the baked trajectory by ``dt``. Once the
+        end is reached, the space continues simulating live from where the
+        recording stopped.
+        """
+        self.replay_time += dt
+        trajectory = self.trajectory
+        positions, angles = trajectory.state_at(self.replay_time)
+        self._apply_state(np.arange(trajectory.n_bodies), positions, angles)
+        if self.replay_time >= trajectory.duration:
+            self.trajectory = None
+            self.step(self.replay_time - trajectory.duration)
+            self.sync()
+
+    def step(self, dt: float) -> None:
+        """Advances the simulation by ``dt``.
+
+        With a fixed ``timestep``, ``dt`` is added to an accumulator which is
+        then consumed in whole steps. The remainder carries over to the next
+        frame.
+        """
+        if self.timestep is None:
+            self._advance(dt)
+            return
+        self.accumulator += dt
+        # Allow for rounding errors when the timestep equals the frame time.
+        while self.accumulator >= self.timestep * (1 - 1e-6):
+            self._advance(self.timestep)
+            self.accumulator -= self.timestep
+
+    def step_pipelined(self, dt: float) -> None:
+        """Advances the simulation by ``dt`` using frames computed ahead on a
+        worker thread, so that stepping the space overlaps with rendering.
+
+        The worker is started for the next ``pipeline_frames`` frames, which
+        :class:`~SpaceScene` sets to the length of the current animation.
+        Frames of a different duration, and frames beyond those, are
+        simulated on the calling thread instead.
+        """
+        if dt == 0:
+            return
+        frame_dt = 1 / config.frame_rate
+        if self.producer is None and self.pipeline_frames and np.isclose(dt, frame_dt):
+            self.producer = _PhysicsProducer(
+                self, frame_dt, self.pipeline_frames, self.pipeline_depth
+            )
+            self.pipeline_frames = 0
+        if self.producer is not None and np.isclose(dt, self.producer.dt):
+            body_state = self.producer.get()
+            if body_state is not None:
+                self._apply_state(*body_state)
+                return
+        self.stop_producer()
+        self.step(dt)
+        self.sync()
+
+    def stop_producer(self) -> None:
+        """Waits for the worker of :meth:`step_pipelined` to finish, and
+        rewinds the space to the last frame that was displayed if the worker
+        went past it. Anything but the worker must only touch the pymunk
+        space after this.
+        """
+        if self.producer is None:
+            return
+        producer, self.producer = self.producer, None
+        if producer.stop():
+            self._rewind(
+                producer.start_state, producer.time, producer.accumulator, producer.dt
+            )
+
+    def _rewind(
+        self, state: SpaceState, time: float, accumulator: float, dt: float
+    ) -> None:
+        # Simulates again from the latest checkpoint since ``state``, with
+        # the same steps as before, so that the result is identical.
+        later = [c for c in self.checkpoints if state.time <= c.time <= time]
+        self.restore_state(later[-1] if later else state)
+        step = self.timestep or dt
+        for _ in range(round((time - self.time) / step)):
+            self._advance(step)
+        self.accumulator = accumulator
+        self.sync()
+
+    def tune_spatial_hash(self) -> None:
+        """Sizes the spatial hash for the current shapes of the space, filling
+        in the parameters that were not given.
+        """
+        shapes = self.space.shapes
+        self._hashed_shapes = len(shapes)
+        dim = self.spatial_hash_dim
+        if dim is None:
+            dynamic = [
+                shape for shape in shapes if shape.body.body_type == pymunk.Body.DYNAMIC
+            ] or shapes
+            sizes = [
+                max(bb.right - bb.left, bb.top - bb.bottom)
+                for bb in (shape.cache_bb() for shape in dynamic)
+            ]
+            dim = float(np.median(sizes)) if sizes else 1
+        count = self.spatial_hash_count or max(10 * len(shapes), 1000)
+        self.space.use_spatial_hash(max(dim, 1e-3), count)
+
+    def _advance(self, dt: float) -> None:
+        if self.spatial_hash and len(self.space.shapes) != self._hashed_shapes:
+            self.tune_spatial_hash()
+        if self.checkpoint_interval is not None and (
+            not self.checkpoints
+            or self._checkpoint_index(self.time)
+            > self._checkpoint_index(self.checkpoints[-1].time)
+        ):
+            self.checkpoints.append(self.capture_state())
+        for _ in range(self.substeps):
+            self.space.step(dt / self.substeps)
+        self.time += dt
+
+    def _checkpoint_index(self, t: float) -> int:
+        # Tolerates rounding errors in the accumulated time.
+        return int(np.floor(t / self.checkpoint_interval + 1e-6))
+
+    def capture_state(self) -> SpaceState:
+        """Captures the full physics state, to be restored later with
+        :meth:`restore_state`.
+        """
+        return SpaceState(self)
+
+    def restore_state(self, state: SpaceState) -> None:
+        """Puts the space back into a captured state. Bodies, shapes and
+        constraints added since are removed from the space, and removed ones
+        are added back. Rigid mobjects registered since are no longer
+        synchronized.
+        """
+        self.stop_producer()
+        space = self.space
+        bodies, shapes, constraints = (
+            set(state.bodies),
+            set(state.shapes),
+            set(state.constraints),
+        )
+        space.remove(*[c for c in space.constraints if c not in constraints])
+        space.remove(*[s for s in space.shapes if s not in shapes])
+        space.remove(*[b for b in space.bodies if b not in bodies])
+        current = set(space.bodies) | set(space.shapes) | set(space.constraints)
+        space.add(*[b for b in state.bodies if b not in current])
+        space.add(*[s for s in state.shapes if s not in current])
+        space.add(*[c for c in state.constraints if c not in current])
+
+        for body, body_state in zip(state.bodies, state.body_states):
+            position, angle, velocity, angular_velocity, force, torque, _ = body_state
+            body.position = position
+            body.angle = angle
+            body.velocity = velocity
+            body.angular_velocity = angular_velocity
+            body.force = force
+            body.torque = torque
+        for constraint, constraint_state in zip(
+            state.constraints, state.constraint_states
+        ):
+            for attribute, value in constraint_state.items():
+                setattr(constraint, attribute, value)
+        for body, body_state in zip(state.bodies, state.body_states):
+            if body_state[-1]:
+                body.sleep()
+            else:
+                body.activate()
+
+        n = len(state.rigid_mobjects)
+        self.rigid_mobjects = list(state.rigid_mobjects)
+        self.bodies = list(state.synced_bodies)
+        self.particle_systems = []
+        self._is_particle = np.zeros(n, dtype=bool)
+        for system, start, system_bodies, system_shapes in state.particle_systems:
+            system.bodies = list(system_bodies)
+            system.shapes = list(system_shapes)
+            self.particle_systems.append((system, start))
+            self._is_particle[start : start + len(system.bodies)] = True
+        self.revision += 1
+        # Every mobject is redrawn below, from the angle it is drawn at.
+        self._synced_positions = np.full((n, 2), np.nan)
+        self._synced_angles = np.array(
+            [getattr(mob, "angle", 0) for mob in self.rigid_mobjects], dtype=float
+        )
+        self.time = state.time
+        self.accumulator = state.accumulator
+        self.trajectory = None
+        # Later checkpoints belong to the timeline being abandoned.
+        self.checkpoints = [c for c in self.checkpoints if c.time <= state.time]
+        self._apply_state(*self._gather())
+
+    def seek(self, t: float, timestep: Optional[float] = None) -> None:
+        """Brings the simulation to time ``t`` by restoring the latest
+        checkpoint before it and simulating only the remaining time.
+
+        Parameters
+        ----------
+        t
+            The simulated time to seek to.
+        timestep
+            The step used to simulate from the checkpoint to ``t``. Defaults
+            to the space's ``timestep``, or else the duration of a frame.
+        """
+        self.stop_producer()
+        earlier = [state for state in self.checkpoints if state.time <= t + 1e-9]
+        if earlier:
+            self.restore_state(earlier[-1])
+        elif t < self.time:
+            raise ValueError(f"No checkpoint to seek back to t={t} from.")
+        timestep = timestep or self.timestep or 1 / config.frame_rate
+        while self.time < t - 1e-9:
+            self._advance(min(timestep, t - self.time))
+        self.sync()
 
 
 class SpaceScene(Scene):
     GRAVITY: Tuple[float, float] = 0, -9.81
+    TIMESTEP: Optional[float] = None
+    SUBSTEPS: int = 1
+    CACHE_DIR: Optional[str] = None
+    CACHE_SIZE: int = 2**30
+    CHECKPOINT_INTERVAL: Optional[float] = None
+    PIPELINE: bool = False
+    PIPELINE_DEPTH: int = 8
+    THREADS: int = 1
+    ITERATIONS: Optional[int] = None
+    COLLISION_SLOP: Optional[float] = None
+    SPATIAL_HASH: bool = False
+    SPATIAL_HASH_DIM: Optional[float] = None
+    SPATIAL_HASH_COUNT: Optional[int] = None
+    KILL_REGION: Optional[Tuple[float, float, float, float]] = None
 
     def __init__(self, renderer=None, **kwargs):
         """A basis scene for all of rigid mechanics. The gravity vector
         can be adjusted with ``self.GRAVITY``.
+
+        The physics is stepped once per frame by default. Setting
+        ``self.TIMESTEP`` steps it at that fixed interval instead, and
+        ``self.SUBSTEPS`` splits every step into smaller ones.
+
+        Baked trajectories are cached in ``self.CACHE_DIR``, by default
+        ``physics_cache`` inside the media directory, which is kept below
+        ``self.CACHE_SIZE`` bytes.
+
+        With ``self.CHECKPOINT_INTERVAL`` set, the physics state is captured
+        periodically, so that :meth:`seek` only simulates from the latest
+        checkpoint.
+
+        Setting ``self.PIPELINE`` steps the physics on a worker thread, up to
+        ``self.PIPELINE_DEPTH`` frames ahead of rendering. The worker only
+        runs during animations, so bodies can be changed freely between them.
+
+        For scenes with many bodies, the solver is tuned with
+        ``self.THREADS``, ``self.ITERATIONS`` and ``self.COLLISION_SLOP``, and
+        ``self.SPATIAL_HASH`` switches the broadphase to a spatial hash, sized
+        automatically unless ``self.SPATIAL_HASH_DIM`` and
+        ``self.SPATIAL_HASH_COUNT`` are set. See :class:`~Space`.
+
+        Sleeping bodies are not synchronized. Bodies that leave
+        ``self.KILL_REGION``, given as ``(left, bottom, right, top)``, are
+        removed from the simulation and their mobjects from the scene, so
+        that debris does not slow down long scenes.
         """
-        self.space = Space(gravity=self.GRAVITY)
+        self.space = Space(
+            gravity=self.GRAVITY,
+            timestep=self.TIMESTEP,
+            substeps=self.SUBSTEPS,
+            checkpoint_interval=self.CHECKPOINT_INTERVAL,
+            pipeline_depth=self.PIPELINE_DEPTH if self.PIPELINE else None,
+            threads=self.THREADS,
+            iterations=self.ITERATIONS,
+            collision_slop=self.COLLISION_SLOP,
+            spatial_hash=self.SPATIAL_HASH,
+            spatial_hash_dim=self.SPATIAL_HASH_DIM,
+            spatial_hash_count=self.SPATIAL_HASH_COUNT,
+            kill_region=self.KILL_REGION,
+        )
         super().__init__(renderer=renderer, **kwargs)
 
     def setup(self):
         """Used internally"""
         self.add(self.space)
         self.space.add_updater(_step)
+        self.space.on_retire = self._remove_retired
+
+    def _remove_retired(self, mobs: List[Mobject]) -> None:
+        self.remove(*mobs)
+        # Stop drawing them during the current animation as well.
+        removed = {m for mob in mobs for m in mob.get_family()}
+        self.moving_mobjects = [m for m in self.moving_mobjects if m not in removed]
+
+    def tear_down(self):
+        """Used internally"""
+        self.space.stop_producer()
+
+    def compile_animation_data(self, *args, **kwargs):
+        result = super().compile_animation_data(*args, **kwargs)
+        # The number of frames with a nonzero duration in ``play_internal``.
+        times = np.arange(0, self.duration, 1 / config.frame_rate)
+        self.space.pipeline_frames = max(len(times) - 1, 0)
+        return result
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        # The code between animations may change the bodies.
+        self.space.stop_producer()
 
     def add_body(self, body: Mobject):
         """Bodies refer to pymunk's object.
         This method ties Mobjects to their Bodies.
         """
+        self.space.stop_producer()
         if body.body != self.space.space.static_body:
             self.space.space.add(body.body)
-        self.space.space.add(body.shape)
+        self.space.space.add(*getattr(body, "shapes", [body.shape]))
 
     def make_rigid_body(
         self,
@@ -152,18 +911,33 @@ class SpaceScene(Scene):
                     mob.angle = 0
                 mob.body.angle = mob.angle
                 get_shape(mob)
-                mob.shape.density = density
-                mob.shape.elasticity = elasticity
-                mob.shape.friction = friction
+                for shape in mob.shapes:
+                    shape.density = density
+                    shape.elasticity = elasticity
+                    shape.friction = friction
                 mob.spacescene = self
 
                 self.add_body(mob)
-                mob.add_updater(_simulate)
+                self.space.add_rigid_mobject(mob)
 
             else:
                 if mob.body.is_sleeping:
                     mob.body.activate()
 
+    def add_particles(self, *systems: ParticleSystem) -> None:
+        """Adds particle systems to the scene and simulates their bodies.
+
+        Parameters
+        ----------
+        systems
+            The :class:`~.ParticleSystem` instances to add.
+        """
+        self.space.stop_producer()
+        for system in systems:
+            self.space.space.add(*system.bodies, *system.shapes, *system.constraints)
+            self.space.add_particle_system(system)
+        self.add(*systems)
+
     def make_static_body(
         self, *mobs: Mobject, elasticity: float = 1, friction: float = 0.8
     ) -> None:
@@ -183,21 +957,127 @@ class SpaceScene(Scene):
                 return self.make_static_body(*mob)
             mob.body = self.space.space.static_body
             get_shape(mob)
-            mob.shape.elasticity = elasticity
-            mob.shape.friction = friction
+            for shape in mob.shapes:
+                shape.elasticity = elasticity
+                shape.friction = friction
             self.add_body(mob)
 
+    def bake(
+        self, duration: float, timestep: Optional[float] = None, cache: bool = True
+    ) -> Trajectory:
+        """Simulate the rigid bodies ``duration`` seconds ahead and replay
+        the recording while rendering, instead of stepping the physics live.
+        Call it after all bodies are set up.
+
+        Parameters
+        ----------
+        duration
+            The simulated time to record.
+        timestep
+            The time between recorded frames. Defaults to ``self.TIMESTEP``,
+            or else the duration of a frame.
+        cache
+            Whether to reuse a recording of the same simulation from an
+            earlier render, and store this one for later renders.
+
+        Examples
+        --------
+        .. manim:: BakedObjectsFalling
+            :quality: low
+
+            from manim_physics import *
+
+            class BakedObjectsFalling(SpaceScene):
+                def construct(self):
+                    balls = VGroup(
+                        *[Circle(0.2, fill_opacity=1).shift(UP * i) for i in range(3)]
+                    )
+                    ground = Line([-4, -3.5, 0], [4, -3.5, 0])
+                    self.add(ground)
+                    self.make_rigid_body(*balls)
+                    self.make_static_body(ground)
+                    self.bake(5)
+                    self.wait(5)
+        """
+        if cache:
+            directory = self.CACHE_DIR or Path(config.media_dir) / "physics_cache"
+            cache = TrajectoryCache(directory, self.CACHE_SIZE)
+        else:
+            cache = None
+        return self.space.bake(duration, timestep, cache)
+
+    def capture_state(self) -> SpaceState:
+        """Capture the full physics state, including velocities, constraints
+        and sleeping bodies, to restore it later with :meth:`restore_state`.
+        """
+        self.space.stop_producer()
+        return self.space.capture_state()
+
+    def restore_state(self, state: SpaceState) -> None:
+        """Restore a physics state captured with :meth:`capture_state`.
+        Rigid mobjects made since are removed from the scene, and those
+        retired since are added back.
+
+        Examples
+        --------
+        .. manim:: BranchingSimulation
+            :quality: low
+
+            from manim_physics import *
+
+            class BranchingSimulation(SpaceScene):
+                def construct(self):
+                    ball = Circle(0.3, fill_opacity=1).shift(UP * 2)
+                    ground = Line([-4, -3.5, 0], [4, -3.5, 0])
+                    self.add(ground)
+                    self.make_rigid_body(ball)
+                    self.make_static_body(ground)
+                    self.wait()
+                    state = self.capture_state()
+                    self.wait(2)
+                    self.restore_state(state)
+                    ball.body.velocity = (3, 0)
+                    self.wait(2)
+        """
+        kept = set(state.rigid_mobjects)
+        current = set(self.space.rigid_mobjects)
+        removed = [mob for mob in current if mob not in kept]
+        retired = [
+            mob for mob in dict.fromkeys(state.rigid_mobjects) if mob not in current
+        ]
+        self.space.restore_state(state)
+        self.remove(*removed)
+        self.add(*retired)
+
+    def seek(self, t: float) -> None:
+        """Jump the simulation to the simulated time ``t``, starting from the
+        latest checkpoint before it. See ``self.CHECKPOINT_INTERVAL``.
+        """
+        self.space.seek(t)
+
     def stop_rigidity(self, *mobs: Mobject) -> None:
         """Stop the mobjects rigidity"""
+        self.space.stop_producer()
         for mob in mobs:
             if isinstance(mob, VGroup or Group):
                 self.stop_rigidity(*mob)
             if hasattr(mob, "body"):
                 mob.body.sleep()
+            if isinstance(mob, ParticleSystem):
+                for body in mob.bodies:
+                    body.sleep()
 
 
 def _step(space, dt):
-    space.space.step(dt)
+    if space.trajectory is not None:
+        space.replay(dt)
+    elif space.pipeline_depth:
+        space.step_pipelined(dt)
+        space.retire_escaped()
+    else:
+        space.step(dt)
+        space.sync()
+        space.retire_escaped()
 
 
 def _simulate(b):
@@ -207,8 +1087,16 @@ def _simulate(b):
     b.angle = b.body.angle
 
 
-def get_shape(mob: VMobject) -> None:
-    """Obtains the shape of the body from the mobject"""
+def get_shape(mob: VMobject, tolerance: float = 0.01) -> None:
+    """Obtains the shape of the body from the mobject.
+
+    Circles, lines, rectangles and convex polygons get a single exact shape.
+    The outline of any other ``VMobject`` is flattened to ``tolerance``.
+    Its closed subpaths are split into convex pieces, and its open subpaths,
+    such as arcs, become chains of segments as thick as a line of the same
+    stroke width. All of them are stored in ``mob.shapes``. Other mobjects
+    get a box.
+    """
     if isinstance(mob, Circle):
         mob.shape = pymunk.Circle(body=mob.body, radius=mob.radius)
     elif isinstance(mob, Line):
@@ -222,20 +1110,159 @@ def get_shape(mob: VMobject) -> None:
         width = np.linalg.norm(mob.get_vertices()[1] - mob.get_vertices()[0])
         height = np.linalg.norm(mob.get_vertices()[2] - mob.get_vertices()[1])
         mob.shape = pymunk.Poly.create_box(mob.body, (width, height))
-    elif issubclass(type(mob), Polygram):
+    elif issubclass(type(mob), Polygram) and _is_convex(mob.get_vertices()):
         vertices = [(a, b) for a, b, _ in mob.get_vertices() - mob.get_center()]
         mob.shape = pymunk.Poly(mob.body, vertices)
+    elif isinstance(mob, VMobject):
+        parts, paths = _decompose_outline(mob, tolerance)
+        radius = max(mob.stroke_width - 3.95, 0)
+        shapes = [pymunk.Poly(mob.body, part.tolist()) for part in parts] + [
+            pymunk.Segment(mob.body, tuple(start), tuple(end), radius)
+            for path in paths
+            for start, end in zip(path, path[1:])
+        ]
+        if shapes:
+            mob.shapes = shapes
+            mob.shape = shapes[0]
+            return
+        mob.shape = pymunk.Poly.create_box(mob.body, (mob.width, mob.height))
     else:
         mob.shape = pymunk.Poly.create_box(mob.body, (mob.width, mob.height))
+    mob.shapes = [mob.shape]
+
+
+# Convex pieces and open paths of the outlines decomposed by
+# ``_decompose_outline``, keyed by a hash of the outline in body coordinates
+# and the tolerance.
+_CONVEX_PARTS_CACHE: Dict[str, Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+_CONVEX_PARTS_CACHE_SIZE = 1024
+
+
+def _is_convex(vertices: np.ndarray) -> bool:
+    edges = np.roll(vertices[:, :2], -1, axis=0) - vertices[:, :2]
+    following = np.roll(edges, -1, axis=0)
+    turns = edges[:, 0] * following[:, 1] - edges[:, 1] * following[:, 0]
+    return bool(np.all(turns >= -1e-9) or np.all(turns <= 1e-9))
+
+
+def _flatten_outline(
+    mob: VMobject, tolerance: float
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """Returns the closed and the open subpaths of ``mob`` and its
+    submobjects as polylines that deviate from the curves by at most
+    ``tolerance``. Closed polylines do not repeat their first point.
+    """
+    rings, paths = [], []
+    for submob in mob.family_members_with_points():
+        if not isinstance(submob, VMobject):
+            continue
+        degree = submob.n_points_per_curve - 1
+        for subpath in submob.get_subpaths():
+            curves = subpath[:, :2].reshape(-1, degree + 1, 2)
+            # The distance between a bezier curve and its chord is bounded by
+            # its second differences.
+            second = np.diff(curves, n=2, axis=1)
+            deviation = np.max(np.linalg.norm(second, axis=2), initial=0)
+            samples = int(
+                np.ceil(np.sqrt(degree * (degree - 1) * deviation / 8 / tolerance))
+            )
+            t = np.linspace(0, 1, max(samples, 1) + 1)[:-1, None]
+            basis = np.hstack(
+                [
+                    choose(degree, k) * t**k * (1 - t) ** (degree - k)
+                    for k in range(degree + 1)
+                ]
+            )
+            ring = np.einsum("sk,ckd->csd", basis, curves).reshape(-1, 2)
+            if not np.allclose(subpath[0], subpath[-1]):
+                paths.append(np.vstack([ring, subpath[-1:, :2]]))
+            elif len(ring) >= 3:
+                rings.append(ring)
+    return rings, paths
+
+
+def _split_holes(polygon: gm.Polygon) -> List[gm.Polygon]:
+    """Cuts ``polygon`` into pieces without holes."""
+    if not polygon.interiors:
+        return [polygon]
+    x = gm.Polygon(polygon.interiors[0]).representative_point().x
+    min_x, min_y, max_x, max_y = polygon.bounds
+    pieces = []
+    for half in (
+        gm.box(min_x - 1, min_y - 1, x, max_y + 1),
+        gm.box(x, min_y - 1, max_x + 1, max_y + 1),
+    ):
+        piece = polygon.intersection(half)
+        for part in getattr(piece, "geoms", [piece]):
+            if isinstance(part, gm.Polygon) and not part.is_empty:
+                pieces += _split_holes(part)
+    return pieces
+
+
+def _decompose_outline(
+    mob: VMobject, tolerance: float
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """Decomposes the closed subpaths of ``mob`` into convex polygons, and
+    returns them with its open subpaths as polylines, all in the coordinates
+    of ``mob.body``.
+
+    Outlines that are the same in body coordinates share a cached result.
+    Since ``get_angle`` measures no angle for outlines other than rectangles
+    and lines, copies that were only moved share it, but rotated copies are
+    decomposed again.
+    """
+    body = mob.body
+    c, s = np.cos(body.angle), np.sin(body.angle)
+    rotation = np.array([[c, -s], [s, c]])
+    # Adding zero turns negative zeros into the same bytes as zeros.
+    rings, paths = (
+        [np.round((line - tuple(body.position)) @ rotation, 6) + 0.0 for line in lines]
+        for lines in _flatten_outline(mob, tolerance)
+    )
+    sha = hashlib.sha256(np.array(tolerance).tobytes())
+    for lines in (rings, paths):
+        sha.update(np.array(len(lines)).tobytes())
+        for line in lines:
+            sha.update(np.array(len(line)).tobytes())
+            sha.update(line.tobytes())
+    key = sha.hexdigest()
+    if key in _CONVEX_PARTS_CACHE:
+        return _CONVEX_PARTS_CACHE[key]
+
+    # Nested subpaths alternate between filled areas and holes.
+    polygons = [gm.Polygon(ring).buffer(0) for ring in rings]
+    area = reduce(lambda a, b: a.symmetric_difference(b), polygons, gm.Polygon())
+    parts = []
+    for polygon in getattr(area, "geoms", [area]):
+        if not isinstance(polygon, gm.Polygon) or polygon.area < tolerance**2:
+            continue
+        for piece in _split_holes(polygon.simplify(tolerance / 2)):
+            outline = list(orient(piece, 1.0).exterior.coords)
+            if len(outline) < 4 or piece.area < tolerance**2:
+                continue
+            for hull in convex_decomposition(outline, tolerance):
+                hull = np.array(hull[:-1])
+                if len(hull) >= 3:
+                    parts.append(hull)
+
+    if len(_CONVEX_PARTS_CACHE) >= _CONVEX_PARTS_CACHE_SIZE:
+        del _CONVEX_PARTS_CACHE[next(iter(_CONVEX_PARTS_CACHE))]
+    _CONVEX_PARTS_CACHE[key] = parts, paths
+    return parts, paths
 
 
 def get_angle(mob: VMobject) -> None:
     """Obtains the angle of the body from the mobject.
     Used internally for updaters.
+
+    Rectangles are measured by their top edge, which is horizontal when
+    unrotated. Other polygons are taken to be unrotated as they are, since
+    their shapes are built from their current vertices.
     """
-    if issubclass(type(mob), Polygon):
-        vec1 = mob.get_vertices()[0] - mob.get_vertices()[1]
-        vec2 = type(mob)().get_vertices()[0] - type(mob)().get_vertices()[1]
-        mob.angle = angle_between_vectors(vec1, vec2)
+    if issubclass(type(mob), Rectangle):
+        edge = mob.get_vertices()[0] - mob.get_vertices()[1]
+        mob.angle = np.arctan2(edge[1], edge[0])
+    elif issubclass(type(mob), Polygon):
+        mob.angle = 0
     elif isinstance(mob, Line):
         mob.angle = mob.get_angle()
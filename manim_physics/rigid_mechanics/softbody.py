@@ -0,0 +1,193 @@
+r"""Soft bodies.
+
+A :class:`~SoftBody` is a lattice of small rigid bodies held together by
+damped springs, simulated with the :py:mod:`~rigid_mechanics` feature. It
+bends, stretches and wobbles like cloth or jelly.
+
+"""
+
+from __future__ import annotations
+from itertools import count
+from typing import Iterable, Tuple
+
+from manim.constants import ORIGIN
+from manim.mobject.types.vectorized_mobject import VMobject
+import numpy as np
+import pymunk
+
+from ..utils import polyline_points
+from .particles import ParticleSystem
+
+__all__ = ["SoftBody"]
+
+
+# Collision groups keeping the nodes of a soft body from colliding with each
+# other.
+_GROUPS = count(1)
+
+
+class SoftBody(ParticleSystem):
+    def __init__(
+        self,
+        width: float = 3,
+        height: float = 2,
+        rows: int = 8,
+        columns: int = 12,
+        center: np.ndarray = ORIGIN,
+        node_radius: float = 0.05,
+        node_mass: float = 0.1,
+        stiffness: float = 200,
+        damping: float = 2,
+        shear: bool = True,
+        pinned: Iterable[Tuple[int, int]] = (),
+        elasticity: float = 0.2,
+        friction: float = 0.8,
+        spring_style: dict = {"stroke_width": 1},
+        **kwargs,
+    ) -> None:
+        """A rectangular lattice of nodes joined by damped springs to their
+        horizontal and vertical neighbours, and optionally their diagonal
+        ones to resist shearing.
+
+        All springs are drawn as one mobject and the filled outline of the
+        lattice as another, both rewritten from the node positions in a
+        single pass per frame. The lattice connectivity is computed once as
+        arrays of node indices.
+
+        Parameters
+        ----------
+        width
+            The initial width of the lattice.
+        height
+            The initial height of the lattice.
+        rows
+            The number of rows of nodes.
+        columns
+            The number of columns of nodes.
+        center
+            The initial center of the lattice.
+        node_radius
+            The radius of the collision shape of every node.
+        node_mass
+            The mass of every node.
+        stiffness
+            The spring constant of every spring.
+        damping
+            The damping of every spring.
+        shear
+            Whether to add diagonal springs.
+        pinned
+            The ``(row, column)`` of the nodes that are held in place.
+        elasticity
+            The elasticity of every node.
+        friction
+            The friction of every node.
+        spring_style
+            Parameters for the ``VMobject`` of the springs.
+        kwargs
+            Additional parameters for the ``VMobject`` of the outline.
+
+        Examples
+        --------
+        .. manim:: SoftBodyExample
+            :quality: low
+
+            from manim_physics import *
+
+            class SoftBodyExample(SpaceScene):
+                def construct(self):
+                    jelly = SoftBody(
+                        center=LEFT * 2 + DOWN,
+                        color=GREEN,
+                        fill_opacity=0.5,
+                    )
+                    cloth = SoftBody(
+                        width=4,
+                        rows=10,
+                        columns=20,
+                        center=UP * 3,
+                        pinned=[(0, 0), (0, 19)],
+                        shear=False,
+                        color=BLUE,
+                        fill_opacity=0.3,
+                    )
+                    ground = Line([-4, -3.5, 0], [4, -3.5, 0])
+                    self.add(ground)
+                    self.make_static_body(ground)
+                    self.add_particles(jelly, cloth)
+                    self.wait(5)
+        """
+        grid = np.arange(rows * columns).reshape(rows, columns)
+        pairs = [
+            (grid[:, :-1], grid[:, 1:]),
+            (grid[:-1], grid[1:]),
+        ]
+        if shear:
+            pairs += [
+                (grid[:-1, :-1], grid[1:, 1:]),
+                (grid[:-1, 1:], grid[1:, :-1]),
+            ]
+        self.spring_indices = np.concatenate(
+            [np.stack([a.ravel(), b.ravel()], axis=1) for a, b in pairs]
+        )
+        self.outline_indices = np.concatenate(
+            [
+                grid[0],
+                grid[1:, -1],
+                grid[-1, -2::-1],
+                grid[-2::-1, 0],
+            ]
+        )
+        self.spring_lines = VMobject(**spring_style)
+
+        x = np.linspace(-width / 2, width / 2, columns) + center[0]
+        y = np.linspace(height / 2, -height / 2, rows) + center[1]
+        positions = np.stack(np.meshgrid(x, y), axis=-1).reshape(-1, 2)
+        super().__init__(
+            positions,
+            radius=node_radius,
+            mass=node_mass,
+            elasticity=elasticity,
+            friction=friction,
+            **kwargs,
+        )
+        self.add(self.spring_lines)
+
+        shape_filter = pymunk.ShapeFilter(group=next(_GROUPS))
+        for shape in self.shapes:
+            shape.filter = shape_filter
+        for row, column in pinned:
+            self.bodies[grid[row, column]].body_type = pymunk.Body.KINEMATIC
+        for i, j in self.spring_indices:
+            a, b = self.bodies[i], self.bodies[j]
+            self.constraints.append(
+                pymunk.DampedSpring(
+                    a,
+                    b,
+                    (0, 0),
+                    (0, 0),
+                    np.linalg.norm(positions[i] - positions[j]),
+                    stiffness,
+                    damping,
+                )
+            )
+
+    def _select_retired(self, escaped: np.ndarray) -> np.ndarray:
+        # Retiring single nodes would tear the lattice apart.
+        return np.full_like(escaped, escaped.all())
+
+    def move_particles(self, positions: np.ndarray) -> None:
+        """Moves the springs and outline to the node ``positions``, an array
+        of shape ``(nodes, 2)``, by rewriting their points in one pass each.
+        """
+        if not len(positions):
+            self.points = np.zeros((0, 3))
+            self.spring_lines.points = np.zeros((0, 3))
+            return
+        nodes = np.zeros((len(positions), 3))
+        nodes[:, :2] = positions
+        self.spring_lines.points = polyline_points(
+            nodes[self.spring_indices], out=self.spring_lines.points
+        )
+        outline = nodes[np.append(self.outline_indices, self.outline_indices[0])]
+        self.points = polyline_points(outline[None], out=self.points)
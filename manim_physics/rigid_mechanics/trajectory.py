@@ -0,0 +1,284 @@
+"""Baked rigid body trajectories.
+
+A :class:`~Trajectory` holds the positions and angles of every rigid body of
+a :class:`~.SpaceScene`, recorded at a fixed timestep by
+:meth:`~.SpaceScene.bake`. Rendering then replays the recording instead of
+stepping the physics.
+
+Baked trajectories are stored in a :class:`~TrajectoryCache`, keyed by a hash
+of everything that determines the simulation, so that rendering the same
+scene again skips the simulation altogether.
+
+.. note::
+    Python callbacks attached to pymunk objects, such as collision handlers
+    or custom velocity functions, are not part of the key. Pass
+    ``cache=False`` to :meth:`~.SpaceScene.bake` for scenes using them.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+from pathlib import Path
+import shutil
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pymunk
+
+__all__ = ["Trajectory", "TrajectoryCache"]
+
+
+class Trajectory:
+    def __init__(
+        self,
+        positions: np.ndarray,
+        angles: np.ndarray,
+        timestep: float,
+    ) -> None:
+        """The recorded motion of a set of bodies.
+
+        Parameters
+        ----------
+        positions
+            An array of shape ``(frames, bodies, 2)``.
+        angles
+            An array of shape ``(frames, bodies)``.
+        timestep
+            The time between two recorded frames.
+        """
+        self.positions = positions
+        self.angles = angles
+        self.timestep = timestep
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def n_bodies(self) -> int:
+        """The number of recorded bodies."""
+        return self.positions.shape[1]
+
+    @property
+    def duration(self) -> float:
+        """The time spanned by the recording."""
+        return (len(self) - 1) * self.timestep
+
+    def state_at(self, t: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the positions and angles of all bodies at time ``t``,
+        interpolating linearly between recorded frames. Times outside the
+        recording are clamped to its ends.
+        """
+        if len(self) == 1:
+            return self.positions[0].astype(float), self.angles[0].astype(float)
+        frame = np.clip(t / self.timestep, 0, len(self) - 1)
+        i = min(int(frame), len(self) - 2)
+        alpha = frame - i
+        positions = (1 - alpha) * self.positions[i] + alpha * self.positions[i + 1]
+        angles = (1 - alpha) * self.angles[i] + alpha * self.angles[i + 1]
+        return positions.astype(float), angles.astype(float)
+
+
+# Attributes of pymunk constraints that take part in the cache key, where
+# present.
+_CONSTRAINT_ATTRIBUTES = (
+    "anchor_a",
+    "anchor_b",
+    "distance",
+    "rest_length",
+    "stiffness",
+    "damping",
+    "min",
+    "max",
+    "phase",
+    "ratchet",
+    "ratio",
+    "rate",
+    "max_force",
+    "max_bias",
+    "error_bias",
+    "collide_bodies",
+)
+
+
+class TrajectoryCache:
+    def __init__(self, directory: str | Path, max_size: int = 2**30) -> None:
+        """An on-disk store of baked trajectories.
+
+        Every entry is a directory named after its key, holding the recorded
+        frames as ``.npy`` files. They are opened memory-mapped, so long
+        recordings are read frame by frame during replay instead of being
+        loaded at once.
+
+        Parameters
+        ----------
+        directory
+            Where the trajectories are stored.
+        max_size
+            The total size in bytes above which the least recently used
+            trajectories are deleted.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def key(
+        space: pymunk.Space,
+        bodies: list,
+        frames: int,
+        timestep: float,
+        substeps: int,
+        spatial_hash: Optional[Tuple[Optional[float], Optional[int]]] = None,
+    ) -> str:
+        """Hashes everything that determines a baked simulation: the state
+        and shapes of all bodies, their materials, the constraints, the
+        parameters of the space and its solver threads, the broadphase, the
+        timestep and the pymunk version.
+
+        ``spatial_hash`` holds the cell size and count of the spatial hash,
+        either of which may be ``None`` when tuned automatically, or is
+        ``None`` for pymunk's default broadphase.
+        """
+        sha = hashlib.sha256()
+
+        def update(*values) -> None:
+            sha.update(np.array(values, dtype=float).tobytes())
+
+        sha.update(pymunk.version.encode())
+        update(frames, timestep, substeps)
+        update(
+            *space.gravity,
+            space.damping,
+            space.iterations,
+            space.collision_slop,
+            space.collision_bias,
+            space.sleep_time_threshold,
+            space.idle_speed_threshold,
+            space.threads,
+        )
+        if spatial_hash is None:
+            update(-1)
+        else:
+            update(*[np.nan if value is None else value for value in spatial_hash])
+        index = {body: i for i, body in enumerate(space.bodies)}
+        index[space.static_body] = -1
+        update(*[index.get(body, -2) for body in bodies])
+        for body in space.bodies:
+            update(
+                body.body_type,
+                *body.position,
+                body.angle,
+                *body.velocity,
+                body.angular_velocity,
+                body.mass,
+                body.moment,
+                body.is_sleeping,
+            )
+        for shape in space.shapes:
+            sha.update(type(shape).__name__.encode())
+            if isinstance(shape, pymunk.Circle):
+                geometry = (shape.radius, *shape.offset)
+            elif isinstance(shape, pymunk.Segment):
+                geometry = (shape.radius, *shape.a, *shape.b)
+            elif isinstance(shape, pymunk.Poly):
+                geometry = (shape.radius, *np.ravel(shape.get_vertices()))
+            else:
+                geometry = ()
+            update(
+                index.get(shape.body, -2),
+                *geometry,
+                shape.elasticity,
+                shape.friction,
+                shape.density,
+                shape.sensor,
+                shape.collision_type,
+                *shape.surface_velocity,
+            )
+        for constraint in space.constraints:
+            sha.update(type(constraint).__name__.encode())
+            update(index.get(constraint.a, -2), index.get(constraint.b, -2))
+            for attribute in _CONSTRAINT_ATTRIBUTES:
+                if hasattr(constraint, attribute):
+                    value = getattr(constraint, attribute)
+                    update(*np.ravel(value))
+        return sha.hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple[Trajectory, Dict[str, np.ndarray]]]:
+        """Opens a stored trajectory and the full state of its bodies at the
+        end of the recording, or returns ``None`` if it is not cached.
+        """
+        path = self.directory / key
+        if not path.is_dir():
+            return None
+        os.utime(path)
+        with np.load(path / "final.npz") as final:
+            final_state = dict(final)
+        trajectory = Trajectory(
+            np.load(path / "positions.npy", mmap_mode="r"),
+            np.load(path / "angles.npy", mmap_mode="r"),
+            float(final_state.pop("timestep")),
+        )
+        return trajectory, final_state
+
+    def create(
+        self, key: str, frames: int, bodies: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Creates memory-mapped arrays to record a trajectory into. They
+        are only visible to :meth:`load` once :meth:`store` is called.
+        """
+        path = self._staging_path(key)
+        path.mkdir(parents=True, exist_ok=True)
+        positions = np.lib.format.open_memmap(
+            path / "positions.npy", "w+", np.float32, (frames, bodies, 2)
+        )
+        angles = np.lib.format.open_memmap(
+            path / "angles.npy", "w+", np.float32, (frames, bodies)
+        )
+        return positions, angles
+
+    def store(
+        self,
+        key: str,
+        positions: np.ndarray,
+        angles: np.ndarray,
+        timestep: float,
+        final_state: Dict[str, np.ndarray],
+    ) -> None:
+        """Publishes a trajectory recorded into the arrays of :meth:`create`
+        and evicts old entries if the cache grew too large.
+        """
+        positions.flush()
+        angles.flush()
+        staging = self._staging_path(key)
+        np.savez(staging / "final.npz", timestep=timestep, **final_state)
+        path = self.directory / key
+        try:
+            staging.rename(path)
+        except OSError:
+            # Another process stored the same trajectory first.
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=key)
+
+    def discard(self, key: str) -> None:
+        """Deletes the arrays of :meth:`create` if they were not stored."""
+        shutil.rmtree(self._staging_path(key), ignore_errors=True)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Deletes the least recently used trajectories until the cache is no
+        larger than ``max_size``.
+        """
+        entries = []
+        for path in self.directory.iterdir():
+            if path.is_dir() and path.name != keep and "." not in path.name:
+                size = sum(f.stat().st_size for f in path.iterdir())
+                entries.append((path.stat().st_mtime, size, path))
+        total = sum(size for _, size, _ in entries)
+        if keep is not None and (self.directory / keep).is_dir():
+            total += sum(f.stat().st_size for f in (self.directory / keep).iterdir())
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def _staging_path(self, key: str) -> Path:
+        return self.directory / f"{key}.{os.getpid()}"
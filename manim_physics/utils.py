@@ -0,0 +1,111 @@
+"""Helpers for drawing many simulated objects as a single mobject.
+
+Every frame, the points of such a mobject are rewritten from arrays of
+simulated positions in a few array operations, instead of moving one
+mobject per object. Trails of past positions are kept in a
+:class:`~RingBuffer`.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["place_copies", "polyline_points", "RingBuffer"]
+
+
+def _reuse(out: Optional[np.ndarray], shape: tuple) -> np.ndarray:
+    if out is not None and out.size == np.prod(shape):
+        reshaped = out.reshape(shape)
+        if np.shares_memory(reshaped, out):
+            return reshaped
+    return np.zeros(shape)
+
+
+def place_copies(
+    template_points: np.ndarray, positions: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Returns the points of copies of ``template_points``, a shape centered
+    at the origin, moved to each of ``positions``.
+
+    Parameters
+    ----------
+    template_points
+        An array of shape ``(points, 3)``.
+    positions
+        An array of shape ``(copies, 2)`` or ``(copies, 3)``.
+    out
+        The points of a previous call, which are overwritten if possible.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape ``(copies * points, 3)``.
+    """
+    positions = np.asarray(positions)
+    points = _reuse(out, (len(positions), len(template_points), 3))
+    points[:] = template_points
+    points[..., : positions.shape[1]] += positions[:, None]
+    return points.reshape(-1, 3)
+
+
+def polyline_points(
+    vertices: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Returns the points of a ``VMobject`` made of straight cubic curves
+    between consecutive vertices of each chain in ``vertices``. Chains are
+    drawn as separate subpaths.
+
+    Parameters
+    ----------
+    vertices
+        An array of shape ``(chains, vertices, 2)`` or
+        ``(chains, vertices, 3)``.
+    out
+        The points of a previous call, which are overwritten if possible.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape ``(chains * (vertices - 1) * 4, 3)``.
+    """
+    vertices = np.asarray(vertices)
+    starts, ends = vertices[:, :-1, None], vertices[:, 1:, None]
+    alphas = np.linspace(0, 1, 4)[:, None]
+    points = _reuse(out, (*starts.shape[:2], 4, 3))
+    points[..., : vertices.shape[-1]] = starts + (ends - starts) * alphas
+    return points.reshape(-1, 3)
+
+
+class RingBuffer:
+    def __init__(self, length: int, shape: tuple) -> None:
+        """The last ``length`` arrays of ``shape`` that were appended, stored
+        in preallocated memory that is overwritten in a cycle.
+        """
+        self.data = np.zeros((length, *shape))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, values: np.ndarray) -> None:
+        """Stores ``values``, dropping the oldest entry if the buffer is
+        full."""
+        if not len(self.data):
+            return
+        self.data[self.head] = values
+        self.head = (self.head + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        self.head = 0
+        self.count = 0
+
+    def get(self) -> np.ndarray:
+        """Returns the stored entries from oldest to newest, as an array of
+        shape ``(entries, *shape)``.
+        """
+        order = self.head - self.count + np.arange(self.count)
+        return self.data[order % len(self.data)]
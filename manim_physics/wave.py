@@ -8,6 +8,7 @@ from manim import *
 __all__ = [
     "LinearWave",
     "RadialWave",
+    "RadialWaveHeatmap",
     "StandingWave",
 ]
 
@@ -20,6 +21,81 @@ except ModuleNotFoundError:
     from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 
 
+# Upper bound on the temporary (points x sources) arrays built while summing
+# the contributions of many sources.
+_SUPERPOSITION_CHUNK_BYTES = 2**24
+
+
+def _radial_superposition(
+    x: np.ndarray,
+    y: np.ndarray,
+    sources: Iterable[np.ndarray],
+    wavelength: float,
+    period: float,
+    amplitude: float,
+    time: float,
+    out: Optional[np.ndarray] = None,
+    chunk_size: Optional[int] = None,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Evaluates the superposition of radial waves on a whole grid at once.
+
+    ``x`` and ``y`` are broadcast against each other. Sources are summed in
+    chunks of ``chunk_size`` (by default as many as fit in
+    ``_SUPERPOSITION_CHUNK_BYTES``), so peak memory does not grow with the
+    number of sources. If ``out`` is given, the result is accumulated into it
+    instead of a newly allocated array.
+    """
+    dtype = np.dtype(dtype)
+    x = np.asarray(x, dtype=dtype)[..., np.newaxis]
+    y = np.asarray(y, dtype=dtype)[..., np.newaxis]
+    shape = np.broadcast(x, y).shape[:-1]
+    if out is None:
+        out = np.zeros(shape, dtype=dtype)
+    else:
+        out[...] = 0
+    sources = np.asarray(sources, dtype=dtype).reshape(-1, 3)
+    if chunk_size is None:
+        chunk_size = _SUPERPOSITION_CHUNK_BYTES // (
+            max(int(np.prod(shape)), 1) * dtype.itemsize
+        )
+    chunk_size = max(int(chunk_size), 1)
+
+    k = dtype.type(2 * PI / wavelength)
+    phase = dtype.type(2 * PI * time / period)
+    for start in range(0, len(sources), chunk_size):
+        x0, y0, _ = sources[start : start + chunk_size].T
+        waves = np.hypot(x - x0, y - y0)
+        waves *= k
+        waves -= phase
+        np.sin(waves, out=waves)
+        out += waves.sum(axis=-1)
+    out *= amplitude
+    return out
+
+
+def _auto_resolution(
+    x_range: Iterable[float],
+    y_range: Iterable[float],
+    pixels_per_face: float,
+    max_resolution: int,
+) -> tuple[int, int]:
+    """Picks a mesh resolution so that faces span about ``pixels_per_face``
+    pixels in the rendered output, capped at ``max_resolution``.
+    """
+    pixels_per_unit = config.pixel_height / config.frame_height
+    return tuple(
+        int(
+            np.clip(
+                np.ceil((r[1] - r[0]) * pixels_per_unit / pixels_per_face),
+                2,
+                max_resolution,
+            )
+        )
+        for r in (x_range, y_range)
+    )
+
+
 class RadialWave(Surface, metaclass=ConvertToOpenGL):
     def __init__(
         self,
@@ -29,6 +105,11 @@ class RadialWave(Surface, metaclass=ConvertToOpenGL):
         amplitude: float = 0.1,
         x_range: Iterable[float] = [-5, 5],
         y_range: Iterable[float] = [-5, 5],
+        chunk_size: Optional[int] = None,
+        dtype: np.dtype = np.float64,
+        level_of_detail: bool = False,
+        pixels_per_face: float = 40,
+        max_resolution: int = 32,
         **kwargs,
     ) -> None:
         """A 3D Surface with waves moving radially.
@@ -47,6 +128,24 @@ class RadialWave(Surface, metaclass=ConvertToOpenGL):
             The range of the wave in the x direction.
         y_range
             The range of the wave in the y direction.
+        chunk_size
+            The number of sources summed at once. By default, as many as fit
+            in a fixed memory budget, which keeps scenes with hundreds of
+            sources from running out of memory.
+        dtype
+            The floating point type the wave is computed in. ``np.float32``
+            halves the memory and is faster for many sources.
+        level_of_detail
+            Whether to pick the ``resolution`` of the surface from the pixel
+            height of the render, so that low quality previews use a coarse
+            mesh. Overrides ``resolution``.
+        pixels_per_face
+            The approximate on-screen size of a face in pixels, used with
+            ``level_of_detail``.
+        max_resolution
+            The highest resolution ``level_of_detail`` may pick. The default
+            matches the fixed resolution of :class:`~Surface`, so that no
+            render gets a denser mesh than without ``level_of_detail``.
         kwargs
             Additional parameters to be passed to :class:`~Surface`.
 
@@ -74,6 +173,12 @@ class RadialWave(Surface, metaclass=ConvertToOpenGL):
         self.time = 0
         self.kwargs = kwargs
         self.sources = sources
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        if level_of_detail:
+            kwargs["resolution"] = _auto_resolution(
+                x_range, y_range, pixels_per_face, max_resolution
+            )
 
         super().__init__(
             lambda u, v: np.array([u, v, self._wave_z(u, v, sources)]),
@@ -82,26 +187,187 @@ class RadialWave(Surface, metaclass=ConvertToOpenGL):
             **kwargs,
         )
 
-    def _wave_z(self, u: float, v: float, sources: Iterable[np.ndarray]) -> float:
-        z = 0
-        for source in sources:
-            x0, y0, _ = source
-            z += self.amplitude * np.sin(
-                (2 * PI / self.wavelength) * ((u - x0) ** 2 + (v - y0) ** 2) ** 0.5
-                - 2 * PI * self.time / self.period
-            )
-        return z
+        # The faces are built flat in the (u, v) plane and then mapped by
+        # ``apply_function``, which places the anchors above their own (u, v)
+        # and aims every handle along the tangent at its anchor. The tangent
+        # is found by mapping a point moved towards the handle by
+        # ``pre_function_handle_to_anchor_scale_factor``, so the wave is
+        # sampled at those same points on every update.
+        self._uv_mobjects = self.family_members_with_points()
+        self._xy_points = np.concatenate(
+            [mob.points[:, :2] for mob in self._uv_mobjects]
+        )
+        self._uv_splits = np.cumsum([len(mob.points) for mob in self._uv_mobjects])
+        self._handle_factor = getattr(
+            self, "pre_function_handle_to_anchor_scale_factor", None
+        )
+        self._uv_points = self._xy_points.copy()
+        if self._handle_factor is not None:
+            curves = self._uv_points.reshape(-1, 4, 2)
+            starts, ends = curves[:, 0].copy(), curves[:, 3].copy()
+            # The handles of the flat faces lie a third of the way along
+            # every edge.
+            curves[:, 1] = starts + self._handle_factor * (ends - starts) / 3
+            curves[:, 2] = ends + self._handle_factor * (starts - ends) / 3
+
+    def _wave_z(
+        self, u: np.ndarray, v: np.ndarray, sources: Iterable[np.ndarray]
+    ) -> np.ndarray:
+        return _radial_superposition(
+            u,
+            v,
+            sources,
+            self.wavelength,
+            self.period,
+            self.amplitude,
+            self.time,
+            chunk_size=self.chunk_size,
+            dtype=self.dtype,
+        )
 
     def _update_wave(self, mob: Mobject, dt: float) -> None:
         self.time += dt
-        mob.match_points(
-            Surface(
-                lambda u, v: np.array([u, v, self._wave_z(u, v, self.sources)]),
-                u_range=self.u_range,
-                v_range=self.v_range,
-                **self.kwargs,
-            )
+        z = self._wave_z(self._uv_points[:, 0], self._uv_points[:, 1], self.sources)
+        if self._handle_factor is not None:
+            curves = z.reshape(-1, 4)
+            starts, ends = curves[:, 0], curves[:, 3]
+            if getattr(self, "should_make_jagged", False):
+                curves[:, 1] = (2 * starts + ends) / 3
+                curves[:, 2] = (starts + 2 * ends) / 3
+            else:
+                curves[:, 1] = starts + (curves[:, 1] - starts) / self._handle_factor
+                curves[:, 2] = ends + (curves[:, 2] - ends) / self._handle_factor
+        for submob, xy, z_part in zip(
+            self._uv_mobjects,
+            np.split(self._xy_points, self._uv_splits[:-1]),
+            np.split(z, self._uv_splits[:-1]),
+        ):
+            submob.points[:, :2] = xy
+            submob.points[:, 2] = z_part
+
+    def start_wave(self):
+        """Animate the wave propagation."""
+        self.add_updater(self._update_wave)
+
+    def stop_wave(self):
+        """Stop animating the wave propagation."""
+        self.remove_updater(self._update_wave)
+
+
+class RadialWaveHeatmap(ImageMobject):
+    def __init__(
+        self,
+        *sources: Optional[np.ndarray],
+        wavelength: float = 1,
+        period: float = 1,
+        amplitude: float = 0.1,
+        x_range: Iterable[float] = [-5, 5],
+        y_range: Iterable[float] = [-5, 5],
+        pixel_height: int = 256,
+        colors: Iterable[ParsableManimColor] = [BLUE_E, BLACK, RED_E],
+        **kwargs,
+    ) -> None:
+        """A top-down view of the interference of radial waves.
+
+        Instead of building a :class:`~Surface` with one face per grid
+        cell, the superposition is evaluated on a pixel grid and shown as a
+        single image. The image buffer is rewritten in place while the wave
+        is animated.
+
+        Parameters
+        ----------
+        sources
+            The sources of disturbance.
+        wavelength
+            The wavelength of the wave.
+        period
+            The period of the wave.
+        amplitude
+            The amplitude of the wave.
+        x_range
+            The range of the wave in the x direction.
+        y_range
+            The range of the wave in the y direction.
+        pixel_height
+            The number of pixel rows of the image. The number of columns
+            follows from the aspect ratio of the ranges.
+        colors
+            The colormap, from the lowest to the highest displacement.
+        kwargs
+            Additional parameters to be passed to :class:`~ImageMobject`.
+
+        Examples
+        --------
+        .. manim:: RadialWaveHeatmapExampleScene
+
+            from manim_physics import *
+
+            class RadialWaveHeatmapExampleScene(Scene):
+                def construct(self):
+                    wave = RadialWaveHeatmap(
+                        LEFT * 2 + DOWN * 5,
+                        RIGHT * 2 + DOWN * 5,
+                        x_range=[-4, 4],
+                        y_range=[-3, 3],
+                    )
+                    self.add(wave)
+                    wave.start_wave()
+                    self.wait()
+                    wave.stop_wave()
+        """
+        self.wavelength = wavelength
+        self.period = period
+        self.amplitude = amplitude
+        self.time = 0
+        self.sources = sources
+
+        width = x_range[1] - x_range[0]
+        height = y_range[1] - y_range[0]
+        pixel_width = max(1, round(pixel_height * width / height))
+        # Row 0 of an image is its top edge, hence the reversed y values.
+        self._x = np.linspace(x_range[0], x_range[1], pixel_width)[np.newaxis, :]
+        self._y = np.linspace(y_range[1], y_range[0], pixel_height)[:, np.newaxis]
+        self._z = np.zeros((pixel_height, pixel_width))
+        self._indices = np.zeros((pixel_height, pixel_width), dtype=np.intp)
+        self._colormap = np.array(
+            [color_to_int_rgba(c) for c in color_gradient(colors, 256)],
+            dtype=np.uint8,
+        )
+
+        super().__init__(
+            np.zeros((pixel_height, pixel_width, 4), dtype=np.uint8), **kwargs
         )
+        self.stretch_to_fit_width(width)
+        self.stretch_to_fit_height(height)
+        self.move_to([(x_range[0] + x_range[1]) / 2, (y_range[0] + y_range[1]) / 2, 0])
+        self._draw_wave()
+
+    def _draw_wave(self) -> None:
+        _radial_superposition(
+            self._x,
+            self._y,
+            self.sources,
+            self.wavelength,
+            self.period,
+            self.amplitude,
+            self.time,
+            out=self._z,
+        )
+        # Map [-peak, peak] onto the colormap, where peak is the largest
+        # displacement the sources can produce together.
+        peak = abs(self.amplitude) * len(self.sources) or 1
+        z = self._z
+        z += peak
+        z *= (len(self._colormap) - 1) / (2 * peak)
+        np.clip(z, 0, len(self._colormap) - 1, out=z)
+        self._indices[...] = z
+        np.take(self._colormap, self._indices, axis=0, out=self.pixel_array)
+        if self.fill_opacity < 1:
+            self.pixel_array[:, :, 3] = int(255 * self.fill_opacity)
+
+    def _update_wave(self, mob: Mobject, dt: float) -> None:
+        self.time += dt
+        self._draw_wave()
 
     def start_wave(self):
         """Animate the wave propagation."""
@@ -120,6 +386,9 @@ class LinearWave(RadialWave):
         amplitude: float = 0.1,
         x_range: Iterable[float] = [-5, 5],
         y_range: Iterable[float] = [-5, 5],
+        level_of_detail: bool = False,
+        pixels_per_face: float = 40,
+        max_resolution: int = 32,
         **kwargs,
     ) -> None:
         """A 3D Surface with waves in one direction.
@@ -136,6 +405,17 @@ class LinearWave(RadialWave):
             The range of the wave in the x direction.
         y_range
             The range of the wave in the y direction.
+        level_of_detail
+            Whether to pick the ``resolution`` of the surface from the pixel
+            height of the render, so that low quality previews use a coarse
+            mesh. Overrides ``resolution``.
+        pixels_per_face
+            The approximate on-screen size of a face in pixels, used with
+            ``level_of_detail``.
+        max_resolution
+            The highest resolution ``level_of_detail`` may pick. The default
+            matches the fixed resolution of :class:`~Surface`, so that no
+            render gets a denser mesh than without ``level_of_detail``.
         kwargs
             Additional parameters to be passed to :class:`~Surface`.
 
@@ -159,6 +439,9 @@ class LinearWave(RadialWave):
             amplitude=amplitude,
             x_range=x_range,
             y_range=y_range,
+            level_of_detail=level_of_detail,
+            pixels_per_face=pixels_per_face,
+            max_resolution=max_resolution,
             **kwargs,
         )
 
@@ -1,10 +1,19 @@
 __module_test__ = "electromagnetism"
 
 from manim import *
+from manim.camera.moving_camera import MovingCamera
 from manim.utils.testing.frames_comparison import frames_comparison
 
+from manim_physics.electromagnetism.conductors import *
 from manim_physics.electromagnetism.electrostatics import *
+from manim_physics.electromagnetism.electrostatics import _electric_field
 from manim_physics.electromagnetism.magnetostatics import *
+from manim_physics.electromagnetism.magnetostatics import (
+    _magnetic_field,
+    _wire_segments,
+)
+from manim_physics.electromagnetism.motion import *
+from manim_physics.electromagnetism.volume import *
 
 
 @frames_comparison
@@ -31,3 +40,218 @@ def test_magnetic_field_multiple_wires(scene):
     mag_field = MagneticField(wire1, wire2)
     scene.set_camera_orientation(PI / 3, PI / 4)
     scene.add(wire1, wire2, mag_field)
+
+
+def test_batched_fields():
+    charges = [Charge(-1, LEFT + DOWN), Charge(2, RIGHT + DOWN), Charge(-1, UP)]
+    wires = [Wire(Circle(2).rotate(PI / 2, UP)), Wire(Circle(1), current=-2)]
+    points = np.random.default_rng(0).uniform(-3, 3, (50, 3))
+    field = ElectricField(*charges)
+    np.testing.assert_allclose(
+        _electric_field(
+            points,
+            np.array([charge.get_center() for charge in charges]),
+            np.array([charge.magnitude for charge in charges]),
+        ),
+        [field.func(p) for p in points],
+    )
+    starts, ends, currents = _wire_segments(wires[:1])
+    field = MagneticField(wires[0])
+    np.testing.assert_allclose(
+        _magnetic_field(points, starts, ends, currents),
+        [field.func(p) for p in points],
+    )
+    assert len(_wire_segments(wires)[0]) == 32
+
+
+def test_magnetic_field_own_currents():
+    wires = [Wire(Circle(2).rotate(PI / 2, UP)), Wire(Circle(1), current=-1)]
+    points = np.array([[0.5, 0.5, 0], [-1, 2, 1], [2, -1, -0.5], [0, 0, 2]])
+    expected = _magnetic_field(points, *_wire_segments(wires))
+    assert np.linalg.norm(expected[0]) > 0.1
+    for field in (
+        MagneticField(*wires),
+        MagneticField(*wires, currents=[1, -1]),
+        MagneticField(*wires, currents=[ValueTracker(1), -1]),
+    ):
+        np.testing.assert_allclose([field.func(p) for p in points], expected)
+
+
+def test_wire_segments():
+    bend = VMobject().set_points_as_corners([LEFT * 3, UP, RIGHT * 0.2, DOWN * 2])
+    for stroke in (Circle(2).shift(OUT), bend):
+        wire = Wire(stroke, samples=23)
+        starts, ends, _ = _wire_segments([wire])
+        np.testing.assert_allclose(
+            np.concatenate([starts, ends[-1:]]),
+            [wire.point_from_proportion(a) for a in np.linspace(0, 1, 24)],
+            atol=1e-12,
+        )
+        np.testing.assert_array_equal(starts[1:], ends[:-1])
+
+
+def test_charged_particles_cyclotron():
+    particles = ChargedParticles(
+        [[0, -1, 0], [0, -2, 0]],
+        [[1, 0, 0], [2, 0, 0]],
+        magnetic_field=OUT,
+        timestep=0.001,
+        trail_length=5,
+    )
+    particles.step(TAU)
+    np.testing.assert_allclose(particles.positions, [[0, -1, 0], [0, -2, 0]], atol=1e-2)
+    np.testing.assert_allclose(np.linalg.norm(particles.velocities, axis=1), [1, 2])
+
+
+def test_tracked_magnitudes():
+    magnitude = ValueTracker(1)
+    charges = [Charge(-1, LEFT + DOWN), Charge(2, RIGHT + DOWN)]
+    field = ElectricField(*charges, magnitudes=[magnitude, 2])
+    points = field.get_arrow_points()
+    assert len(field) == len(points)
+    magnitude.set_value(-3)
+    field.update()
+    positions = np.array([charge.get_center() for charge in charges])
+    np.testing.assert_allclose(
+        [field.func(p) for p in points],
+        _electric_field(points, positions, np.array([-3, 2])),
+    )
+
+    current = ValueTracker(1)
+    wire = Wire(Circle(2))
+    field = MagneticField(wire, currents=[current])
+    current.set_value(-2)
+    field.update()
+    points = field.get_arrow_points()[::10]
+    static = MagneticField(wire)
+    np.testing.assert_allclose(
+        [field.func(p) for p in points], [-2 * static.func(p) for p in points]
+    )
+
+
+def test_tracked_magnitudes_reuse_arrows():
+    magnitude = ValueTracker(1)
+    charges = [Charge(-1, LEFT + DOWN), Charge(2, RIGHT + DOWN)]
+    field = ElectricField(*charges, magnitudes=[magnitude, 2])
+    arrows = list(field)
+    magnitude.set_value(-3)
+    field.update()
+    expected = ElectricField(*charges, magnitudes=[-3, 2])
+    reused = 0
+    for old, arrow, fresh in zip(arrows, field, expected):
+        reused += arrow is old
+        np.testing.assert_allclose(arrow.get_start(), fresh.get_start(), atol=1e-9)
+        np.testing.assert_allclose(arrow.get_end(), fresh.get_end(), atol=1e-9)
+        assert arrow.get_color() == fresh.get_color()
+    # Only arrows without any field at a charge are replaced.
+    assert reused >= len(arrows) - len(charges)
+
+
+def test_potential_grid():
+    plate1 = Conductor(Line(LEFT * 2 + UP, RIGHT * 2 + UP), 1)
+    plate2 = Conductor(Line(LEFT * 2 + DOWN, RIGHT * 2 + DOWN), -1)
+    grid = PotentialGrid([plate1, plate2], x_range=(-5, 5), y_range=(-4, 4))
+    np.testing.assert_allclose(grid.get_potential([[0, 0.5, 0]]), 0.5, atol=0.05)
+    np.testing.assert_allclose(grid.get_field([[0, 0, 0]]), [[0, -1, 0]], atol=0.1)
+    assert len(grid.get_equipotentials([0]).points)
+
+    iterations = grid.iterations
+    plate1.shift(UP * 0.1)
+    assert grid.solve() < iterations
+    np.testing.assert_allclose(grid.get_field([[0, 0, 0]]), [[0, -0.95, 0]], atol=0.1)
+
+    field = ElectricField(Charge(1, UP * 3), conductors=[plate1, plate2])
+    assert len(field) == len(field.get_arrow_points())
+
+
+def test_adaptive_placement():
+    charges = [Charge(-1, LEFT), Charge(1, RIGHT)]
+    field = ElectricField(*charges, placement="adaptive", arrow_budget=100)
+    points = field.get_arrow_points()
+    assert 50 < len(field) == len(points) <= 100
+    positions = np.array([charge.get_center() for charge in charges])
+    np.testing.assert_allclose(
+        [field.func(p) for p in points],
+        _electric_field(points, positions, np.array([-1, 1])),
+    )
+    distances = np.linalg.norm(points[:, None] - positions[None], axis=-1).min(axis=1)
+    near = np.sum(distances < 1) / (2 * PI)
+    far = np.sum(distances > 3) / (14 * 8 - 2 * 9 * PI)
+    assert near > 3 * far
+
+    field = MagneticField(
+        Wire(Circle(1)),
+        placement="adaptive",
+        arrow_budget=200,
+        x_range=[-2, 2],
+        y_range=[-2, 2],
+        z_range=[-2, 2],
+    )
+    assert 100 < len(field) <= 200
+
+
+def test_camera_culling():
+    camera = MovingCamera()
+    field = ElectricField(
+        Charge(1, ORIGIN), camera=camera, x_range=[-30, 30], y_range=[-4, 4]
+    )
+    assert 0 < len(field) < len(field.get_arrow_points()) / 2
+    built = len(field._cell_arrows)
+
+    camera.frame.shift(RIGHT * 20)
+    field.update()
+    roots = np.array([arrow.get_start() for arrow in field])
+    assert np.all(np.abs(roots[:, 0] - 20) < camera.frame_width / 2 + 4)
+    assert len(field._cell_arrows) > built
+
+    camera.frame.shift(LEFT * 20)
+    field.update()
+    np.testing.assert_allclose(
+        [field.func(p) for p in roots[:5]],
+        _electric_field(roots[:5], np.zeros((1, 3)), np.ones(1)),
+    )
+
+
+def test_magnetic_volume():
+    coils = [Wire(Circle(2).shift(OUT * z)) for z in (-1, 0, 1)]
+    ranges = {"x_range": (-3, 3, 0.5), "y_range": (-3, 3, 0.5), "z_range": (-2, 2, 0.5)}
+    volume = MagneticVolume(*coils, processes=1, **ranges)
+    pooled = MagneticVolume(*coils, processes=2, chunk_size=300, **ranges)
+    np.testing.assert_allclose(pooled.field, volume.field)
+
+    grid = np.stack(np.meshgrid(*volume.axes, indexing="ij"), axis=-1)
+    points = grid.reshape(-1, 3)
+    np.testing.assert_allclose(
+        volume.field.reshape(-1, 3),
+        _magnetic_field(points, *_wire_segments(coils)),
+    )
+
+    assert len(volume.get_slice(axis=1, value=0)) == 13 * 9
+    surface = volume.get_isosurface(1)
+    assert len(surface.points)
+    assert np.all(np.abs(surface.points) <= [3, 3, 2])
+
+
+def test_magnetic_field_lines():
+    wire = Wire(Circle(2), samples=64)
+    lines = MagneticFieldLines(wire, x_range=[-4, 4], y_range=[-4, 4], z_range=[-4, 4])
+    assert 0 < len(lines) < 4 * 3 * 8
+    # All lines of a single loop close around it.
+    for line in lines:
+        assert np.allclose(line.points[0], line.points[-1])
+    # Lines through the loop leave a thin slab around it, and stay open.
+    slab = MagneticFieldLines(wire, z_range=[-1, 1])
+    open_lines = [
+        line for line in slab if not np.allclose(line.points[0], line.points[-1])
+    ]
+    assert open_lines
+    for line in open_lines:
+        assert np.abs(line.points[[0, -1], 2]).min() > 1
+
+    points = lines[0].points
+    directions = points[3::4] - points[::4]
+    field = _magnetic_field((points[3::4] + points[::4]) / 2, *_wire_segments([wire]))
+    cosines = np.sum(directions * field, axis=1) / (
+        np.linalg.norm(directions, axis=1) * np.linalg.norm(field, axis=1)
+    )
+    assert cosines.min() > 0.99
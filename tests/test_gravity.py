@@ -0,0 +1,45 @@
+__module_test__ = "gravity"
+
+from manim import *
+
+from manim_physics.gravity import *
+from manim_physics.gravity import _direct_accelerations, _grid_accelerations
+
+
+def test_nbody_orbit():
+    system = NBodySystem(
+        [[1, 0], [-1, 0]],
+        [[0, 0.5], [0, -0.5]],
+        softening=0,
+        timestep=0.001,
+        trail_length=10,
+    )
+    energy = system.get_energy()
+    system.step(4 * PI)
+    np.testing.assert_allclose(system.positions, [[1, 0], [-1, 0]], atol=1e-2)
+    np.testing.assert_allclose(system.get_energy(), energy, rtol=1e-6)
+    for _ in range(20):
+        system.redraw()
+    assert len(system.trails.points) == 2 * 9 * 4
+
+
+def test_nbody_grid_accelerations():
+    rng = np.random.default_rng(0)
+    positions = rng.normal(size=(500, 2))
+    masses = rng.uniform(0.5, 1, 500)
+    direct = _direct_accelerations(positions, masses, 1, 0.1)
+    grid = _grid_accelerations(positions, masses, 1, 0.1, 128)
+    errors = np.linalg.norm(grid - direct, axis=1) / np.linalg.norm(direct, axis=1)
+    assert np.median(errors) < 0.05
+
+
+def test_nbody_grid_close_pairs():
+    rng = np.random.default_rng(0)
+    positions = np.concatenate([rng.normal(size=(500, 2)), [[0.3, 0.3], [0.31, 0.3]]])
+    masses = np.ones(502)
+    direct = _direct_accelerations(positions, masses, 1, 0.01)
+    grid = _grid_accelerations(positions, masses, 1, 0.01, 128)
+    errors = np.linalg.norm(grid - direct, axis=1) / np.linalg.norm(direct, axis=1)
+    # The pair is far closer than a cell, but attracts each other directly.
+    assert np.all(errors[-2:] < 0.01)
+    assert np.median(errors) < 0.05
@@ -4,6 +4,7 @@ from manim import *
 from manim.utils.testing.frames_comparison import frames_comparison
 
 from manim_physics.rigid_mechanics.pendulum import *
+from manim_physics.rigid_mechanics.rigid_mechanics import *
 
 
 @frames_comparison(base_scene=SpaceScene)
@@ -24,3 +25,65 @@ def test_multipendulum(scene):
     p.start_swinging()
     scene.add(TracedPath(p.bobs[-1].get_center, stroke_color=BLUE))
     scene.wait()
+
+
+def test_multipendulum_rods():
+    scene = SpaceScene()
+    ball = Circle(0.2).shift(4 * LEFT)
+    scene.make_rigid_body(ball)
+    p = MultiPendulum(RIGHT, LEFT)
+    scene.add(p)
+    scene.make_rigid_body(*p.bobs)
+    p.start_swinging()
+
+    def assert_rods_follow_bobs():
+        p.rods.update()
+        vertices = [p.pivot_point] + [bob.get_center() for bob in p.bobs]
+        np.testing.assert_allclose(p.rods.points[::4], vertices[:-1], atol=1e-9)
+        np.testing.assert_allclose(p.rods.points[3::4], vertices[1:], atol=1e-9)
+
+    for _ in range(10):
+        _step(scene.space, 1 / 30)
+    assert_rods_follow_bobs()
+    np.testing.assert_array_equal(p._bob_indices, [1, 2])
+
+    # Retiring the ball moves the bobs to other indices of the space.
+    scene.space.retire([0])
+    for _ in range(10):
+        _step(scene.space, 1 / 30)
+    assert_rods_follow_bobs()
+    np.testing.assert_array_equal(p._bob_indices, [0, 1])
+
+    p.end_swinging()
+    assert p._bob_indices is None
+    assert_rods_follow_bobs()
+
+
+def test_pendulum_engine():
+    engine = PendulumEngine([[0.01], [0.02]], lengths=1)
+    engine.step(2)
+    np.testing.assert_allclose(
+        engine.angles[:, 0],
+        np.array([0.01, 0.02]) * np.cos(np.sqrt(9.81) * 2),
+        rtol=1e-3,
+    )
+
+    engine = PendulumEngine(
+        np.random.default_rng(0).uniform(1, 2, (100, 3)),
+        lengths=[1, 0.7, 0.5],
+        masses=[1, 2, 1],
+    )
+    energy = engine.get_energy()
+    engine.step(2)
+    np.testing.assert_allclose(engine.get_energy(), energy, atol=1e-2)
+
+
+def test_pendulum_engine_per_pendulum_lengths():
+    # As in PendulumWaveExample, single-link pendulums of different lengths.
+    lengths = np.array([0.5, 1, 2])
+    engine = PendulumEngine(np.full((3, 1), 0.01), lengths=lengths, velocities=0)
+    np.testing.assert_array_equal(engine.lengths, lengths[:, None])
+    engine.step(2)
+    np.testing.assert_allclose(
+        engine.angles[:, 0], 0.01 * np.cos(np.sqrt(9.81 / lengths) * 2), rtol=1e-3
+    )
@@ -1,9 +1,29 @@
 __module_test__ = "rigid_mechanics"
 
+import os
+
 from manim import *
 from manim.utils.testing.frames_comparison import frames_comparison
 
+import pymunk
+import pytest
+
+from manim_physics.rigid_mechanics import rigid_mechanics
+from manim_physics.rigid_mechanics.particles import *
 from manim_physics.rigid_mechanics.rigid_mechanics import *
+from manim_physics.rigid_mechanics.softbody import *
+from manim_physics.rigid_mechanics.trajectory import *
+
+
+def add_ball(space, position=ORIGIN):
+    """Adds a rigid ball of radius 0.5 at ``position`` to ``space``."""
+    ball = Circle(0.5).move_to(position)
+    ball.body = pymunk.Body(1, 1)
+    ball.body.position = ball.get_x(), ball.get_y()
+    ball.angle = 0
+    space.space.add(ball.body)
+    space.add_rigid_mobject(ball)
+    return ball
 
 
 @frames_comparison(base_scene=SpaceScene)
@@ -31,3 +51,317 @@ def test_rigid_mechanics(scene):
     scene.make_rigid_body(rect, circle)
     scene.make_static_body(walls)
     scene.wait()
+
+
+def test_fixed_timestep():
+    positions = []
+    for frame_dt in (1 / 15, 1 / 60):
+        space = Space(timestep=1 / 120, substeps=2)
+        body = pymunk.Body(1, 1)
+        space.space.add(body)
+        for _ in range(round(1 / frame_dt)):
+            space.step(frame_dt)
+        positions.append(body.position)
+    assert positions[0] == positions[1]
+
+
+def test_batched_sync():
+    space = Space()
+    square = Square().shift(UP)
+    square.body = pymunk.Body(1, 1)
+    square.body.position = square.get_x(), square.get_y()
+    square.angle = 0
+    space.add_rigid_mobject(square)
+    expected = square.copy()
+
+    square.body.position = 2, -1
+    square.body.angle = 0.5
+    space.sync()
+    expected.move_to(2 * RIGHT + DOWN).rotate(0.5)
+    np.testing.assert_allclose(square.points, expected.points, atol=1e-9)
+
+    # Bodies in the pymunk space are read in one batch.
+    ball = add_ball(space)
+    ball.body.position = 1, 1
+    space.sync()
+    np.testing.assert_allclose(ball.get_center(), [1, 1, 0], atol=1e-9)
+    np.testing.assert_allclose(square.points, expected.points, atol=1e-9)
+
+
+def test_sync_without_batch(monkeypatch):
+    space = Space()
+    ball = add_ball(space)
+    ball.body.position = 1, 2
+    ball.body.angle = 0.5
+    batched = space._gather()
+    monkeypatch.setattr(rigid_mechanics, "_BATCH_FIELDS", None)
+    for expected, gathered in zip(batched, space._gather()):
+        np.testing.assert_allclose(gathered, expected)
+    space.sync()
+    np.testing.assert_allclose(ball.get_center(), [1, 2, 0], atol=1e-9)
+
+
+def test_bake_and_replay():
+    space = Space()
+    ball = add_ball(space)
+
+    trajectory = space.bake(1, timestep=0.1)
+    assert len(trajectory) == 11
+    for _ in range(5):
+        _step(space, 0.1)
+    np.testing.assert_allclose(
+        ball.get_center()[:2], trajectory.positions[5, 0], atol=1e-5
+    )
+
+
+def test_trajectory_cache(tmp_path):
+    def bake():
+        space = Space()
+        ball = add_ball(space)
+        space.bake(1, timestep=0.1, cache=TrajectoryCache(tmp_path))
+        return space, ball.body
+
+    first, body1 = bake()
+    second, body2 = bake()
+    assert len(list(tmp_path.iterdir())) == 1
+    np.testing.assert_array_equal(
+        second.trajectory.positions, first.trajectory.positions
+    )
+    assert body2.position == body1.position
+    assert body2.velocity == body1.velocity
+
+
+def test_trajectory_cache_key():
+    keys = set()
+    for options in [{}, {"threads": 2}, {"spatial_hash": True}]:
+        space = Space(**options)
+        keys.add(TrajectoryCache.key(space.space, [], 10, 0.1, 1))
+        if space.spatial_hash:
+            hashes = [(None, None), (0.5, None), (None, 100)]
+            for spatial_hash in hashes:
+                keys.add(TrajectoryCache.key(space.space, [], 10, 0.1, 1, spatial_hash))
+    assert len(keys) == 5
+
+
+def test_trajectory_cache_cleanup(tmp_path):
+    space = Space()
+
+    def fail(dt):
+        raise RuntimeError
+
+    space._advance = fail
+    with pytest.raises(RuntimeError):
+        space.bake(1, timestep=0.1, cache=TrajectoryCache(tmp_path))
+    assert not list(tmp_path.iterdir())
+
+    cache = TrajectoryCache(tmp_path)
+    for i, key in enumerate("abc"):
+        positions, angles = cache.create(key, 100, 1)
+        cache.store(key, positions, angles, 0.1, {})
+        os.utime(tmp_path / key, (i, i))
+        if key == "a":
+            size = sum(f.stat().st_size for f in (tmp_path / key).iterdir())
+            cache.max_size = 2.5 * size
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b", "c"]
+
+
+def test_capture_and_restore_state():
+    space = Space(checkpoint_interval=0.5)
+    ball = add_ball(space)
+
+    for _ in range(30):
+        _step(space, 1 / 30)
+    state = space.capture_state()
+    for _ in range(30):
+        _step(space, 1 / 30)
+    position = ball.body.position
+
+    space.restore_state(state)
+    assert space.time == state.time
+    for _ in range(30):
+        _step(space, 1 / 30)
+    assert ball.body.position == position
+
+    space.seek(1.5)
+    assert abs(space.time - 1.5) < 1e-9
+    assert [round(c.time, 6) for c in space.checkpoints] == [0, 0.5, 1, 1.5]
+
+
+def test_pipelined_step():
+    def simulate(pipeline_depth, checkpoint_interval=None):
+        space = Space(
+            pipeline_depth=pipeline_depth, checkpoint_interval=checkpoint_interval
+        )
+        ball = add_ball(space)
+        space.pipeline_frames = 20
+        for frame in range(30):
+            if frame == 10:
+                # The worker has gone ahead and is rewound to this frame.
+                space.stop_producer()
+            _step(space, 1 / config.frame_rate)
+        space.stop_producer()
+        return ball
+
+    live = simulate(None)
+    for checkpoint_interval in (None, 0.05):
+        pipelined = simulate(4, checkpoint_interval)
+        assert pipelined.body.position == live.body.position
+        assert pipelined.body.velocity == live.body.velocity
+        np.testing.assert_allclose(pipelined.points, live.points)
+
+
+def test_solver_options():
+    space = Space(iterations=5, collision_slop=0.01, spatial_hash=True)
+    assert space.space.iterations == 5
+    assert space.space.collision_slop == 0.01
+    hashes = []
+    space.space.use_spatial_hash = lambda dim, count: hashes.append((dim, count))
+    for i in range(10):
+        body = pymunk.Body(1, 1)
+        body.position = i, 0
+        space.space.add(body, pymunk.Circle(body, 0.25))
+    space.space.add(pymunk.Segment(space.space.static_body, (-5, 0), (5, 0), 0.1))
+    _step(space, 1 / 30)
+    assert space._hashed_shapes == 11
+    # The cells fit the balls, not the much longer static ground.
+    assert hashes == [(0.5, 1000)]
+
+    space = Space(spatial_hash_count=50)
+    space.space.use_spatial_hash = lambda dim, count: hashes.append((dim, count))
+    space.space.add(pymunk.Circle(space.space.static_body, 1))
+    _step(space, 1 / 30)
+    assert hashes[-1] == (2, 50)
+
+    assert Space().space.threads == 1
+    if os.name != "nt":
+        # pymunk has no threaded solver on Windows.
+        assert Space(threads=2).space.threads == 2
+
+
+def test_particle_system():
+    space = Space()
+    particles = ParticleSystem([(0, 0), (1, 0), (2, 0)], radius=0.25)
+    space.space.add(*particles.bodies, *particles.shapes)
+    space.add_particle_system(particles)
+    state = space.capture_state()
+    for _ in range(10):
+        _step(space, 1 / 30)
+
+    points = particles.points.reshape(3, -1, 3) - particles.template_points
+    np.testing.assert_allclose(points[:, :, :2].mean(1), particles.get_positions())
+    space.restore_state(state)
+    points = particles.points.reshape(3, -1, 3) - particles.template_points
+    np.testing.assert_allclose(points[:, 0, :2], [(0, 0), (1, 0), (2, 0)], atol=1e-9)
+
+
+def test_get_angle_reference():
+    class Kite(Polygon):
+        def __init__(self, size, **kwargs):
+            super().__init__(UP * size, LEFT, DOWN * size, RIGHT, **kwargs)
+
+    square = Square().rotate(PI / 6)
+    get_angle(square)
+    assert np.isclose(square.angle, PI / 6)
+    rectangle = Rectangle(width=3, height=1).rotate(-PI / 3)
+    get_angle(rectangle)
+    assert np.isclose(rectangle.angle, -PI / 3)
+    kite = Kite(2)
+    get_angle(kite)
+    assert kite.angle == 0
+
+
+def test_make_rigid_polygon():
+    scene = SpaceScene()
+    triangle = Polygon(ORIGIN, 2 * RIGHT, UP).rotate(0.3)
+    box = Square().rotate(-PI / 6).shift(3 * RIGHT)
+    scene.make_rigid_body(triangle, box)
+    assert triangle.angle == 0
+    assert np.isclose(box.body.angle, -PI / 6)
+    assert np.isclose(triangle.shape.area, 1)
+
+    y = triangle.get_y()
+    for _ in range(10):
+        _step(scene.space, 1 / 30)
+    assert triangle.get_y() < y - 0.1
+    np.testing.assert_allclose(box.get_center()[:2], box.body.position, atol=1e-9)
+
+
+def test_concave_shape():
+    def make_shape(shift):
+        mob = Polygon(
+            ORIGIN, 2 * RIGHT, 2 * RIGHT + UP, RIGHT + UP, RIGHT + 2 * UP, 2 * UP
+        ).shift(shift)
+        mob.body = pymunk.Body()
+        mob.body.position = mob.get_x(), mob.get_y()
+        get_shape(mob)
+        return mob.shapes
+
+    shapes = make_shape(ORIGIN)
+    assert len(shapes) > 1
+    assert np.isclose(sum(shape.area for shape in shapes), 3)
+    copies = make_shape(3 * LEFT)
+    assert [s.get_vertices() for s in copies] == [s.get_vertices() for s in shapes]
+
+
+def test_open_and_image_shapes():
+    arc = Arc(radius=1, angle=PI)
+    arc.body = pymunk.Body()
+    arc.body.position = arc.get_x(), arc.get_y()
+    get_shape(arc)
+    # Arcs are not filled in, but collide along their stroke.
+    assert len(arc.shapes) > 1
+    assert all(isinstance(shape, pymunk.Segment) for shape in arc.shapes)
+
+    image = ImageMobject(np.zeros((4, 8, 3), dtype=np.uint8))
+    image.body = pymunk.Body()
+    get_shape(image)
+    assert image.shapes == [image.shape]
+    assert len(image.shape.get_vertices()) == 4
+
+
+def test_make_rigid_concave_polygon():
+    scene = SpaceScene()
+    ell = Polygon(ORIGIN, 2 * RIGHT, 2 * RIGHT + UP, RIGHT + UP, RIGHT + 2 * UP, 2 * UP)
+    ground = Line(3 * LEFT + 2 * DOWN, 3 * RIGHT + 2 * DOWN)
+    scene.make_rigid_body(ell)
+    scene.make_static_body(ground)
+    assert len(ell.shapes) > 1
+    assert all(shape in scene.space.space.shapes for shape in ell.shapes)
+
+    heights = []
+    for _ in range(60):
+        _step(scene.space, 1 / 30)
+        heights.append(ell.body.position.y)
+    # It fell onto the ground and bounced instead of falling through it.
+    assert -1.5 < min(heights) < -0.5
+
+
+def test_kill_region():
+    space = Space(kill_region=(-5, -1, 5, 5))
+    retired = []
+    space.on_retire = retired.extend
+    balls = []
+    for height in (0, 4):
+        balls.append(add_ball(space, height * UP))
+
+    for _ in range(30):
+        _step(space, 1 / 30)
+    assert retired == balls[:1]
+    assert space.bodies == [balls[1].body]
+    assert space.space.bodies == [balls[1].body]
+
+
+def test_soft_body():
+    space = Space()
+    jelly = SoftBody(rows=3, columns=4, pinned=[(0, 0)])
+    assert len(jelly.constraints) == 3 * 3 + 2 * 4 + 2 * 2 * 3
+    space.space.add(*jelly.bodies, *jelly.shapes, *jelly.constraints)
+    space.add_particle_system(jelly)
+    pinned = tuple(jelly.bodies[0].position)
+    for _ in range(30):
+        _step(space, 1 / 30)
+
+    assert tuple(jelly.bodies[0].position) == pinned
+    positions = jelly.get_positions()
+    np.testing.assert_allclose(jelly.points[0, :2], positions[0])
+    np.testing.assert_allclose(jelly.spring_lines.points[3, :2], positions[1])
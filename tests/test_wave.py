@@ -4,6 +4,7 @@ from manim import *
 from manim.utils.testing.frames_comparison import frames_comparison
 
 from manim_physics.wave import *
+from manim_physics.wave import _auto_resolution, _radial_superposition
 
 
 @frames_comparison()
@@ -38,3 +39,71 @@ def test_standingwave(scene):
         wave.start_wave()
     scene.wait()
 
+
+def test_radialwave_update():
+    for jagged in (False, True):
+        wave = RadialWave(
+            LEFT * 2 + DOWN * 5,
+            RIGHT * 2 + DOWN * 5,
+            resolution=8,
+            should_make_jagged=jagged,
+        )
+        wave._update_wave(wave, 0.3)
+        rebuilt = Surface(
+            lambda u, v: np.array([u, v, wave._wave_z(u, v, wave.sources)]),
+            u_range=wave.u_range,
+            v_range=wave.v_range,
+            resolution=8,
+            should_make_jagged=jagged,
+        )
+        for face, expected in zip(wave, rebuilt):
+            np.testing.assert_allclose(face.points, expected.points, atol=1e-6)
+
+
+def test_radialwave_heatmap():
+    sources = (LEFT * 2 + DOWN * 5, RIGHT * 2 + DOWN * 5)
+    wave = RadialWaveHeatmap(
+        *sources, x_range=[-4, 4], y_range=[-3, 3], pixel_height=30
+    )
+    pixels = wave.pixel_array
+    wave.start_wave()
+    wave.update(0.25)
+    wave.update(0.05)
+    assert wave.pixel_array is pixels
+    assert pixels.shape == (30, 40, 4)
+
+    # Row 0 is the top edge of the image.
+    for row, column in [(0, 0), (29, 39), (12, 7), (20, 33)]:
+        x = -4 + 8 * column / 39
+        y = 3 - 6 * row / 29
+        z = 0.1 * sum(
+            np.sin(2 * PI * np.hypot(x - x0, y - y0) - 2 * PI * 0.3)
+            for x0, y0, _ in sources
+        )
+        index = int((z + 0.2) * 255 / 0.4)
+        assert any(
+            np.array_equal(pixels[row, column], wave._colormap[i])
+            for i in range(max(index - 1, 0), min(index + 2, 256))
+        )
+
+
+def test_radialwave_chunked_superposition():
+    sources = np.random.default_rng(0).uniform(-5, 5, (100, 3))
+    x = np.linspace(-5, 5, 11)[np.newaxis, :]
+    y = np.linspace(-5, 5, 11)[:, np.newaxis]
+    full = _radial_superposition(x, y, sources, 1, 1, 0.1, 0.3, chunk_size=100)
+    chunked = _radial_superposition(x, y, sources, 1, 1, 0.1, 0.3, chunk_size=7)
+    single = _radial_superposition(x, y, sources, 1, 1, 0.1, 0.3, dtype=np.float32)
+    np.testing.assert_allclose(chunked, full)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, full, atol=1e-4)
+
+
+def test_level_of_detail():
+    with tempconfig({"pixel_height": 480, "pixel_width": 854}):
+        low = RadialWave(ORIGIN, level_of_detail=True)
+        assert _auto_resolution([-5, 5], [-2, 2], 40, 32) == (15, 6)
+    with tempconfig({"pixel_height": 1080, "pixel_width": 1920}):
+        high = RadialWave(ORIGIN, level_of_detail=True)
+    assert low.resolution == (15, 15)
+    assert high.resolution == (32, 32)